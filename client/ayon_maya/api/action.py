@@ -2,7 +2,6 @@
 from __future__ import absolute_import
 
 import pyblish.api
-import ayon_api
 
 from ayon_core.pipeline.publish import (
     get_errored_instances_from_context,
@@ -75,26 +74,36 @@ class GenerateUUIDsOnInvalidAction(pyblish.api.Action):
             nodes (list): all nodes to regenerate ids on
         """
 
+        from maya import cmds
         from . import lib
+        from .scene_index import get_scene_node_index
 
         # Expecting this is called on validators in which case 'folderEntity'
         #   should be always available, but kept a way to query it by name.
         folder_entity = instance.data.get("folderEntity")
-        if not folder_entity:
+        if folder_entity:
+            folder_id = folder_entity["id"]
+        else:
             folder_path = instance.data["folderPath"]
             project_name = instance.context.data["projectName"]
             self.log.info((
                 "Folder is not stored on instance."
                 " Querying by path \"{}\" from project \"{}\""
             ).format(folder_path, project_name))
-            folder_entity = ayon_api.get_folder_by_path(
-                project_name, folder_path, fields={"id"}
-            )
-
-        for node, _id in lib.generate_ids(
-            nodes, folder_id=folder_entity["id"]
-        ):
-            lib.set_id(node, _id, overwrite=True)
+            folder_id = lib.get_folder_id(project_name, folder_path)
+            if folder_id is None:
+                self.log.error(
+                    "Folder \"{}\" not found in project \"{}\", unable to "
+                    "generate ids.".format(folder_path, project_name))
+                return
+
+        lib.set_ids(
+            lib.generate_ids(nodes, folder_id=folder_id),
+            overwrite=True
+        )
+        # Ids have changed, so their cached ids must be read again
+        get_scene_node_index(instance.context).invalidate(
+            cmds.ls(nodes, long=True))
 
 
 class SelectInvalidAction(pyblish.api.Action):
@@ -0,0 +1,126 @@
+"""Streaming line filters to post-process extracted ASCII files.
+
+Extracted Maya ASCII scenes, like baked cameras with dense animation
+curves, can be hundreds of megabytes. The file is streamed line by line
+through the filters into a temporary file next to it, which then replaces
+the original file. Memory use does not grow with the file size and the
+original file is left untouched when filtering fails.
+
+A filter is a callable that takes a line and returns the line to write, or
+None to drop the line.
+
+Example:
+    >>> filter_ascii_file(path, [
+    ...     strip_rename_uid,
+    ...     strip_file_info(["license"]),
+    ...     remap_paths({"/local/project": "/mnt/project"})
+    ... ])
+
+"""
+import os
+import shutil
+import tempfile
+import logging
+
+log = logging.getLogger(__name__)
+
+# Round trip bytes which are not valid in the encoding unchanged
+ENCODING = "utf-8"
+ERRORS = "surrogateescape"
+
+
+def strip_rename_uid(line):
+    """Drop the `rename -uid` statements of a Maya ASCII file."""
+    if line.lstrip().startswith("rename -uid "):
+        return None
+    return line
+
+
+def strip_file_info(keys=None):
+    """Return a filter dropping `fileInfo` statements of a Maya ASCII file.
+
+    Args:
+        keys (Optional[Iterable[str]]): Only drop the `fileInfo` entries with
+            these keys. Drops all entries by default.
+
+    Returns:
+        callable: The line filter.
+
+    """
+    prefixes = None
+    if keys is not None:
+        prefixes = tuple('fileInfo "{}" '.format(key) for key in keys)
+
+    def _filter(line):
+        stripped = line.lstrip()
+        if not stripped.startswith("fileInfo "):
+            return line
+        if prefixes is None or stripped.startswith(prefixes):
+            return None
+        return line
+
+    return _filter
+
+
+def remap_paths(mapping):
+    """Return a filter replacing path prefixes in each line.
+
+    Args:
+        mapping (dict[str, str]): Source path to destination path.
+
+    Returns:
+        callable: The line filter.
+
+    """
+    # Replace the longest paths first so nested paths map correctly
+    items = sorted(mapping.items(), key=lambda item: len(item[0]),
+                   reverse=True)
+
+    def _filter(line):
+        for source, destination in items:
+            if source in line:
+                line = line.replace(source, destination)
+        return line
+
+    return _filter
+
+
+def filter_ascii_file(path, filters):
+    """Stream a file through line filters and replace it atomically.
+
+    Args:
+        path (str): The file to filter in place.
+        filters (list[callable]): Line filters, applied in order.
+
+    Returns:
+        int: Amount of dropped lines.
+
+    """
+    folder = os.path.dirname(os.path.abspath(path))
+    handle, temp_path = tempfile.mkstemp(
+        prefix=".{}.".format(os.path.basename(path)), dir=folder)
+    dropped = 0
+    try:
+        # Keep the original line endings with `newline=""`
+        with open(path, "r", encoding=ENCODING, errors=ERRORS,
+                  newline="") as src, \
+                os.fdopen(handle, "w", encoding=ENCODING, errors=ERRORS,
+                          newline="") as dst:
+            for line in src:
+                for line_filter in filters:
+                    line = line_filter(line)
+                    if line is None:
+                        dropped += 1
+                        break
+                else:
+                    dst.write(line)
+        # The temporary file is only readable by the user
+        shutil.copymode(path, temp_path)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+    log.debug("Filtered {}, dropped {} lines.".format(path, dropped))
+    return dropped
@@ -0,0 +1,329 @@
+"""Shared, bulk read attribute values for attribute checking validators.
+
+Validators that compare attributes of many nodes against default values
+would otherwise issue an `attributeQuery` and `getAttr` per node and
+attribute. Instead they request the attributes of all their nodes at once
+from the publish's `AttributeSnapshot`, which reads them through API plugs
+and caches them so validators checking the same plugs share the reads.
+
+Example:
+    >>> snapshot = get_attribute_snapshot(instance.context)
+    >>> states = snapshot.read(shapes, ["castsShadows", "primaryVisibility"])
+    >>> states[shapes[0]]["castsShadows"].value
+    True
+
+"""
+import logging
+from collections import namedtuple
+
+from maya.api import OpenMaya
+
+from . import lib
+from .ayon_modifier import apply_modifier
+
+log = logging.getLogger(__name__)
+
+CONTEXT_KEY = "mayaAttributeSnapshot"
+
+PlugState = namedtuple("PlugState", ["value", "locked", "connected", "proxy"])
+PlugState.__doc__ = """The state of an attribute plug.
+
+Attributes:
+    value: The attribute value like `maya.cmds.getAttr` would return it.
+    locked (bool): Whether the plug is locked.
+    connected (bool): Whether the plug has an incoming connection.
+    proxy (bool): Whether the attribute is a proxy attribute.
+"""
+
+_NUMERIC_BOOL = {OpenMaya.MFnNumericData.kBoolean}
+_NUMERIC_INT = {
+    OpenMaya.MFnNumericData.kByte,
+    OpenMaya.MFnNumericData.kChar,
+    OpenMaya.MFnNumericData.kShort,
+    OpenMaya.MFnNumericData.kInt,
+    OpenMaya.MFnNumericData.kInt64,
+    OpenMaya.MFnNumericData.kAddr,
+}
+_NUMERIC_FLOAT = {
+    OpenMaya.MFnNumericData.kFloat,
+    OpenMaya.MFnNumericData.kDouble,
+}
+_NUMERIC_SCALAR = _NUMERIC_BOOL | _NUMERIC_INT | _NUMERIC_FLOAT
+
+
+def get_attribute_snapshot(context):
+    """Return the attribute snapshot shared by the plug-ins of a publish."""
+    snapshot = context.data.get(CONTEXT_KEY)
+    if snapshot is None:
+        snapshot = AttributeSnapshot()
+        context.data[CONTEXT_KEY] = snapshot
+    return snapshot
+
+
+def _is_scalar_attribute(attr):
+    if attr.hasFn(OpenMaya.MFn.kNumericAttribute):
+        numeric_type = OpenMaya.MFnNumericAttribute(attr).numericType()
+        return numeric_type in _NUMERIC_SCALAR
+    return (
+        attr.hasFn(OpenMaya.MFn.kUnitAttribute)
+        or attr.hasFn(OpenMaya.MFn.kEnumAttribute)
+    )
+
+
+def get_plug_value(plug, plug_name):
+    """Return the value of the plug like `maya.cmds.getAttr` would.
+
+    Simple numeric, unit, enum, string and matrix values are read through
+    the API. Any other attribute falls back to `lib.get_attribute`.
+
+    Args:
+        plug (OpenMaya.MPlug): The plug to read.
+        plug_name (str): The `node.attribute` name for the fallback.
+
+    Returns:
+        object: The value of the plug.
+
+    """
+    attr = plug.attribute()
+    if attr.hasFn(OpenMaya.MFn.kNumericAttribute):
+        numeric_type = OpenMaya.MFnNumericAttribute(attr).numericType()
+        if numeric_type in _NUMERIC_BOOL:
+            return plug.asBool()
+        elif numeric_type in _NUMERIC_INT:
+            return plug.asInt()
+        elif numeric_type in _NUMERIC_FLOAT:
+            return plug.asDouble()
+
+    elif attr.hasFn(OpenMaya.MFn.kUnitAttribute):
+        unit_type = OpenMaya.MFnUnitAttribute(attr).unitType()
+        if unit_type == OpenMaya.MFnUnitAttribute.kAngle:
+            return plug.asMAngle().asUnits(OpenMaya.MAngle.uiUnit())
+        elif unit_type == OpenMaya.MFnUnitAttribute.kDistance:
+            return plug.asMDistance().asUnits(OpenMaya.MDistance.uiUnit())
+        elif unit_type == OpenMaya.MFnUnitAttribute.kTime:
+            return plug.asMTime().asUnits(OpenMaya.MTime.uiUnit())
+
+    elif attr.hasFn(OpenMaya.MFn.kEnumAttribute):
+        return plug.asShort()
+
+    elif attr.hasFn(OpenMaya.MFn.kMatrixAttribute):
+        return list(OpenMaya.MFnMatrixData(plug.asMObject()).matrix())
+
+    elif attr.hasFn(OpenMaya.MFn.kTypedAttribute):
+        data_type = OpenMaya.MFnTypedAttribute(attr).attrType()
+        if data_type == OpenMaya.MFnData.kString:
+            return plug.asString()
+        elif data_type == OpenMaya.MFnData.kMatrix:
+            return list(OpenMaya.MFnMatrixData(plug.asMObject()).matrix())
+
+    return lib.get_attribute(plug_name)
+
+
+def set_plug_value(modifier, plug, value):
+    """Add setting the plug value to the modifier.
+
+    Args:
+        modifier (OpenMaya.MDGModifier): The modifier to add the edit to.
+        plug (OpenMaya.MPlug): The plug to set.
+        value (object): The value like it would be passed to `setAttr`.
+
+    Raises:
+        TypeError: When the attribute type is not supported.
+
+    """
+    attr = plug.attribute()
+    if attr.hasFn(OpenMaya.MFn.kNumericAttribute):
+        numeric_type = OpenMaya.MFnNumericAttribute(attr).numericType()
+        if numeric_type in _NUMERIC_BOOL:
+            return modifier.newPlugValueBool(plug, bool(value))
+        elif numeric_type in _NUMERIC_INT:
+            return modifier.newPlugValueInt(plug, int(value))
+        elif numeric_type in _NUMERIC_FLOAT:
+            return modifier.newPlugValueDouble(plug, float(value))
+
+    elif attr.hasFn(OpenMaya.MFn.kUnitAttribute):
+        unit_type = OpenMaya.MFnUnitAttribute(attr).unitType()
+        if unit_type == OpenMaya.MFnUnitAttribute.kAngle:
+            return modifier.newPlugValueMAngle(
+                plug, OpenMaya.MAngle(value, OpenMaya.MAngle.uiUnit()))
+        elif unit_type == OpenMaya.MFnUnitAttribute.kDistance:
+            return modifier.newPlugValueMDistance(
+                plug, OpenMaya.MDistance(value, OpenMaya.MDistance.uiUnit()))
+        elif unit_type == OpenMaya.MFnUnitAttribute.kTime:
+            return modifier.newPlugValueMTime(
+                plug, OpenMaya.MTime(value, OpenMaya.MTime.uiUnit()))
+
+    elif attr.hasFn(OpenMaya.MFn.kEnumAttribute):
+        return modifier.newPlugValueShort(plug, int(value))
+
+    elif attr.hasFn(OpenMaya.MFn.kTypedAttribute):
+        data_type = OpenMaya.MFnTypedAttribute(attr).attrType()
+        if data_type == OpenMaya.MFnData.kString:
+            return modifier.newPlugValueString(plug, value)
+
+    raise TypeError(
+        "Unsupported attribute type for: {}".format(plug.name()))
+
+
+class AttributeSnapshot(object):
+    """Bulk read and cache attribute plug states of nodes.
+
+    Plug states are cached per node and attribute, so validators checking
+    the same plugs share the reads. Edits through `set_values` are applied
+    with a single undoable modifier and update the cache.
+
+    """
+
+    def __init__(self):
+        # (node, attribute) -> PlugState or None when it does not exist
+        self._states = {}
+        # node -> list of keyable scalar attribute names
+        self._keyable = {}
+
+    def invalidate(self, nodes=None):
+        """Clear the cached states of the nodes, or all when not provided.
+
+        Args:
+            nodes (Optional[Iterable[str]]): The nodes to clear.
+
+        """
+        if nodes is None:
+            self._states.clear()
+            self._keyable.clear()
+            return
+
+        nodes = set(nodes)
+        for key in [key for key in self._states if key[0] in nodes]:
+            self._states.pop(key)
+        for node in nodes:
+            self._keyable.pop(node, None)
+
+    def read(self, nodes, attributes):
+        """Return the plug states of the attributes of all nodes.
+
+        Args:
+            nodes (Iterable[str]): The nodes to read.
+            attributes (Iterable[str]): The attribute names to read.
+
+        Returns:
+            dict[str, dict[str, PlugState]]: The plug state per attribute
+                per node. Attributes that do not exist on a node are
+                not included.
+
+        """
+        attributes = list(attributes)
+        sel = OpenMaya.MSelectionList()
+        fn = OpenMaya.MFnDependencyNode()
+
+        result = {}
+        for node in nodes:
+            missing = [
+                attr for attr in attributes
+                if (node, attr) not in self._states
+            ]
+            if missing:
+                sel.clear()
+                sel.add(node)
+                fn.setObject(sel.getDependNode(0))
+                for attr in missing:
+                    self._states[(node, attr)] = self._read_plug(
+                        fn, node, attr)
+
+            node_states = {}
+            for attr in attributes:
+                state = self._states[(node, attr)]
+                if state is not None:
+                    node_states[attr] = state
+            result[node] = node_states
+
+        return result
+
+    def read_keyable(self, nodes):
+        """Return the plug states of all keyable scalar attributes.
+
+        This matches the attributes listed by `cmds.listAttr` with the
+        `keyable` and `scalar` flags.
+
+        Args:
+            nodes (Iterable[str]): The nodes to read.
+
+        Returns:
+            dict[str, dict[str, PlugState]]: The plug state per attribute
+                per node.
+
+        """
+        nodes = list(nodes)
+        sel = OpenMaya.MSelectionList()
+        fn = OpenMaya.MFnDependencyNode()
+        for node in nodes:
+            if node in self._keyable:
+                continue
+
+            sel.clear()
+            sel.add(node)
+            fn.setObject(sel.getDependNode(0))
+            attributes = []
+            for index in range(fn.attributeCount()):
+                attr = fn.attribute(index)
+                fn_attr = OpenMaya.MFnAttribute(attr)
+                if not fn_attr.keyable or fn_attr.array:
+                    continue
+                parent = fn_attr.parent
+                if (
+                    not parent.isNull()
+                    and OpenMaya.MFnAttribute(parent).array
+                ):
+                    continue
+                if not _is_scalar_attribute(attr):
+                    continue
+                attributes.append(fn_attr.name)
+            self._keyable[node] = attributes
+
+        return {
+            node: self.read([node], self._keyable[node])[node]
+            for node in nodes
+        }
+
+    def set_values(self, values, undoable=True):
+        """Set attribute values using a single modifier.
+
+        Args:
+            values (dict[tuple[str, str], object]): The value to set per
+                (node, attribute).
+            undoable (bool): Whether the edit is recorded in the undo queue.
+
+        """
+        if not values:
+            return
+
+        sel = OpenMaya.MSelectionList()
+        fn = OpenMaya.MFnDependencyNode()
+        modifier = OpenMaya.MDGModifier()
+        for (node, attr), value in values.items():
+            sel.clear()
+            sel.add(node)
+            fn.setObject(sel.getDependNode(0))
+            set_plug_value(modifier, fn.findPlug(attr, False), value)
+
+        apply_modifier(modifier, undoable=undoable)
+        self.invalidate({node for node, _attr in values})
+
+    @staticmethod
+    def _read_plug(fn, node, attr):
+        if not fn.hasAttribute(attr):
+            return None
+
+        plug = fn.findPlug(attr, False)
+        plug_name = "{}.{}".format(node, attr)
+        try:
+            value = get_plug_value(plug, plug_name)
+        except (RuntimeError, ValueError) as exc:
+            log.debug("Unable to read {}: {}".format(plug_name, exc))
+            value = None
+
+        return PlugState(
+            value=value,
+            locked=plug.isLocked,
+            connected=plug.isDestination,
+            proxy=OpenMaya.MFnAttribute(plug.attribute()).isProxyAttribute
+        )
@@ -0,0 +1,104 @@
+"""Undoable execution of Maya API modifiers.
+
+Changes made with `OpenMaya.MDGModifier` or `OpenMaya.MDagModifier` from
+Python are not recorded in Maya's undo queue. This module is also a Maya
+plug-in which registers the `ayonApplyModifier` command. `apply_modifier`
+hands the modifier to that command so that it is executed as a single,
+undoable operation.
+
+Example:
+    >>> modifier = OpenMaya.MDGModifier()
+    >>> modifier.newPlugValueBool(plug, True)
+    >>> apply_modifier(modifier)
+
+"""
+import os
+
+from maya import cmds
+from maya.api import OpenMaya
+
+PLUGIN_NAME = "ayon_modifier"
+COMMAND_NAME = "ayonApplyModifier"
+
+# Modifiers waiting to be executed by the command. This is looked up on the
+# `ayon_maya.api.ayon_modifier` module because Maya loads the plug-in file
+# as a separate module.
+_pending = []
+
+
+def maya_useNewAPI():
+    """Inform Maya this plug-in uses Maya Python API 2.0."""
+    pass
+
+
+class ApplyModifierCommand(OpenMaya.MPxCommand):
+    """Execute the pending modifier and allow undoing it."""
+
+    def __init__(self):
+        super(ApplyModifierCommand, self).__init__()
+        self._modifier = None
+
+    @staticmethod
+    def creator():
+        return ApplyModifierCommand()
+
+    def doIt(self, args):
+        from ayon_maya.api import ayon_modifier
+
+        if not ayon_modifier._pending:
+            raise RuntimeError(
+                "No pending modifier. Use `apply_modifier` to run "
+                "{}.".format(COMMAND_NAME))
+        self._modifier = ayon_modifier._pending.pop()
+        self.redoIt()
+
+    def redoIt(self):
+        self._modifier.doIt()
+
+    def undoIt(self):
+        self._modifier.undoIt()
+
+    def isUndoable(self):
+        return True
+
+
+def initializePlugin(plugin):
+    fn_plugin = OpenMaya.MFnPlugin(plugin, "AYON", "1.0")
+    fn_plugin.registerCommand(COMMAND_NAME, ApplyModifierCommand.creator)
+
+
+def uninitializePlugin(plugin):
+    fn_plugin = OpenMaya.MFnPlugin(plugin)
+    fn_plugin.deregisterCommand(COMMAND_NAME)
+
+
+def _ensure_plugin_loaded():
+    if cmds.pluginInfo(PLUGIN_NAME, query=True, loaded=True):
+        return
+    path = os.path.splitext(os.path.abspath(__file__))[0] + ".py"
+    cmds.loadPlugin(path, quiet=True)
+
+
+def apply_modifier(modifier, undoable=True):
+    """Execute an API modifier, recording it in the undo queue.
+
+    When the undo queue is disabled, or `undoable` is False, the modifier
+    is executed directly.
+
+    Args:
+        modifier (OpenMaya.MDGModifier): The modifier to execute.
+        undoable (bool): Whether the modifier should be undoable.
+
+    """
+    if not undoable or not cmds.undoInfo(query=True, state=True):
+        modifier.doIt()
+        return
+
+    _ensure_plugin_loaded()
+    _pending.append(modifier)
+    try:
+        getattr(cmds, COMMAND_NAME)()
+    finally:
+        # Ensure the modifier is never left behind on errors
+        if modifier in _pending:
+            _pending.remove(modifier)
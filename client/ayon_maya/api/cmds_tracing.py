@@ -0,0 +1,323 @@
+"""Opt-in tracing of `maya.cmds` calls made during publishing.
+
+Tracing is enabled by setting the `AYON_MAYA_TRACE_CMDS` environment variable
+to `1`. When enabled, every command in `maya.cmds` is wrapped to record the
+call count and time spent per command, per calling function and per publish
+plug-in that triggered the call. The results are written as folded stacks
+which can be rendered directly with `flamegraph.pl` or speedscope.
+
+When tracing is not enabled nothing is wrapped so there is no overhead.
+
+The tracer is stopped when the publish finished, or at the first extractor
+or integrator that failed, through the pyblish callbacks from
+`register_callbacks`.
+
+Example:
+    >>> tracer = CmdsTracer()
+    >>> with tracer:
+    ...     cmds.ls(type="mesh")
+    >>> tracer.write("/tmp/publish.folded")
+
+"""
+import os
+import sys
+import time
+import heapq
+import logging
+import tempfile
+import functools
+import itertools
+from collections import defaultdict
+
+log = logging.getLogger(__name__)
+
+TRACE_ENV = "AYON_MAYA_TRACE_CMDS"
+TRACE_DIR_ENV = "AYON_MAYA_TRACE_CMDS_DIR"
+
+# Methods of pyblish plug-ins from which `maya.cmds` calls are attributed
+# to the plug-in that is being processed.
+PLUGIN_METHODS = {"process", "repair", "get_invalid"}
+NO_PLUGIN = "<no plugin>"
+
+_active_tracer = None
+
+
+def is_tracing_enabled():
+    """Return whether `maya.cmds` tracing is enabled by environment."""
+    return os.getenv(TRACE_ENV, "").lower() in {"1", "true", "yes"}
+
+
+def _get_plugin_base():
+    try:
+        import pyblish.api
+    except ImportError:
+        return None
+    return pyblish.api.Plugin
+
+
+class CmdsTracer(object):
+    """Wrap the commands of a `maya.cmds`-like module to trace their calls.
+
+    Args:
+        cmds_module (module, optional): The module whose commands to trace.
+            Defaults to `maya.cmds`.
+        slowest_count (int): The amount of slowest calls to keep track of.
+
+    """
+
+    def __init__(self, cmds_module=None, slowest_count=50):
+        if cmds_module is None:
+            from maya import cmds as cmds_module
+
+        self._cmds = cmds_module
+        self._slowest_count = slowest_count
+        self._plugin_base = _get_plugin_base()
+        self._originals = {}
+        self._depth = 0
+        self._counter = itertools.count()
+
+        # (plugin, caller, command) -> [count, total time]
+        self._stats = defaultdict(lambda: [0, 0.0])
+        # Min heap of (duration, index, command, plugin, call site)
+        self._slowest = []
+
+    @property
+    def installed(self):
+        return bool(self._originals)
+
+    def install(self):
+        """Wrap all public commands of the traced module."""
+        if self._originals:
+            return
+
+        for name in dir(self._cmds):
+            if name.startswith("_"):
+                continue
+            func = getattr(self._cmds, name)
+            if not callable(func) or isinstance(func, type):
+                continue
+            self._originals[name] = func
+            setattr(self._cmds, name, self._wrap(name, func))
+
+    def uninstall(self):
+        """Restore the original commands of the traced module."""
+        for name, func in self._originals.items():
+            setattr(self._cmds, name, func)
+        self._originals.clear()
+
+    def __enter__(self):
+        self.install()
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.uninstall()
+
+    def _wrap(self, name, func):
+        tracer = self
+
+        @functools.wraps(func)
+        def traced(*args, **kwargs):
+            # Only time the outermost command when commands implemented
+            # in Python call other commands themselves.
+            if tracer._depth:
+                return func(*args, **kwargs)
+
+            tracer._depth += 1
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                duration = time.perf_counter() - start
+                tracer._depth -= 1
+                tracer._record(name, duration, sys._getframe(1))
+
+        return traced
+
+    def _record(self, command, duration, frame):
+        code = frame.f_code
+        caller = "{} ({}:{})".format(
+            code.co_name, os.path.basename(code.co_filename), frame.f_lineno
+        )
+        plugin_name = self._find_plugin(frame)
+
+        stats = self._stats[(plugin_name, caller, command)]
+        stats[0] += 1
+        stats[1] += duration
+
+        entry = (duration, next(self._counter), command, plugin_name, caller)
+        if len(self._slowest) < self._slowest_count:
+            heapq.heappush(self._slowest, entry)
+        elif duration > self._slowest[0][0]:
+            heapq.heapreplace(self._slowest, entry)
+
+    def _find_plugin(self, frame):
+        """Return name of the pyblish plug-in the call originates from."""
+        if self._plugin_base is None:
+            return NO_PLUGIN
+
+        while frame is not None:
+            if frame.f_code.co_name in PLUGIN_METHODS:
+                f_locals = frame.f_locals
+                owner = f_locals.get("self", f_locals.get("cls"))
+                owner_cls = owner if isinstance(owner, type) else type(owner)
+                if issubclass(owner_cls, self._plugin_base):
+                    return owner_cls.__name__
+            frame = frame.f_back
+        return NO_PLUGIN
+
+    def get_command_totals(self):
+        """Return call count and total time per command.
+
+        Returns:
+            list[tuple[str, int, float]]: Command name, call count and total
+                time in seconds sorted from most to least time spent.
+
+        """
+        totals = defaultdict(lambda: [0, 0.0])
+        for (_plugin, _caller, command), (count, total) in self._stats.items():
+            totals[command][0] += count
+            totals[command][1] += total
+        return sorted(
+            ((command, count, total)
+             for command, (count, total) in totals.items()),
+            key=lambda item: item[2],
+            reverse=True
+        )
+
+    def get_slowest_calls(self):
+        """Return the slowest recorded calls.
+
+        Returns:
+            list[tuple[float, str, str, str]]: Duration in seconds, command,
+                plug-in name and call site sorted from slowest to fastest.
+
+        """
+        return [
+            (duration, command, plugin_name, caller)
+            for duration, _index, command, plugin_name, caller
+            in sorted(self._slowest, reverse=True)
+        ]
+
+    def iter_folded_stacks(self):
+        """Yield folded stack lines, weighted by time in microseconds."""
+        for (plugin_name, caller, command), (_count, total) in sorted(
+            self._stats.items()
+        ):
+            frames = [plugin_name, caller, "cmds." + command]
+            yield "{} {}".format(
+                ";".join(frame.replace(";", ",") for frame in frames),
+                int(round(total * 1e6))
+            )
+
+    def write(self, path):
+        """Write the recorded calls as folded stacks to `path`."""
+        with open(path, "w") as f:
+            for line in self.iter_folded_stacks():
+                f.write(line + "\n")
+
+    def log_summary(self, logger=None, limit=20):
+        """Log the most expensive commands and the slowest calls."""
+        logger = logger or log
+        lines = ["maya.cmds calls by total time:"]
+        for command, count, total in self.get_command_totals()[:limit]:
+            lines.append(
+                "  {:<32} {:>8} calls {:>10.3f}s".format(command, count, total)
+            )
+        lines.append("Slowest maya.cmds calls:")
+        for duration, command, plugin_name, caller in (
+            self.get_slowest_calls()[:limit]
+        ):
+            lines.append("  {:>10.3f}s {:<24} {} <- {}".format(
+                duration, command, caller, plugin_name))
+        logger.info("\n".join(lines))
+
+
+def start_tracing(cmds_module=None):
+    """Start tracing `maya.cmds` calls, replacing any active tracer.
+
+    A tracer left active by a previous publish that did not finish, e.g.
+    because validation failed, is stopped and written out first.
+
+    Returns:
+        CmdsTracer: The active tracer.
+
+    """
+    global _active_tracer
+    if _active_tracer is not None:
+        stop_tracing()
+
+    _active_tracer = CmdsTracer(cmds_module)
+    _active_tracer.install()
+    return _active_tracer
+
+
+def stop_tracing(output_dir=None):
+    """Stop the active tracer and write its folded stacks file.
+
+    Args:
+        output_dir (str, optional): Directory to write to. Defaults to the
+            `AYON_MAYA_TRACE_CMDS_DIR` environment variable or the temp
+            directory.
+
+    Returns:
+        Union[str, None]: Path of the written file, if a tracer was active.
+
+    """
+    global _active_tracer
+    tracer = _active_tracer
+    if tracer is None:
+        return None
+    _active_tracer = None
+    tracer.uninstall()
+
+    output_dir = (
+        output_dir
+        or os.getenv(TRACE_DIR_ENV)
+        or tempfile.gettempdir()
+    )
+    if not os.path.isdir(output_dir):
+        os.makedirs(output_dir)
+    path = os.path.join(
+        output_dir,
+        "maya_cmds_trace_{}.folded".format(time.strftime("%Y%m%d_%H%M%S"))
+    )
+    tracer.write(path)
+    tracer.log_summary()
+    log.info("Written maya.cmds trace to: %s", path)
+    return path
+
+
+def _on_published(context=None, **kwargs):
+    path = stop_tracing()
+    if path and context is not None:
+        context.data["mayaCmdsTracePath"] = path
+
+
+def _on_plugin_processed(result=None, **kwargs):
+    # A failed extractor or integrator ends the publish, so the tracer must
+    # not stay installed until the next publish. Failed collectors and
+    # validators do not, the remaining plug-ins of their order still run.
+    if not result or result.get("error") is None:
+        return
+
+    import pyblish.api
+
+    order = getattr(result.get("plugin"), "order", None)
+    if order is not None and order >= pyblish.api.ExtractorOrder - 0.5:
+        stop_tracing()
+
+
+def register_callbacks():
+    """Stop tracing when a publish ends or an extractor failed."""
+    import pyblish.api
+
+    pyblish.api.register_callback("published", _on_published)
+    pyblish.api.register_callback("pluginProcessed", _on_plugin_processed)
+
+
+def deregister_callbacks():
+    """Deregister the callbacks of `register_callbacks`."""
+    import pyblish.api
+
+    pyblish.api.deregister_callback("published", _on_published)
+    pyblish.api.deregister_callback("pluginProcessed", _on_plugin_processed)
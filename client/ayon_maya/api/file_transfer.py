@@ -0,0 +1,303 @@
+"""Copy many files in parallel, skipping files that are already identical.
+
+Used to transfer the external XGen data when switching the workfile
+context. Such folders can hold gigabytes of ptex and cache files on network
+storage, so files already present with the same size and modification time
+are skipped, the others are copied in parallel. Where the file system
+supports it, files are cloned with a copy-on-write reflink instead.
+
+Example:
+    >>> plan = plan_transfers([(source, destination)])
+    >>> log.info(plan.summary())
+    >>> execute_transfers(plan, max_workers=8)
+
+"""
+import os
+import sys
+import shutil
+import hashlib
+import logging
+import contextlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+log = logging.getLogger(__name__)
+
+# Linux ioctl request to clone a file (reflink) on supporting file systems
+FICLONE = 0x40049409
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def iter_files(root):
+    """Yield path and stat result of all files under root, recursively.
+
+    This uses `os.scandir` which avoids a separate stat call per file on
+    most platforms, unlike `os.walk` followed by `os.stat`.
+
+    Args:
+        root (str): The folder to search.
+
+    Yields:
+        tuple[str, os.stat_result]: File path and its stat result.
+
+    """
+    stack = [root]
+    while stack:
+        folder = stack.pop()
+        try:
+            entries = list(os.scandir(folder))
+        except OSError as exc:
+            log.warning("Unable to list {}: {}".format(folder, exc))
+            continue
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=True):
+                stack.append(entry.path)
+            elif entry.is_file(follow_symlinks=True):
+                yield entry.path, entry.stat()
+
+
+def get_file_hash(path):
+    """Return the sha1 hex digest of a file's contents."""
+    file_hash = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
+
+
+def is_identical(source, destination, source_stat=None, compare_hash=False):
+    """Return whether destination already has the contents of source.
+
+    Files are identical when size and modification time match. With
+    `compare_hash` the contents are also compared by hash.
+
+    """
+    try:
+        destination_stat = os.stat(destination)
+    except OSError:
+        return False
+
+    if source_stat is None:
+        source_stat = os.stat(source)
+
+    if source_stat.st_size != destination_stat.st_size:
+        return False
+    # Allow for file systems storing modification times with less precision
+    if abs(source_stat.st_mtime - destination_stat.st_mtime) >= 1.0:
+        return False
+    if compare_hash:
+        return get_file_hash(source) == get_file_hash(destination)
+    return True
+
+
+def _reflink(source, destination):
+    """Clone the source file to destination with a copy-on-write reflink.
+
+    Raises:
+        OSError: When reflinks are not supported.
+
+    """
+    if not sys.platform.startswith("linux"):
+        raise OSError("Reflinks are only supported on Linux.")
+
+    import fcntl
+
+    with open(source, "rb") as src, open(destination, "wb") as dst:
+        try:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+        except OSError:
+            dst.close()
+            os.remove(destination)
+            raise
+
+
+def copy_file(source, destination, allow_reflink=True, allow_hardlink=False):
+    """Copy a file, preserving its modification time.
+
+    Args:
+        source (str): The file to copy.
+        destination (str): The path to copy to.
+        allow_reflink (bool): Clone with a copy-on-write reflink if the file
+            system supports it.
+        allow_hardlink (bool): Hardlink when possible. Edits to either file
+            will then change both, so only use it for files that are not
+            edited afterwards.
+
+    Returns:
+        str: The method used, "reflink", "hardlink" or "copy".
+
+    """
+    folder = os.path.dirname(destination)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+
+    if allow_hardlink:
+        try:
+            if os.path.exists(destination):
+                os.remove(destination)
+            os.link(source, destination)
+            return "hardlink"
+        except OSError:
+            pass
+
+    if allow_reflink:
+        try:
+            _reflink(source, destination)
+            shutil.copystat(source, destination)
+            return "reflink"
+        except OSError:
+            pass
+
+    shutil.copy2(source, destination)
+    return "copy"
+
+
+class TransferPlan(object):
+    """Files to transfer split in those to copy and those to skip.
+
+    Attributes:
+        to_copy (list[tuple[str, str, int]]): Source, destination and size
+            of the files to copy.
+        skipped (list[tuple[str, str]]): Source and destination of files
+            that are already identical.
+        overwrites (list[str]): Existing destinations that differ from
+            their source and would be overwritten.
+
+    """
+
+    def __init__(self):
+        self.to_copy = []
+        self.skipped = []
+        self.overwrites = []
+
+    @property
+    def bytes_to_copy(self):
+        return sum(size for _source, _destination, size in self.to_copy)
+
+    def summary(self):
+        """Return a dry run summary of the transfer."""
+        return (
+            "{} files to copy ({:.1f} MB), {} identical files skipped, "
+            "{} existing files to overwrite.".format(
+                len(self.to_copy),
+                self.bytes_to_copy / (1024.0 * 1024.0),
+                len(self.skipped),
+                len(self.overwrites)
+            )
+        )
+
+
+def plan_transfers(transfers, compare_hash=False):
+    """Return which of the transfers need to be copied.
+
+    Args:
+        transfers (Iterable[tuple]): Source and destination pairs. An
+            optional third item is the source's stat result, e.g. from
+            `iter_files`, to avoid another stat call.
+        compare_hash (bool): Also compare the contents by hash.
+
+    Returns:
+        TransferPlan: The transfer plan.
+
+    """
+    plan = TransferPlan()
+    for transfer in transfers:
+        source, destination = transfer[:2]
+        source_stat = transfer[2] if len(transfer) > 2 else os.stat(source)
+        if is_identical(source, destination, source_stat, compare_hash):
+            plan.skipped.append((source, destination))
+            continue
+        if os.path.exists(destination):
+            plan.overwrites.append(destination)
+        plan.to_copy.append((source, destination, source_stat.st_size))
+    return plan
+
+
+def execute_transfers(plan,
+                      max_workers=8,
+                      allow_reflink=True,
+                      allow_hardlink=False,
+                      progress=None):
+    """Copy the files of the plan in parallel.
+
+    Args:
+        plan (TransferPlan): The transfers to execute.
+        max_workers (int): Maximum amount of concurrent copies.
+        allow_reflink (bool): Clone with reflinks where supported.
+        allow_hardlink (bool): Hardlink where possible.
+        progress (Optional[callable]): Called in the calling thread after
+            each copied file with the bytes copied so far and the total. When
+            it returns True the remaining transfers are cancelled.
+
+    Returns:
+        dict[str, int]: Amount of files per copy method.
+
+    Raises:
+        RuntimeError: When any of the files failed to copy or the transfer
+            was cancelled.
+
+    """
+    total = plan.bytes_to_copy
+    copied = 0
+    methods = {}
+    errors = []
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        futures = {
+            executor.submit(
+                copy_file, source, destination, allow_reflink, allow_hardlink
+            ): (source, destination, size)
+            for source, destination, size in plan.to_copy
+        }
+        for future in as_completed(futures):
+            source, destination, size = futures[future]
+            try:
+                method = future.result()
+            except OSError as exc:
+                errors.append("{} -> {}: {}".format(source, destination, exc))
+            else:
+                methods[method] = methods.get(method, 0) + 1
+            copied += size
+            if progress is not None and progress(copied, total):
+                for pending in futures:
+                    pending.cancel()
+                errors.append("Cancelled by user.")
+                break
+
+    if errors:
+        raise RuntimeError(
+            "Failed to copy files:\n{}".format("\n".join(errors)))
+    return methods
+
+
+@contextlib.contextmanager
+def maya_progress_window(title, status="Copying files..."):
+    """Show Maya's progress window while transferring files.
+
+    Yields:
+        callable: Progress callback for `execute_transfers` which returns
+            True when the artist cancelled.
+
+    """
+    from maya import cmds
+
+    if cmds.about(batch=True):
+        yield None
+        return
+
+    cmds.progressWindow(
+        title=title,
+        status=status,
+        progress=0,
+        maxValue=100,
+        isInterruptable=True
+    )
+
+    def _progress(copied, total):
+        percentage = int(100 * copied / total) if total else 100
+        cmds.progressWindow(edit=True, progress=percentage)
+        return cmds.progressWindow(query=True, isCancelled=True)
+
+    try:
+        yield _progress
+    finally:
+        cmds.progressWindow(endProgress=True)
@@ -3,7 +3,7 @@
 import os
 import copy
 import sys
-import uuid
+import time
 import re
 
 import json
@@ -40,12 +40,17 @@ from ayon_core.pipeline.context_tools import get_current_task_entity
 from ayon_core.pipeline.create import CreateContext
 from ayon_core.lib.profiles_filtering import filter_profiles
 
+from .ayon_modifier import apply_modifier
+
 
 self = sys.modules[__name__]
 self._parent = None
 
 log = logging.getLogger(__name__)
 
+# Folder id by (project name, folder path), see `get_folder_id`
+_folder_id_cache = {}
+
 IS_HEADLESS = not hasattr(cmds, "about") or cmds.about(batch=True)
 ATTRIBUTE_DICT = {"int": {"attributeType": "long"},
                   "str": {"dataType": "string"},
@@ -519,10 +524,16 @@ def get_node_name(path: str) -> str:
 
 def read(node):
     """Return user-defined attributes from `node`"""
+    return read_attributes(node,
+                           cmds.listAttr(node, userDefined=True) or list())
+
+
+def read_attributes(node, attributes):
+    """Return the values of `attributes` of `node` like `read`"""
 
     data = dict()
 
-    for attr in cmds.listAttr(node, userDefined=True) or list():
+    for attr in attributes:
         try:
             value = cmds.getAttr(node + "." + attr, asString=True)
 
@@ -547,6 +558,60 @@ def read(node):
     return data
 
 
+def read_user_attributes(node_obj):
+    """Return user-defined attributes from a node like `read`.
+
+    The common attribute types are read through the Maya API which is
+    considerably faster than `read` when reading many nodes, other attribute
+    types fall back to `getAttr`.
+
+    Arguments:
+        node_obj (OpenMaya.MObject): The node to read.
+
+    Returns:
+        dict: The attribute values by attribute name.
+
+    """
+    fn_node = OpenMaya.MFnDependencyNode(node_obj)
+    node = fn_node.name()
+    data = dict()
+    for index in range(fn_node.attributeCount()):
+        attribute = fn_node.attribute(index)
+        fn_attribute = OpenMaya.MFnAttribute(attribute)
+        if not fn_attribute.dynamic:
+            continue
+
+        name = fn_attribute.name
+        plug = fn_node.findPlug(attribute, False)
+        kind = _get_attribute_kind(attribute)
+        if kind == "string":
+            data[name] = plug.asString()
+        elif kind == "bool":
+            data[name] = plug.asBool()
+        elif kind == "long":
+            data[name] = plug.asInt()
+        elif kind == "double":
+            data[name] = plug.asDouble()
+        elif kind == "enum":
+            data[name] = OpenMaya.MFnEnumAttribute(attribute).fieldName(
+                plug.asShort())
+        elif attribute.hasFn(OpenMaya.MFn.kMessageAttribute):
+            # Take source node name as value, like `read`
+            value = None
+            source = plug.source()
+            if not source.isNull:
+                source_obj = source.node()
+                if source_obj.hasFn(OpenMaya.MFn.kDagNode):
+                    value = OpenMaya.MFnDagNode(source_obj).fullPathName()
+                else:
+                    value = OpenMaya.MFnDependencyNode(source_obj).name()
+            data[name] = value
+        else:
+            data.update(read_attributes(node, [name]))
+
+    return data
+
+
 def matrix_equals(a, b, tolerance=1e-10):
     """
     Compares two matrices with an imperfection tolerance
@@ -708,6 +773,161 @@ def imprint(node, data):
         cmds.setAttr(node + "." + key, value, **set_type)
 
 
+def _get_imprint_attribute_kind(value):
+    """Return the kind of attribute `imprint` creates for a value."""
+    if isinstance(value, bool):
+        return "bool"
+    elif isinstance(value, string_types):
+        return "string"
+    elif isinstance(value, int):
+        return "long"
+    elif isinstance(value, float):
+        return "double"
+    elif isinstance(value, (list, tuple)):
+        return "enum"
+    raise TypeError("Unsupported type: %r" % type(value))
+
+
+def _get_attribute_kind(attribute):
+    """Return the kind of an existing attribute as used by `imprint`."""
+    if attribute.hasFn(OpenMaya.MFn.kNumericAttribute):
+        numeric_type = OpenMaya.MFnNumericAttribute(attribute).numericType()
+        return {
+            OpenMaya.MFnNumericData.kBoolean: "bool",
+            OpenMaya.MFnNumericData.kInt: "long",
+            OpenMaya.MFnNumericData.kLong: "long",
+            OpenMaya.MFnNumericData.kDouble: "double",
+        }.get(numeric_type)
+    elif attribute.hasFn(OpenMaya.MFn.kTypedAttribute):
+        if (
+            OpenMaya.MFnTypedAttribute(attribute).attrType()
+            == OpenMaya.MFnData.kString
+        ):
+            return "string"
+    elif attribute.hasFn(OpenMaya.MFn.kEnumAttribute):
+        return "enum"
+    return None
+
+
+def _create_imprint_attribute(key, kind, value):
+    """Return a new attribute matching the attribute `imprint` adds."""
+    if kind == "string":
+        fn = OpenMaya.MFnTypedAttribute()
+        attribute = fn.create(key, key, OpenMaya.MFnData.kString)
+        return attribute
+
+    if kind == "enum":
+        fn = OpenMaya.MFnEnumAttribute()
+        attribute = fn.create(key, key)
+        for index, field in enumerate(value):
+            fn.addField(field, index)
+    else:
+        numeric_type = {
+            "bool": OpenMaya.MFnNumericData.kBoolean,
+            "long": OpenMaya.MFnNumericData.kLong,
+            "double": OpenMaya.MFnNumericData.kDouble,
+        }[kind]
+        fn = OpenMaya.MFnNumericAttribute()
+        attribute = fn.create(key, key, numeric_type)
+    fn.keyable = False
+    fn.channelBox = True
+    return attribute
+
+
+def imprint_changes(node, data, remove=None):
+    """Write `data` to `node` changing only the attributes that differ.
+
+    Unlike `imprint` this does not require the attributes to be removed
+    first. Existing attributes of the same type whose value is equal are
+    left untouched, attributes of another type are recreated. All changes
+    are applied as a single undoable operation.
+
+    As with `imprint` lists and tuples are stored as enum attributes with
+    the first value selected.
+
+    Arguments:
+        node (str): Name of node.
+        data (dict): Dictionary of key/value pairs.
+        remove (Optional[Iterable[str]]): Attributes to remove, if they
+            exist and are not in `data`.
+
+    Returns:
+        int: The amount of changed attributes.
+
+    """
+    sel = OpenMaya.MSelectionList()
+    sel.add(node)
+    node_obj = sel.getDependNode(0)
+    fn_node = OpenMaya.MFnDependencyNode(node_obj)
+
+    # Resolve callable values once
+    values = {}
+    for key, value in data.items():
+        if callable(value):
+            value = value()
+        values[key] = (_get_imprint_attribute_kind(value), value)
+
+    # Add or recreate attributes that are missing or of another type
+    attribute_modifier = OpenMaya.MDGModifier()
+    removed = []
+    for key in remove or []:
+        if key not in values and fn_node.hasAttribute(key):
+            attribute_modifier.removeAttribute(node_obj,
+                                               fn_node.attribute(key))
+            removed.append(key)
+
+    added = []
+    for key, (kind, value) in values.items():
+        if fn_node.hasAttribute(key):
+            attribute = fn_node.attribute(key)
+            existing_kind = _get_attribute_kind(attribute)
+            if existing_kind == kind and not (
+                kind == "enum"
+                and cmds.attributeQuery(key, node=node, listEnum=True)[0]
+                != ":".join(value)
+            ):
+                continue
+            attribute_modifier.removeAttribute(node_obj, attribute)
+
+        attribute_modifier.addAttribute(
+            node_obj, _create_imprint_attribute(key, kind, value))
+        added.append(key)
+
+    changed = set(removed)
+    with undo_chunk():
+        if removed or added:
+            apply_modifier(attribute_modifier)
+
+        # Set the values that differ
+        value_modifier = OpenMaya.MDGModifier()
+        for key, (kind, value) in values.items():
+            plug = fn_node.findPlug(key, False)
+            if kind == "string":
+                if key in added or plug.asString() != value:
+                    value_modifier.newPlugValueString(plug, value)
+                    changed.add(key)
+            elif kind == "bool":
+                if key in added or plug.asBool() != value:
+                    value_modifier.newPlugValueBool(plug, value)
+                    changed.add(key)
+            elif kind == "double":
+                if key in added or plug.asDouble() != value:
+                    value_modifier.newPlugValueDouble(plug, value)
+                    changed.add(key)
+            else:
+                # Enums are always set to their first value
+                if kind == "enum":
+                    value = 0
+                if key in added or plug.asInt() != value:
+                    value_modifier.newPlugValueInt(plug, value)
+                    changed.add(key)
+
+        if changed.difference(removed):
+            apply_modifier(value_modifier)
+
+    return len(changed)
+
+
 def lsattr(attr, value=None):
     """Return nodes matching `key` and `value`
 
@@ -993,14 +1213,75 @@ def no_undo(flush=False):
         cmds.undoInfo(**{keyword: original})
 
 
+def get_shading_engine_assignments(shapes):
+    """Return the shading engine assignments of shapes in a single pass.
+
+    This traverses the connected sets of all shapes through the API instead
+    of querying connections and set members per shape and shading engine.
+
+    For a shape with an object assignment the components are an empty list,
+    for component assignments it lists the components, like:
+        {
+            "shadingEngineX": [("|pCube1|pCubeShape1", [])],
+            "shadingEngineY": [("|pSphere1|pSphereShape1", ["f[0:39]"])]
+        }
+
+    Args:
+        shapes (list): Long names of the shapes.
+
+    Returns:
+        dict: The {shadingEngine: [(shape, components)]} relationships
+
+    """
+    selection_list = OpenMaya.MSelectionList()
+    for shape in shapes:
+        selection_list.add(shape)
+
+    fn_dag = OpenMaya.MFnDagNode()
+    fn_dep = OpenMaya.MFnDependencyNode()
+    assignments = defaultdict(list)
+    for i in range(selection_list.length()):
+        dag_path = selection_list.getDagPath(i)
+        shape = dag_path.fullPathName()
+        fn_dag.setObject(dag_path)
+        sets, members = fn_dag.getConnectedSetsAndMembers(
+            dag_path.instanceNumber(), True
+        )
+        for set_index in range(len(sets)):
+            set_obj = sets[set_index]
+            if not set_obj.hasFn(OpenMaya.MFn.kShadingEngine):
+                continue
+
+            shading_engine = fn_dep.setObject(set_obj).name()
+            component = members[set_index]
+            components = []
+            if not component.isNull():
+                components = _get_component_names(dag_path, component)
+            assignments[shading_engine].append((shape, components))
+
+    return dict(assignments)
+
+
+def _get_component_names(dag_path, component):
+    """Return compacted component names like `f[0:3]` without the node."""
+    selection_list = OpenMaya.MSelectionList()
+    selection_list.add((dag_path, component))
+    return [
+        name.split(".", 1)[-1]
+        for name in selection_list.getSelectionStrings()
+        if "." in name
+    ]
+
+
 def get_shader_assignments_from_shapes(shapes, components=True):
     """Return the shape assignment per related shading engines.
 
     Returns a dictionary where the keys are shadingGroups and the values are
     lists of assigned shapes or shape-components.
 
-    Since `maya.cmds.sets` returns shader members on the shapes as components
-    on the transform we correct that in this method too.
+    Component assignments are always returned on the shape, e.g.
+    `pCubeShape1.f[0]`, even though `maya.cmds.sets` lists them as if they
+    were assigned to the transform.
 
     For the 'shapes' this will return a dictionary like:
         {
@@ -1024,50 +1305,20 @@ def get_shader_assignments_from_shapes(shapes, components=True):
     if not shapes:
         return {}
 
-    # Collect shading engines and their shapes
     assignments = defaultdict(list)
-    for shape in shapes:
-
-        # Get unique shading groups for the shape
-        shading_groups = cmds.listConnections(shape,
-                                              source=False,
-                                              destination=True,
-                                              plugs=False,
-                                              connections=False,
-                                              type="shadingEngine") or []
-        shading_groups = list(set(shading_groups))
-        for shading_group in shading_groups:
-            assignments[shading_group].append(shape)
-
-    if components:
-        # Note: Components returned from maya.cmds.sets are "listed" as if
-        # being assigned to the transform like: pCube1.f[0] as opposed
-        # to pCubeShape1.f[0] so we correct that here too.
-
-        # Build a mapping from parent to shapes to include in lookup.
-        transforms = {shape.rsplit("|", 1)[0]: shape for shape in shapes}
-        lookup = set(shapes) | set(transforms.keys())
-
-        component_assignments = defaultdict(list)
-        for shading_group in assignments.keys():
-            members = cmds.ls(cmds.sets(shading_group, query=True), long=True)
-            for member in members:
-
-                node = member.split(".", 1)[0]
-                if node not in lookup:
-                    continue
-
-                # Component
-                if "." in member:
-
-                    # Fix transform to shape as shaders are assigned to shapes
-                    if node in transforms:
-                        shape = transforms[node]
-                        component = member.split(".", 1)[1]
-                        member = "{0}.{1}".format(shape, component)
-
-                component_assignments[shading_group].append(member)
-        assignments = component_assignments
+    for shading_engine, shape_members in (
+        get_shading_engine_assignments(shapes).items()
+    ):
+        members = assignments[shading_engine]
+        for shape, shape_components in shape_members:
+            if components and shape_components:
+                members.extend(
+                    "{0}.{1}".format(shape, component)
+                    for component in shape_components
+                )
+            else:
+                # Each shape is listed once per shading engine
+                members.append(shape)
 
     return dict(assignments)
 
@@ -1566,6 +1817,75 @@ def get_id(node):
         return
 
 
+def get_string_attribute_values(nodes, attribute):
+    """Get the value of a string attribute of many nodes at once.
+
+    This reuses a single selection list and function set for all nodes
+    which is considerably faster than querying the attribute per node.
+
+    Args:
+        nodes (Iterable[str]): The names of the nodes to retrieve the
+            attribute from.
+        attribute (str): The name of the string attribute.
+
+    Returns:
+        dict[str, Union[str, None]]: The value per node, None if the node
+            does not have the attribute.
+
+    """
+    sel = OpenMaya.MSelectionList()
+    fn = OpenMaya.MFnDependencyNode()
+
+    values = {}
+    for node in nodes:
+        if node in values:
+            continue
+
+        sel.clear()
+        sel.add(node)
+        fn.setObject(sel.getDependNode(0))
+
+        value = None
+        if fn.hasAttribute(attribute):
+            try:
+                value = fn.findPlug(attribute, False).asString()
+            except RuntimeError:
+                log.warning("Failed to retrieve %s on %s", attribute, node)
+        values[node] = value
+
+    return values
+
+
+def get_ids(nodes):
+    """Get the `cbId` attribute of many nodes at once.
+
+    Args:
+        nodes (Iterable[str]): The names of the nodes to retrieve the
+            attribute from.
+
+    Returns:
+        dict[str, Union[str, None]]: The id per node, None if it has no id.
+
+    """
+    return get_string_attribute_values(nodes, "cbId")
+
+
+def get_nodes_by_id(nodes):
+    """Return nodes grouped by their `cbId` attribute.
+
+    Args:
+        nodes (Iterable[str]): The names of the nodes.
+
+    Returns:
+        defaultdict[str, list[str]]: The nodes per id.
+
+    """
+    nodes_by_id = defaultdict(list)
+    for node, node_id in get_ids(nodes).items():
+        nodes_by_id[node_id].append(node)
+    return nodes_by_id
+
+
 def generate_ids(nodes, folder_id=None):
     """Returns new unique ids for the given nodes.
 
@@ -1573,13 +1893,11 @@ def generate_ids(nodes, folder_id=None):
 
     To assign new ids using this method:
     >>> nodes = ["a", "b", "c"]
-    >>> for node, id in generate_ids(nodes):
-    >>>     set_id(node, id)
+    >>> set_ids(generate_ids(nodes))
 
     To also override any existing values (and assign regenerated ids):
     >>> nodes = ["a", "b", "c"]
-    >>> for node, id in generate_ids(nodes):
-    >>>     set_id(node, id, overwrite=True)
+    >>> set_ids(generate_ids(nodes), overwrite=True)
 
     Args:
         nodes (list): List of nodes.
@@ -1597,24 +1915,52 @@ def generate_ids(nodes, folder_id=None):
         folder_path = get_current_folder_path()
         if not folder_path:
             raise ValueError("Current folder path is not set")
-        folder_entity = ayon_api.get_folder_by_path(
-            project_name, folder_path, fields=["id"]
-        )
-        if not folder_entity:
+        folder_id = get_folder_id(project_name, folder_path)
+        if not folder_id:
             raise ValueError((
                 "Current folder '{}' was not found on the server"
             ).format(folder_path))
-        folder_id = folder_entity["id"]
 
+    # Each id is the hex of 6 random bytes, like the last group of uuid4
+    nodes = list(nodes)
+    random_hex = os.urandom(6 * len(nodes)).hex()
     node_ids = []
-    for node in nodes:
-        _, uid = str(uuid.uuid4()).rsplit("-", 1)
+    for index, node in enumerate(nodes):
+        uid = random_hex[index * 12:(index + 1) * 12]
         unique_id = "{}:{}".format(folder_id, uid)
         node_ids.append((node, unique_id))
 
     return node_ids
 
 
+def get_folder_id(project_name, folder_path):
+    """Return the id of a folder, cached for the session.
+
+    Args:
+        project_name (str): The project name.
+        folder_path (str): The folder path.
+
+    Returns:
+        Union[str, None]: The folder id, None if the folder does not exist.
+
+    """
+    key = (project_name, folder_path)
+    if key not in _folder_id_cache:
+        folder_entity = ayon_api.get_folder_by_path(
+            project_name, folder_path, fields=["id"]
+        )
+        if not folder_entity:
+            # Do not cache missing folders, they may be created later
+            return None
+        _folder_id_cache[key] = folder_entity["id"]
+    return _folder_id_cache[key]
+
+
+def clear_folder_id_cache():
+    """Clear the folder ids cached by `get_folder_id`."""
+    _folder_id_cache.clear()
+
+
 def set_id(node, unique_id, overwrite=False):
     """Add cbId to `node` unless one already exists.
 
@@ -1629,17 +1975,71 @@ def set_id(node, unique_id, overwrite=False):
         None
 
     """
+    set_ids([(node, unique_id)], overwrite=overwrite)
+
+
+def set_ids(node_ids, overwrite=False):
+    """Add cbId to many nodes at once unless one already exists.
+
+    Missing attributes are added and the values are set with one
+    `MDGModifier` each, which is much faster than `set_id` per node. The
+    changes are undone as a single undo chunk.
+
+    Example:
+        >>> set_ids(generate_ids(nodes))
+
+    Args:
+        node_ids (Union[dict[str, str], Iterable[tuple[str, str]]]): The
+            unique node id per node. These should be generated by
+            `generate_ids`.
+        overwrite (bool, optional): When True overrides the current value even
+            if the node already has an id. Defaults to False.
+
+    Returns:
+        int: Amount of nodes an id was set on.
+
+    """
+    # Each node only once, since the attribute can only be added once
+    node_ids = dict(node_ids)
+
+    sel = OpenMaya.MSelectionList()
+    fn_node = OpenMaya.MFnDependencyNode()
+    attribute_modifier = OpenMaya.MDGModifier()
+    has_new_attributes = False
+    to_set = []
+    for node, unique_id in node_ids.items():
+        sel.clear()
+        sel.add(node)
+        node_obj = sel.getDependNode(0)
+        fn_node.setObject(node_obj)
+
+        # Add the attribute if it does not exist yet
+        if not fn_node.hasAttribute("cbId"):
+            fn_attribute = OpenMaya.MFnTypedAttribute()
+            attribute = fn_attribute.create(
+                "cbId", "cbId", OpenMaya.MFnData.kString)
+            attribute_modifier.addAttribute(node_obj, attribute)
+            has_new_attributes = True
+        elif not overwrite:
+            continue
+        to_set.append((node_obj, unique_id))
 
-    exists = cmds.attributeQuery("cbId", node=node, exists=True)
+    if not to_set:
+        return 0
 
-    # Add the attribute if it does not exist yet
-    if not exists:
-        cmds.addAttr(node, longName="cbId", dataType="string")
+    with undo_chunk():
+        if has_new_attributes:
+            apply_modifier(attribute_modifier)
 
-    # Set the value
-    if not exists or overwrite:
-        attr = "{0}.cbId".format(node)
-        cmds.setAttr(attr, unique_id, type="string")
+        # Set the values
+        value_modifier = OpenMaya.MDGModifier()
+        for node_obj, unique_id in to_set:
+            fn_node.setObject(node_obj)
+            plug = fn_node.findPlug("cbId", False)
+            value_modifier.newPlugValueString(plug, unique_id)
+        apply_modifier(value_modifier)
+
+    return len(to_set)
 
 
 def get_attribute(plug,
@@ -1861,6 +2261,25 @@ def list_looks(project_name, folder_id):
     ))
 
 
+@contextlib.contextmanager
+def _timed_phase(timings, phase):
+    """Add the duration of the context to `timings[phase]` in seconds."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[phase] = (
+            timings.get(phase, 0.0) + time.perf_counter() - start
+        )
+
+
+def _log_timings(label, timings):
+    log.debug("{} timings: {}".format(label, ", ".join(
+        "{}: {:.3f}s".format(phase, duration)
+        for phase, duration in timings.items()
+    )))
+
+
 def assign_look_by_version(nodes, version_id):
     """Assign nodes a specific published look version by id.
 
@@ -1873,60 +2292,138 @@ def assign_look_by_version(nodes, version_id):
     Returns:
         None
     """
+    assign_looks_by_version({version_id: nodes})
+
+
+def assign_looks_by_version(nodes_by_version_id):
+    """Assign published look versions to nodes in bulk.
+
+    The full assignment plan for all versions is computed first: looks are
+    loaded (or reused when already loaded) and their relationships resolved
+    against the nodes. Only then the plan is executed with a single
+    `forceElement` per shading engine inside one undo chunk.
+
+    Args:
+        nodes_by_version_id (dict[str, list[str]]): Nodes to assign the look
+            version to per look version id.
+
+    Returns:
+        dict[str, float]: Duration in seconds per phase.
+
+    """
+    timings = OrderedDict()
+    nodes_by_version_id = {
+        version_id: nodes
+        for version_id, nodes in nodes_by_version_id.items()
+        if nodes
+    }
+    if not nodes_by_version_id:
+        return timings
 
     project_name = get_current_project_name()
 
-    # Get representations of shader file and relationships
-    representations = list(ayon_api.get_representations(
-        project_name=project_name,
-        representation_names={"ma", "json"},
-        version_ids=[version_id]
-    ))
-    look_representation = next(
-        repre for repre in representations if repre["name"] == "ma")
-    json_representation = next(
-        repre for repre in representations if repre["name"] == "json")
+    with _timed_phase(timings, "query"):
+        # Get representations of shader file and relationships
+        representations = ayon_api.get_representations(
+            project_name=project_name,
+            representation_names={"ma", "json"},
+            version_ids=set(nodes_by_version_id.keys())
+        )
+        representations_by_version_id = defaultdict(dict)
+        for repre_entity in representations:
+            version_id = repre_entity["versionId"]
+            representations_by_version_id[version_id][
+                repre_entity["name"]] = repre_entity
+
+    with _timed_phase(timings, "load"):
+        # See if representations are already loaded, if so reuse them.
+        host = registered_host()
+        look_containers = {
+            container["representation"]: container["objectName"]
+            for container in host.ls()
+            if container["loader"] == "LookLoader"
+        }
 
-    # See if representation is already loaded, if so reuse it.
-    host = registered_host()
-    representation_id = look_representation["id"]
-    for container in host.ls():
-        if (container['loader'] == "LookLoader" and
-                container['representation'] == representation_id):
-            log.info("Reusing loaded look ..")
-            container_node = container['objectName']
-            break
-    else:
-        log.info("Using look for the first time ..")
+        _loaders = None
+        container_by_version_id = {}
+        shader_nodes_by_version_id = {}
+        for version_id in nodes_by_version_id:
+            look_representation = (
+                representations_by_version_id[version_id]["ma"]
+            )
+            representation_id = look_representation["id"]
+            container_node = look_containers.get(representation_id)
+            if container_node:
+                log.info("Reusing loaded look ..")
+            else:
+                log.info("Using look for the first time ..")
+
+                # Load file
+                if _loaders is None:
+                    _loaders = discover_loader_plugins()
+                loaders = loaders_from_representation(
+                    _loaders, representation_id)
+                Loader = next(
+                    (i for i in loaders if i.__name__ == "LookLoader"), None)
+                if Loader is None:
+                    raise RuntimeError(
+                        "Could not find LookLoader, this is a bug")
+
+                # Reference the look file
+                with maintained_selection():
+                    container_node = load_container(
+                        Loader, look_representation)
+                look_containers[representation_id] = container_node
+
+            # Get container members
+            container_by_version_id[version_id] = container_node
+            shader_nodes_by_version_id[version_id] = (
+                get_container_members(container_node)
+            )
 
-        # Load file
-        _loaders = discover_loader_plugins()
-        loaders = loaders_from_representation(_loaders, representation_id)
-        Loader = next((i for i in loaders if i.__name__ == "LookLoader"), None)
-        if Loader is None:
-            raise RuntimeError("Could not find LookLoader, this is a bug")
+    with _timed_phase(timings, "plan"):
+        all_nodes = set()
+        for nodes in nodes_by_version_id.values():
+            all_nodes.update(nodes)
+        ids_by_node = get_ids(all_nodes)
+
+        edits = []
+        for version_id, nodes in nodes_by_version_id.items():
+            # Load relationships
+            json_representation = (
+                representations_by_version_id[version_id]["json"]
+            )
+            shader_relation = get_representation_path(json_representation)
+            with open(shader_relation, "r") as f:
+                relationships = json.load(f)
 
-        # Reference the look file
-        with maintained_selection():
-            container_node = load_container(Loader, look_representation)
+            nodes_by_id = defaultdict(list)
+            for node in nodes:
+                nodes_by_id[ids_by_node[node]].append(node)
 
-    # Get container members
-    shader_nodes = get_container_members(container_node)
+            edits.extend(iter_shader_edits(
+                relationships,
+                shader_nodes_by_version_id[version_id],
+                nodes_by_id,
+                label=container_by_version_id[version_id],
+                components=False
+            ))
 
-    # Load relationships
-    shader_relation = get_representation_path(json_representation)
-    with open(shader_relation, "r") as f:
-        relationships = json.load(f)
+    with _timed_phase(timings, "apply"):
+        # Assign relationships
+        with undo_chunk():
+            apply_shader_edits(edits)
 
-    # Assign relationships
-    apply_shaders(relationships, shader_nodes, nodes)
+    _log_timings("Look assignment", timings)
+    return timings
 
 
 def assign_look(nodes, product_name="lookMain"):
     """Assigns a look to a node.
 
     Optimizes the nodes by grouping by folder id and finding
-    related product by name.
+    related product by name. The looks of all folders are assigned in bulk
+    with `assign_looks_by_version`.
 
     Args:
         nodes (list): all nodes to assign the look to
@@ -1935,8 +2432,7 @@ def assign_look(nodes, product_name="lookMain"):
 
     # Group all nodes per folder id
     grouped = defaultdict(list)
-    for node in nodes:
-        hash_id = get_id(node)
+    for node, hash_id in get_ids(nodes).items():
         if not hash_id:
             continue
 
@@ -1960,6 +2456,7 @@ def assign_look(nodes, product_name="lookMain"):
         product_ids
     )
 
+    nodes_by_version_id = defaultdict(list)
     for folder_id, asset_nodes in grouped.items():
         product_entity = product_entities_by_folder_id.get(folder_id)
         if not product_entity:
@@ -1987,7 +2484,9 @@ def assign_look(nodes, product_name="lookMain"):
         log.debug("Assigning look '{}' <v{:03d}>".format(
             product_name, last_version["version"]))
 
-        assign_look_by_version(asset_nodes, last_version["id"])
+        nodes_by_version_id[last_version["id"]].extend(asset_nodes)
+
+    assign_looks_by_version(nodes_by_version_id)
 
 
 def apply_shaders(relationships, shadernodes, nodes):
@@ -2007,57 +2506,18 @@ def apply_shaders(relationships, shadernodes, nodes):
     Returns:
         None
     """
+    timings = OrderedDict()
+    with _timed_phase(timings, "plan"):
+        nodes_by_id = get_nodes_by_id(nodes)
+        edits = list(iter_shader_edits(
+            relationships, shadernodes, nodes_by_id, components=False
+        ))
 
-    attributes = relationships.get("attributes", [])
-    shader_data = relationships.get("relationships", {})
+    with _timed_phase(timings, "apply"):
+        with undo_chunk():
+            apply_shader_edits(edits)
 
-    shading_engines = cmds.ls(shadernodes, type="objectSet", long=True)
-    assert shading_engines, "Error in retrieving objectSets from reference"
-
-    # region compute lookup
-    nodes_by_id = defaultdict(list)
-    for node in nodes:
-        nodes_by_id[get_id(node)].append(node)
-
-    shading_engines_by_id = defaultdict(list)
-    for shad in shading_engines:
-        shading_engines_by_id[get_id(shad)].append(shad)
-    # endregion
-
-    # region assign shading engines and other sets
-    for data in shader_data.values():
-        # collect all unique IDs of the set members
-        shader_uuid = data["uuid"]
-        member_uuids = [member["uuid"] for member in data["members"]]
-
-        filtered_nodes = list()
-        for m_uuid in member_uuids:
-            filtered_nodes.extend(nodes_by_id[m_uuid])
-
-        id_shading_engines = shading_engines_by_id[shader_uuid]
-        if not id_shading_engines:
-            log.error("No shader found with cbId "
-                      "'{}'".format(shader_uuid))
-            continue
-        elif len(id_shading_engines) > 1:
-            log.error("Skipping shader assignment. "
-                      "More than one shader found with cbId "
-                      "'{}'. (found: {})".format(shader_uuid,
-                                                 id_shading_engines))
-            continue
-
-        if not filtered_nodes:
-            log.warning("No nodes found for shading engine "
-                        "'{0}'".format(id_shading_engines[0]))
-            continue
-        try:
-            cmds.sets(filtered_nodes, forceElement=id_shading_engines[0])
-        except RuntimeError as rte:
-            log.error("Error during shader assignment: {}".format(rte))
-
-    # endregion
-
-    apply_attributes(attributes, nodes_by_id)
+    _log_timings("Apply shaders", timings)
 
 
 # endregion LOOKDEV
@@ -3295,19 +3755,32 @@ def show_message(title, msg):
         show_message_dialog(title=title, message=msg, parent=parent)
 
 
-def iter_shader_edits(relationships, shader_nodes, nodes_by_id, label=None):
-    """Yield edits as a set of actions."""
+def iter_shader_edits(relationships, shader_nodes, nodes_by_id, label=None,
+                      components=True):
+    """Yield edits as a set of actions.
+
+    Args:
+        relationships (dict): Relationship data of the published look.
+        shader_nodes (list): Nodes of the shading objectSets.
+        nodes_by_id (dict): Nodes to apply the look to per `cbId`.
+        label (Optional[str]): Prefix for logged messages.
+        components (bool): Whether to assign to the published member
+            components or to the whole nodes.
+
+    Yields:
+        dict: The `assign` and `setattr` edit actions.
+
+    """
 
     attributes = relationships.get("attributes", [])
     shader_data = relationships.get("relationships", {})
 
     shading_engines = cmds.ls(shader_nodes, type="objectSet", long=True)
     assert shading_engines, "Error in retrieving objectSets from reference"
+    prefix = "{} - ".format(label) if label else ""
 
     # region compute lookup
-    shading_engines_by_id = defaultdict(list)
-    for shad in shading_engines:
-        shading_engines_by_id[get_id(shad)].append(shad)
+    shading_engines_by_id = get_nodes_by_id(shading_engines)
     # endregion
 
     # region assign shading engines and other sets
@@ -3319,32 +3792,34 @@ def iter_shader_edits(relationships, shader_nodes, nodes_by_id, label=None):
             for member in data["members"]]
 
         filtered_nodes = list()
-        for _uuid, components in member_uuids:
+        for _uuid, member_components in member_uuids:
             nodes = nodes_by_id.get(_uuid, None)
             if nodes is None:
                 continue
 
-            if components:
+            if components and member_components:
                 # Assign to the components
-                nodes = [".".join([node, components]) for node in nodes]
+                nodes = [
+                    ".".join([node, member_components]) for node in nodes
+                ]
 
             filtered_nodes.extend(nodes)
 
         id_shading_engines = shading_engines_by_id[shader_uuid]
         if not id_shading_engines:
-            log.error("{} - No shader found with cbId "
-                      "'{}'".format(label, shader_uuid))
+            log.error("{}No shader found with cbId "
+                      "'{}'".format(prefix, shader_uuid))
             continue
         elif len(id_shading_engines) > 1:
-            log.error("{} - Skipping shader assignment. "
+            log.error("{}Skipping shader assignment. "
                       "More than one shader found with cbId "
-                      "'{}'. (found: {})".format(label, shader_uuid,
+                      "'{}'. (found: {})".format(prefix, shader_uuid,
                                                  id_shading_engines))
             continue
 
         if not filtered_nodes:
-            log.warning("{} - No nodes found for shading engine "
-                        "'{}'".format(label, id_shading_engines[0]))
+            log.warning("{}No nodes found for shading engine "
+                        "'{}'".format(prefix, id_shading_engines[0]))
             continue
 
         yield {"action": "assign",
@@ -3361,6 +3836,42 @@ def iter_shader_edits(relationships, shader_nodes, nodes_by_id, label=None):
                "attributes": attr_value}
 
 
+def apply_shader_edits(edits):
+    """Apply the edits yielded by `iter_shader_edits` in bulk.
+
+    The `assign` edits are grouped per shading engine so that each shading
+    engine is assigned with a single `forceElement` call, after which the
+    `setattr` edits are applied.
+
+    Args:
+        edits (list[dict]): The edit actions.
+
+    """
+    members_by_shader = OrderedDict()
+    for edit in edits:
+        if edit["action"] == "assign":
+            members_by_shader.setdefault(edit["shader"], []).extend(
+                edit["nodes"])
+
+    for shading_engine, members in members_by_shader.items():
+        try:
+            cmds.sets(members, forceElement=shading_engine)
+        except RuntimeError as rte:
+            log.error("Error during shader assignment: {}".format(rte))
+
+    for edit in edits:
+        if edit["action"] != "setattr":
+            continue
+        for node in edit["nodes"]:
+            for attr, value in edit["attributes"].items():
+                if value is None:
+                    log.warning(
+                        f"Skipping setting {node}.{attr} with value 'None'")
+                    continue
+
+                set_attribute(attr, value, node)
+
+
 def set_colorspace():
     """Set Colorspace from project configuration"""
 
@@ -4350,6 +4861,106 @@ def get_sequence(filepath, pattern="%04d"):
     ]
 
 
+# Tokens of tiled and animated file textures with the regular expression
+# matching their value in the file names on disk
+FILE_TEXTURE_TOKENS = (
+    # Mari
+    (r"<udim>", r"\d{4}"),
+    # Mudbox and Arnold tiles, e.g. `_u1_v1`
+    (r"<(?:uv)?tile>", r"_?u-?\d+_v-?\d+"),
+    # ZBrush and Mudbox, e.g. `u<U>_v<V>`
+    (r"<[uv]>", r"-?\d+"),
+    # Frame numbers of image sequences
+    (r"<f\d*>|<frame0\d+>|%0?\d*d", r"-?\d+"),
+)
+_FILE_TEXTURE_TOKENS_REGEX = re.compile(
+    "|".join("({})".format(token) for token, _ in FILE_TEXTURE_TOKENS),
+    re.IGNORECASE
+)
+
+
+def get_file_texture_patterns(nodes):
+    """Return the file path of file nodes with their tile and frame tokens.
+
+    The `fileTextureName` only holds the path of a single tile or frame. For
+    nodes with a UV tiling mode or using the frame extension the computed
+    file name pattern is returned instead, e.g. `texture.<UDIM>.exr`.
+
+    Args:
+        nodes (list[str]): The `file` nodes.
+
+    Returns:
+        dict[str, Union[str, None]]: The file path per node.
+
+    """
+    paths = get_string_attribute_values(nodes, "fileTextureName")
+    for node, path in paths.items():
+        if not path:
+            continue
+        if (
+            cmds.getAttr("{}.uvTilingMode".format(node))
+            or cmds.getAttr("{}.useFrameExtension".format(node))
+        ):
+            pattern = cmds.getAttr(
+                "{}.computedFileTextureNamePattern".format(node))
+            if pattern:
+                paths[node] = pattern
+    return paths
+
+
+def get_file_texture_regex(filename):
+    """Return a regular expression matching the files of a texture pattern.
+
+    Args:
+        filename (str): File name with tile or frame tokens, see
+            `FILE_TEXTURE_TOKENS`.
+
+    Returns:
+        Union[re.Pattern, None]: The regular expression, None if the file
+            name has no tokens.
+
+    """
+    parts = []
+    position = 0
+    for match in _FILE_TEXTURE_TOKENS_REGEX.finditer(filename):
+        parts.append(re.escape(filename[position:match.start()]))
+        parts.append(FILE_TEXTURE_TOKENS[match.lastindex - 1][1])
+        position = match.end()
+    if not parts:
+        return None
+    parts.append(re.escape(filename[position:]))
+    return re.compile("".join(parts) + "$")
+
+
+def get_texture_files(filepath):
+    """Return the files on disk of a file texture path.
+
+    Unlike `search_textures` this expands all tokens of
+    `FILE_TEXTURE_TOKENS`, so the tiles of all UV tiling modes and the
+    frames of image sequences are found.
+
+    Args:
+        filepath (str): The file path, optionally with tile or frame tokens.
+
+    Returns:
+        list[str]: The existing files.
+
+    """
+    directory, filename = os.path.split(filepath)
+    regex = get_file_texture_regex(filename)
+    if regex is None:
+        return [filepath] if os.path.isfile(filepath) else []
+
+    try:
+        filenames = os.listdir(directory or ".")
+    except OSError:
+        return []
+    return sorted(
+        os.path.join(directory, name)
+        for name in filenames if regex.match(name)
+    )
+
+
 @contextlib.contextmanager
 def force_shader_assignments_to_faces(shapes):
     """Replaces any non-face shader assignments with shader assignments
@@ -4365,67 +4976,51 @@ def force_shader_assignments_to_faces(shapes):
         yield
         return
 
-    all_render_sets = set()
-    for shape in shapes:
-        render_sets = cmds.listSets(object=shape, t=1, extendToShape=False)
-        if render_sets:
-            all_render_sets.update(render_sets)
-
-    shapes_lookup = set(shapes)
-
-    # Maya has the tendency to return component assignment using the transform
-    # name instead of the shape name, like `pCube1.f[1]` instead of
-    # `pCube1Shape.f[1]` so we need to take those into consideration as members
-    def get_parent(_shape: str) -> str:
-        return _shape.rsplit("|", 1)[0]
-
-    components_lookup = {f"{shape}." for shape in shapes}
-    components_lookup.update(f"{get_parent(shape)}." for shape in shapes)
-    components_lookup = tuple(components_lookup)  # support str.startswith
-
-    original_assignments = {}
-    override_assignments = defaultdict(list)
-    for shading_engine in cmds.ls(list(all_render_sets), type="shadingEngine"):
-        members = cmds.sets(shading_engine, query=True)
-        if not members:
-            continue
-
-        members = cmds.ls(members, long=True)
-
-        # Include ALL originals, even those not among our shapes
-        original_assignments[shading_engine] = members
+    def has_faces(_shape: str) -> bool:
+        selection_list = OpenMaya.MSelectionList()
+        selection_list.add(_shape)
+        return OpenMaya.MFnMesh(selection_list.getDagPath(0)).numPolygons > 0
 
+    override_assignments = {}
+    for shading_engine, shape_members in (
+        get_shading_engine_assignments(shapes).items()
+    ):
+        override_members = []
         has_conversions = False
-        for member in members:
-            # Only consider shapes from our inputs
-            if (
-                    member not in shapes_lookup
-                    and not member.startswith(components_lookup)
-            ):
+        for shape, components in shape_members:
+            if components:
+                override_members.extend(
+                    f"{shape}.{component}" for component in components
+                )
                 continue
 
-            if "." not in member:
-                # Convert to face assignments
-                member = f"{member}.f[*]"
-                if not cmds.objExists(member):
-                    # It is possible for a mesh to have no faces at all
-                    # for which we cannot convert to face assignments anyway.
-                    # It is a `mesh` node type - it just would error on
-                    # 'No object matches name' when trying to assign to the
-                    # faces. So we skip the conversion
-                    log.debug(
-                        "Skipping face assignment conversion because "
-                        f"no mesh faces were found: {member}")
-                    continue
+            # Convert to face assignments
+            if not has_faces(shape):
+                # It is possible for a mesh to have no faces at all
+                # for which we cannot convert to face assignments anyway.
+                # It is a `mesh` node type - it just would error on
+                # 'No object matches name' when trying to assign to the
+                # faces. So we skip the conversion
+                log.debug(
+                    "Skipping face assignment conversion because "
+                    f"no mesh faces were found: {shape}")
+                continue
+
+            has_conversions = True
+            override_members.append(f"{shape}.f[*]")
 
-                has_conversions = True
-            override_assignments[shading_engine].append(member)
+        # We can skip shading engines without conversions completely
+        # because we have nothing to override
+        if has_conversions:
+            override_assignments[shading_engine] = override_members
 
-        if not has_conversions:
-            # We can skip this shading engine completely because
-            # we have nothing to override
-            original_assignments.pop(shading_engine, None)
-            override_assignments.pop(shading_engine, None)
+    # Include ALL originals, even those not among our shapes, but only for
+    # the shading engines that are overridden
+    original_assignments = {}
+    for shading_engine in override_assignments:
+        members = cmds.sets(shading_engine, query=True)
+        if members:
+            original_assignments[shading_engine] = cmds.ls(members, long=True)
 
     try:
         # Apply overrides
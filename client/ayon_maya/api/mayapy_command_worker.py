@@ -0,0 +1,54 @@
+"""Run a single Maya command in a headless `mayapy` session.
+
+This script is executed by `mayapy` and must not import from `ayon_maya`
+or `ayon_core`. It is called with the path to a JSON job file:
+
+    mayapy mayapy_command_worker.py /path/to/job.json
+
+The job file contains:
+    scene (str): The scene to open.
+    plugins (list[str]): Maya plug-ins to load before opening the scene.
+    selection (list[str]): Nodes to select before running the command.
+    command (str): Name of the `maya.cmds` command to run.
+    args (list): Positional arguments for the command.
+    kwargs (dict): Keyword arguments for the command.
+    result (str): Path of the JSON file to write the command's result to.
+
+"""
+import sys
+import json
+
+
+def main(job_path):
+    with open(job_path, "r") as f:
+        job = json.load(f)
+
+    import maya.standalone
+    maya.standalone.initialize()
+
+    from maya import cmds
+
+    for plugin in job.get("plugins", []):
+        if not cmds.pluginInfo(plugin, query=True, loaded=True):
+            cmds.loadPlugin(plugin, quiet=True)
+
+    print(">>> Opening {}".format(job["scene"]))
+    cmds.file(job["scene"], open=True, force=True)
+
+    selection = job.get("selection")
+    if selection:
+        cmds.select(selection, noExpand=True)
+
+    command = getattr(cmds, job["command"])
+    print(">>> Running {} with: {}".format(job["command"], job["kwargs"]))
+    result = command(*job.get("args", []), **job.get("kwargs", {}))
+
+    with open(job["result"], "w") as f:
+        json.dump({"result": result}, f)
+
+    print("*** Done")
+    maya.standalone.uninitialize()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1])
@@ -0,0 +1,198 @@
+"""Run Maya commands for frame chunks in parallel headless `mayapy` workers.
+
+Exporting long frame sequences in the interactive session blocks the artist
+for the whole export. Instead the scene is saved to a temporary snapshot
+which background `mayapy` processes open to each run the export for a chunk
+of the frame range.
+
+Example:
+    >>> chunks = split_frame_range(1001, 1100, 1, chunk_count=4)
+    >>> jobs = [
+    ...     WorkerJob(label="{}-{}".format(start, end), kwargs={...})
+    ...     for start, end in chunks
+    ... ]
+    >>> with scene_snapshot() as scene:
+    ...     results = run_command_in_workers(
+    ...         scene, "arnoldExportAss", jobs, plugins=["mtoa"])
+
+"""
+import os
+import sys
+import json
+import shutil
+import logging
+import tempfile
+import threading
+import contextlib
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from maya import cmds
+
+from ayon_core.lib import run_subprocess
+
+log = logging.getLogger(__name__)
+
+WORKER_SCRIPT = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "mayapy_command_worker.py"
+)
+
+WorkerJob = namedtuple(
+    "WorkerJob", ["label", "args", "kwargs", "selection"]
+)
+WorkerJob.__new__.__defaults__ = ((), None, None)
+WorkerJob.__doc__ = """A command to run in a `mayapy` worker.
+
+Attributes:
+    label (str): Label of the job used for reporting, e.g. the frame range.
+    args (tuple): Positional arguments for the command.
+    kwargs (dict): Keyword arguments for the command.
+    selection (list[str]): Nodes to select before running the command.
+"""
+
+WorkerResult = namedtuple("WorkerResult", ["job", "result", "error"])
+WorkerResult.__doc__ = """The outcome of a `WorkerJob`.
+
+Attributes:
+    job (WorkerJob): The job that was run.
+    result: The value returned by the command, None if it failed.
+    error (Union[str, None]): The error message if the job failed.
+"""
+
+
+def get_mayapy_executable():
+    """Return the path to the `mayapy` executable of the running Maya."""
+    mayapy = os.path.join(os.getenv("MAYA_LOCATION"), "bin", "mayapy")
+    if sys.platform == "win32":
+        mayapy = os.path.normpath(mayapy + ".exe")
+    return mayapy
+
+
+def split_frame_range(start, end, step=1, chunk_count=1, min_frames=1):
+    """Split a frame range into contiguous chunks of about equal length.
+
+    Args:
+        start (float): First frame.
+        end (float): Last frame.
+        step (float): Frame step.
+        chunk_count (int): Maximum amount of chunks.
+        min_frames (int): Minimum amount of frames per chunk.
+
+    Returns:
+        list[tuple[float, float]]: Start and end frame per chunk. Each
+            chunk's frames lie on the steps of the original range.
+
+    """
+    step = step or 1
+    frame_count = int(round((end - start) / step)) + 1
+    chunk_count = max(1, min(chunk_count, frame_count // max(min_frames, 1)))
+
+    chunks = []
+    first = 0
+    for index in range(chunk_count):
+        # Spread the remainder over the first chunks
+        size = frame_count // chunk_count
+        if index < frame_count % chunk_count:
+            size += 1
+        last = first + size - 1
+        chunks.append((start + first * step, start + last * step))
+        first = last + 1
+    return chunks
+
+
+@contextlib.contextmanager
+def scene_snapshot(file_type="mayaBinary"):
+    """Save the current scene state to a temporary file for workers.
+
+    The current scene is exported as a whole, preserving references, so
+    the open scene and its file name remain untouched. The snapshot is
+    removed on exit.
+
+    Yields:
+        str: Path to the snapshot scene.
+
+    """
+    ext = ".mb" if file_type == "mayaBinary" else ".ma"
+    tmp_dir = tempfile.mkdtemp(prefix="ayon_maya_snapshot_")
+    path = os.path.join(tmp_dir, "snapshot" + ext).replace("\\", "/")
+    try:
+        cmds.file(path,
+                  force=True,
+                  exportAll=True,
+                  preserveReferences=True,
+                  type=file_type)
+        yield path
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def run_command_in_workers(scene,
+                           command,
+                           jobs,
+                           plugins=None,
+                           max_workers=4,
+                           logger=None):
+    """Run a `maya.cmds` command per job in parallel `mayapy` processes.
+
+    Each job is run in its own process which opens `scene`. A failing job
+    does not stop the others, the error is reported in its result instead.
+
+    Args:
+        scene (str): Path to the scene the workers open.
+        command (str): Name of the `maya.cmds` command to run.
+        jobs (list[WorkerJob]): The jobs to run.
+        plugins (Optional[list[str]]): Maya plug-ins to load in the workers.
+        max_workers (int): Maximum amount of concurrent processes.
+        logger (Optional[logging.Logger]): Logger for progress messages.
+
+    Returns:
+        list[WorkerResult]: The results in the order of `jobs`.
+
+    """
+    logger = logger or log
+    mayapy = get_mayapy_executable()
+    tmp_dir = tempfile.mkdtemp(prefix="ayon_maya_workers_")
+    lock = threading.Lock()
+    finished = []
+
+    def run(index, job):
+        job_path = os.path.join(tmp_dir, "job_{}.json".format(index))
+        result_path = os.path.join(tmp_dir, "result_{}.json".format(index))
+        with open(job_path, "w") as f:
+            json.dump({
+                "scene": scene,
+                "plugins": list(plugins or []),
+                "selection": list(job.selection or []),
+                "command": command,
+                "args": list(job.args),
+                "kwargs": dict(job.kwargs or {}),
+                "result": result_path
+            }, f)
+
+        logger.debug("Starting {} worker: {}".format(command, job.label))
+        try:
+            run_subprocess([mayapy, WORKER_SCRIPT, job_path], logger=logger)
+            with open(result_path, "r") as f:
+                value = json.load(f)["result"]
+        except Exception as exc:
+            result = WorkerResult(job=job, result=None, error=str(exc))
+        else:
+            result = WorkerResult(job=job, result=value, error=None)
+
+        # Report progress to the publisher
+        with lock:
+            finished.append(result)
+            logger.info("{} worker {}: {} ({}/{})".format(
+                command,
+                "failed" if result.error else "finished",
+                job.label,
+                len(finished),
+                len(jobs)
+            ))
+        return result
+
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            return list(executor.map(run, range(len(jobs)), jobs))
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
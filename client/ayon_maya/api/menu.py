@@ -13,21 +13,12 @@ from ayon_core.pipeline import (
     get_current_task_name,
     registered_host
 )
-from ayon_core.pipeline.workfile import BuildWorkfile
 from ayon_core.tools.utils import host_tools
-from ayon_maya.api import lib, lib_rendersettings
+from ayon_maya.api import lib
 from .lib import get_main_window, IS_HEADLESS
-from ..tools import show_look_assigner
 
-from .workfile_template_builder import (
-    create_placeholder,
-    update_placeholder,
-    build_workfile_template,
-    update_workfile_template
-)
-from ayon_core.pipeline.context_tools import version_up_current_workfile
-from ayon_core.tools.workfile_template_build import open_template_ui
-from .workfile_template_builder import MayaTemplateBuilder
+# Tools, the workfile builders and the render settings are only imported
+# when their menu item is triggered to keep Maya's startup fast.
 
 log = logging.getLogger(__name__)
 
@@ -43,6 +34,43 @@ def _get_menu(menu_name=None):
     return widgets.get(menu_name)
 
 
+def _version_up_current_workfile():
+    from ayon_core.pipeline.context_tools import version_up_current_workfile
+
+    version_up_current_workfile()
+
+
+def _set_default_renderer_settings():
+    from ayon_maya.api import lib_rendersettings
+
+    lib_rendersettings.RenderSettings().set_default_renderer_settings()
+
+
+def _build_first_workfile():
+    from ayon_core.pipeline.workfile import BuildWorkfile
+
+    BuildWorkfile().process()
+
+
+def _show_look_assigner(parent):
+    from ayon_maya.tools import show_look_assigner
+
+    show_look_assigner(parent)
+
+
+def _call_template_builder(name, *args):
+    from . import workfile_template_builder
+
+    return getattr(workfile_template_builder, name)(*args)
+
+
+def _open_template_ui():
+    from ayon_core.tools.workfile_template_build import open_template_ui
+    from .workfile_template_builder import MayaTemplateBuilder
+
+    open_template_ui(MayaTemplateBuilder(registered_host()), get_main_window())
+
+
 def get_context_label():
     return "{}, {}".format(
         get_current_folder_path(),
@@ -81,7 +109,7 @@ def install(project_settings):
                     cmds.menuItem(divider=True)
                     cmds.menuItem(
                         "Version Up Workfile",
-                        command=lambda *args: version_up_current_workfile()
+                        command=lambda *args: _version_up_current_workfile()
                     )
         except KeyError:
             print("Version Up Workfile setting not found in "
@@ -154,21 +182,19 @@ def install(project_settings):
 
         cmds.menuItem(
             "Set Render Settings",
-            command=lambda *args: lib_rendersettings.RenderSettings().set_default_renderer_settings()    # noqa
+            command=lambda *args: _set_default_renderer_settings()
         )
 
         cmds.menuItem(divider=True, parent=MENU_NAME)
         cmds.menuItem(
             "Build First Workfile",
             parent=MENU_NAME,
-            command=lambda *args: BuildWorkfile().process()
+            command=lambda *args: _build_first_workfile()
         )
 
         cmds.menuItem(
             "Look assigner...",
-            command=lambda *args: show_look_assigner(
-                parent_widget
-            )
+            command=lambda *args: _show_look_assigner(parent_widget)
         )
 
         cmds.menuItem(
@@ -187,12 +213,14 @@ def install(project_settings):
         cmds.menuItem(
             "Build Workfile from template",
             parent=builder_menu,
-            command=build_workfile_template
+            command=lambda *args: _call_template_builder(
+                "build_workfile_template", *args)
         )
         cmds.menuItem(
             "Update Workfile from template",
             parent=builder_menu,
-            command=update_workfile_template
+            command=lambda *args: _call_template_builder(
+                "update_workfile_template", *args)
         )
         cmds.menuItem(
             divider=True,
@@ -201,19 +229,19 @@ def install(project_settings):
         cmds.menuItem(
             "Open Template",
             parent=builder_menu,
-            command=lambda *args: open_template_ui(
-                MayaTemplateBuilder(registered_host()), get_main_window()
-            ),
+            command=lambda *args: _open_template_ui(),
         )
         cmds.menuItem(
             "Create Placeholder",
             parent=builder_menu,
-            command=create_placeholder
+            command=lambda *args: _call_template_builder(
+                "create_placeholder", *args)
         )
         cmds.menuItem(
             "Update Placeholder",
             parent=builder_menu,
-            command=update_placeholder
+            command=lambda *args: _call_template_builder(
+                "update_placeholder", *args)
         )
 
         cmds.setParent(MENU_NAME, menu=True)
@@ -4,7 +4,7 @@ import os
 import errno
 import logging
 import contextlib
-import shutil
+import threading
 
 from maya import utils, cmds, OpenMaya
 import maya.api.OpenMaya as om
@@ -20,7 +20,6 @@ from ayon_core.host import (
     HostDirmap,
 )
 from ayon_core.tools.utils import host_tools
-from ayon_core.tools.workfiles.lock_dialog import WorkfileLockDialog
 from ayon_core.lib import (
     register_event_callback,
     emit_event
@@ -38,17 +37,22 @@ from ayon_core.pipeline import (
     AYON_CONTAINER_ID,
     AVALON_CONTAINER_ID,
 )
-from ayon_core.pipeline.load import any_outdated_containers
+from ayon_core.pipeline.load import filter_containers
 from ayon_core.pipeline.workfile.lock_workfile import (
-    create_workfile_lock,
-    remove_workfile_lock,
-    is_workfile_locked,
     is_workfile_lock_enabled
 )
 from ayon_maya import MAYA_ROOT_DIR
 from ayon_maya.lib import create_workspace_mel
-
-from . import menu, lib
+from ayon_maya.startup_profiling import phase
+
+from . import (
+    menu,
+    lib,
+    cmds_tracing,
+    file_transfer,
+    workfile_locks,
+    workfile_snapshot,
+)
 from .workio import (
     open_file,
     save_file,
@@ -72,6 +76,11 @@ AVALON_CONTAINERS = ":AVALON_CONTAINERS"
 # Track whether the workfile tool is about to save
 _about_to_save = False
 
+# Result of the last outdated containers check per scene and containers
+_outdated_containers_cache = {}
+# Incremented per check so results of checks for a previous scene are ignored
+_outdated_check_generation = 0
+
 
 class MayaHost(HostBase, IWorkfileHost, ILoadHost, IPublishHost):
     name = "maya"
@@ -79,18 +88,39 @@ class MayaHost(HostBase, IWorkfileHost, ILoadHost, IPublishHost):
     def __init__(self):
         super(MayaHost, self).__init__()
         self._op_events = {}
+        self._project_settings = None
+
+    @property
+    def project_settings(self):
+        """Project settings as fetched on install.
+
+        This allows the startup to share a single settings fetch.
+        """
+        if self._project_settings is None:
+            self._project_settings = get_project_settings(
+                get_current_project_name()
+            )
+        return self._project_settings
 
     def install(self):
         project_name = get_current_project_name()
-        project_settings = get_project_settings(project_name)
+        with phase("get project settings"):
+            project_settings = get_project_settings(project_name)
+            self._project_settings = project_settings
+
         # process path mapping
-        dirmap_processor = MayaDirmap("maya", project_name, project_settings)
-        dirmap_processor.process_dirmap()
+        with phase("process dirmap"):
+            dirmap_processor = MayaDirmap(
+                "maya", project_name, project_settings
+            )
+            dirmap_processor.process_dirmap()
 
         pyblish.api.register_plugin_path(PUBLISH_PATH)
         pyblish.api.register_host("mayabatch")
         pyblish.api.register_host("mayapy")
         pyblish.api.register_host("maya")
+        if cmds_tracing.is_tracing_enabled():
+            cmds_tracing.register_callbacks()
 
         register_loader_plugin_path(LOAD_PATH)
         register_creator_plugin_path(CREATE_PATH)
@@ -100,7 +130,8 @@ class MayaHost(HostBase, IWorkfileHost, ILoadHost, IPublishHost):
         self.log.info("Installing callbacks ... ")
         register_event_callback("init", on_init)
 
-        _set_project()
+        with phase("set project"):
+            _set_project()
 
         if lib.IS_HEADLESS:
             self.log.info((
@@ -110,9 +141,11 @@ class MayaHost(HostBase, IWorkfileHost, ILoadHost, IPublishHost):
 
             return
 
-        self._register_callbacks()
+        with phase("register callbacks"):
+            self._register_callbacks()
 
-        menu.install(project_settings)
+        with phase("install menu"):
+            menu.install(project_settings)
 
         register_event_callback("save", on_save)
         register_event_callback("open", on_open)
@@ -129,7 +162,8 @@ class MayaHost(HostBase, IWorkfileHost, ILoadHost, IPublishHost):
         )
         register_event_callback("workfile.save.after", after_workfile_save)
 
-        self._register_maya_usd_chasers()
+        with phase("register maya usd chasers"):
+            self._register_maya_usd_chasers()
 
     def open_workfile(self, filepath):
         return open_file(filepath)
@@ -334,10 +368,13 @@ def _remove_workfile_lock():
     """Remove workfile lock on current file"""
     if not handle_workfile_locks():
         return
+    if workfile_snapshot.is_writing_snapshot():
+        # The current file is the local snapshot path
+        return
     filepath = current_file()
     log.info("Removing lock on current file {}...".format(filepath))
     if filepath:
-        remove_workfile_lock(filepath)
+        workfile_locks.get_lock_manager().remove_lock(filepath)
 
 
 def handle_workfile_locks():
@@ -352,6 +389,8 @@ def uninstall():
     pyblish.api.deregister_host("mayabatch")
     pyblish.api.deregister_host("mayapy")
     pyblish.api.deregister_host("maya")
+    if cmds_tracing.is_tracing_enabled():
+        cmds_tracing.deregister_callbacks()
 
     deregister_loader_plugin_path(LOAD_PATH)
     deregister_creator_plugin_path(CREATE_PATH)
@@ -548,6 +587,10 @@ def on_before_save():
 
 def on_after_save():
     """Check if there is a lockfile after save"""
+    if workfile_snapshot.is_writing_snapshot():
+        # Check once the scene is renamed back to the workfile path
+        utils.executeDeferred(check_lock_on_current_file)
+        return
     check_lock_on_current_file()
 
 
@@ -564,27 +607,62 @@ def check_lock_on_current_file():
     if not filepath:
         return
 
-    if is_workfile_locked(filepath):
+    manager = workfile_locks.get_lock_manager()
+    if manager.check_and_lock(filepath,
+                              on_locked_late=_on_workfile_locked_late):
+        # Import UI lazily to not slow down startup
+        from ayon_core.tools.workfiles.lock_dialog import WorkfileLockDialog
+
         # add lockfile dialog
         workfile_dialog = WorkfileLockDialog(filepath)
         if not workfile_dialog.exec_():
             cmds.file(new=True)
             return
 
-    create_workfile_lock(filepath)
+        manager.create_lock(filepath)
+
+
+def _on_workfile_locked_late(filepath):
+    """Notify the artist without blocking that the workfile is locked.
+
+    The lock check finished only after the workfile was already opened or
+    saved, so no lock was created for this session.
+
+    """
+    from ayon_core.tools.utils import SimplePopup
+
+    log.warning("Workfile is locked by another user: {}".format(filepath))
+    parent = lib.get_main_window()
+    if parent is None:
+        return
+
+    dialog = SimplePopup(parent=parent)
+    dialog.setWindowTitle("Workfile is locked")
+    dialog.set_message(
+        "The workfile is in use by another user:\n{}".format(filepath))
+    dialog.show()
 
 
 def on_before_close():
     """Delete the lock file after user quitting the Maya Scene"""
     log.info("Closing Maya...")
+    workfile_snapshot.report_failed_uploads(
+        include_pending=not workfile_snapshot.wait_for_uploads())
     # delete the lock file
     filepath = current_file()
     if handle_workfile_locks():
-        remove_workfile_lock(filepath)
+        manager = workfile_locks.get_lock_manager()
+        manager.remove_lock(filepath)
+        # Maya is exiting, so wait for the removal with a time limit
+        if not manager.wait(timeout=manager.timeout):
+            log.warning("Timed out removing workfile lock.")
 
 
 def before_file_open():
     """check lock file when the file changed"""
+    # The file to open may still be uploading
+    workfile_snapshot.report_failed_uploads(
+        include_pending=not workfile_snapshot.wait_for_uploads())
     # delete the lock file
     _remove_workfile_lock()
 
@@ -596,14 +674,19 @@ def on_save():
     automatically on file save.
     """
     log.info("Running callback on save..")
+    if not workfile_snapshot.is_writing_snapshot():
+        # Do not let a pending snapshot upload overwrite this save
+        filepath = current_file()
+        if filepath:
+            workfile_snapshot.supersede_uploads(filepath)
+
     # remove lockfile if users jumps over from one scene to another
     _remove_workfile_lock()
 
     # Generate ids of the current context on nodes in the scene
     nodes = lib.get_id_required_nodes(referenced_nodes=False,
                                       existing_ids=False)
-    for node, new_id in lib.generate_ids(nodes):
-        lib.set_id(node, new_id, overwrite=False)
+    lib.set_ids(lib.generate_ids(nodes), overwrite=False)
 
     # We are now starting the actual save directly
     global _about_to_save
@@ -620,7 +703,7 @@ def on_open():
     lib.validate_fps()
     lib.fix_incompatible_containers()
 
-    if any_outdated_containers():
+    def _on_outdated():
         log.warning("Scene has outdated content.")
 
         # Find maya main window
@@ -641,10 +724,71 @@ def on_open():
             dialog.on_clicked.connect(_on_show_inventory)
             dialog.show()
 
+    check_outdated_containers_async(_on_outdated)
+
     # create lock file for the maya scene
     check_lock_on_current_file()
 
 
+def check_outdated_containers_async(on_outdated):
+    """Check for outdated containers without blocking Maya.
+
+    The containers are collected in the main thread. Their versions are
+    resolved against the server in a background thread after which
+    `on_outdated` is called in the main thread if any are outdated. The
+    result is cached for the scene until its containers change.
+
+    Args:
+        on_outdated (callable): Called when the scene has outdated
+            containers.
+
+    """
+    global _outdated_check_generation
+    _outdated_check_generation += 1
+    generation = _outdated_check_generation
+
+    containers = list(ls())
+    if not containers:
+        return
+
+    key = (
+        current_file(),
+        frozenset(
+            (container["objectName"], container.get("representation"))
+            for container in containers
+        )
+    )
+    outdated = _outdated_containers_cache.get(key)
+    if outdated is not None:
+        if outdated:
+            on_outdated()
+        return
+
+    project_name = get_current_project_name()
+
+    def _finish(outdated):
+        _outdated_containers_cache.clear()
+        _outdated_containers_cache[key] = outdated
+        if generation != _outdated_check_generation:
+            # Another scene was opened in the meantime
+            return
+        if outdated:
+            on_outdated()
+
+    def _check():
+        try:
+            result = filter_containers(containers, project_name)
+        except Exception:
+            log.warning("Failed to check for outdated containers.",
+                        exc_info=True)
+            return
+        utils.executeDeferred(lambda: _finish(bool(result.outdated)))
+
+    thread = threading.Thread(target=_check, name="OutdatedContainersCheck")
+    thread.daemon = True
+    thread.start()
+
+
 def on_new():
     """Set project resolution and fps when create a new file"""
     log.info("Running callback on new..")
@@ -658,6 +802,7 @@ def on_task_changed():
     """Wrapped function of app initialize and maya's on task changed"""
     # Run
     menu.update_menu_task_label()
+    lib.clear_folder_id_cache()
 
     workdir = os.getenv("AYON_WORKDIR")
     if os.path.exists(workdir):
@@ -722,7 +867,7 @@ def workfile_save_before_xgen(event):
         return
 
     transfers = []
-    overwrites = []
+    data_targets = set()
     attribute_changes = {}
     attrs = ["xgFileName", "xgBaseFile"]
     for palette in palettes:
@@ -755,15 +900,20 @@ def workfile_save_before_xgen(event):
             "xgDataPath", sanitized_palette
         ).split(os.pathsep)[0]
         absolute_path = relative_path.replace("${PROJECT}", project_path)
-        for root, _, files in os.walk(absolute_path):
-            for f in files:
-                source = os.path.join(root, f).replace("\\", "/")
-                target = source.replace(project_path, expected_work_dir + "/")
-                transfers.append((source, target))
-                if os.path.exists(target):
-                    overwrites.append(target)
-
-    # Ask user about overwriting files.
+        for source, source_stat in file_transfer.iter_files(absolute_path):
+            source = source.replace("\\", "/")
+            target = source.replace(project_path, expected_work_dir + "/")
+            transfers.append((source, target, source_stat))
+            data_targets.add(target)
+
+    plan = file_transfer.plan_transfers(transfers)
+    log.info("Xgen files transfer: {}".format(plan.summary()))
+
+    # Only existing data files which differ are a potential loss of data,
+    # identical files are skipped.
+    overwrites = [
+        target for target in plan.overwrites if target in data_targets
+    ]
     if overwrites:
         log.warning(
             "WARNING! Potential loss of data.\n\n"
@@ -773,10 +923,10 @@ def workfile_save_before_xgen(event):
         )
         return
 
-    for source, destination in transfers:
-        if not os.path.exists(os.path.dirname(destination)):
-            os.makedirs(os.path.dirname(destination))
-        shutil.copy(source, destination)
+    with file_transfer.maya_progress_window(
+        "Copying Xgen files", "Copying Xgen files to new context..."
+    ) as progress:
+        file_transfer.execute_transfers(plan, progress=progress)
 
     for attribute, value in attribute_changes.items():
         cmds.setAttr(attribute, value, type="string")
@@ -784,12 +934,12 @@ def workfile_save_before_xgen(event):
 
 def after_workfile_save(event):
     workfile_name = event["filename"]
-    if (
-        handle_workfile_locks()
-        and workfile_name
-        and not is_workfile_locked(workfile_name)
-    ):
-        create_workfile_lock(workfile_name)
+    if handle_workfile_locks() and workfile_name:
+        workfile_locks.get_lock_manager().check_and_lock(
+            workfile_name,
+            on_locked_late=_on_workfile_locked_late,
+            timeout=0
+        )
 
 
 class MayaDirmap(HostDirmap):
@@ -1,5 +1,6 @@
 import json
 import os
+import time
 
 import ayon_api
 import qargparse
@@ -21,15 +22,19 @@ from ayon_core.pipeline import (
     get_representation_path,
     publish,
 )
-from ayon_core.pipeline.create import get_product_name
+from ayon_core.pipeline.create import (
+    UnavailableSharedData,
+    get_product_name,
+)
 from ayon_core.pipeline.load import LoadError
 from ayon_core.settings import get_project_settings
 from maya import cmds
+from maya.api import OpenMaya
 from maya.app.renderSetup.model import renderSetup
 from pyblish.api import ContextPlugin, InstancePlugin
 
 from . import lib
-from .lib import imprint, read
+from .lib import read
 from .pipeline import containerise
 
 log = Logger.get_logger()
@@ -121,6 +126,10 @@ class MayaCreatorBase:
         `maya_cached_legacy_instances` there and fill it with
         all legacy products under product type as a key.
 
+        The attributes of the instance nodes are read in the same pass and
+        stored under `maya_cached_instance_node_data` so `read_instance_node`
+        does not have to query them again.
+
         Args:
             Dict[str, Any]: Shared data.
 
@@ -128,21 +137,37 @@ class MayaCreatorBase:
         if shared_data.get("maya_cached_instance_data") is None:
             cache = dict()
             cache_legacy = dict()
-
-            for node in cmds.ls(type="objectSet"):
-
-                if _get_attr(node, attr="id") not in {
-                    AYON_INSTANCE_ID, AVALON_INSTANCE_ID
-                }:
+            node_data_cache = dict()
+
+            # Read all instance sets in a single pass through the Maya API
+            instance_ids = {AYON_INSTANCE_ID, AVALON_INSTANCE_ID}
+            fn_node = OpenMaya.MFnDependencyNode()
+            iterator = OpenMaya.MItDependencyNodes(OpenMaya.MFn.kSet)
+            while not iterator.isDone():
+                node_obj = iterator.thisNode()
+                iterator.next()
+
+                fn_node.setObject(node_obj)
+                if not fn_node.hasAttribute("id"):
+                    continue
+                id_plug = fn_node.findPlug("id", False)
+                try:
+                    if id_plug.asString() not in instance_ids:
+                        continue
+                except RuntimeError:
+                    # Not a string attribute
                     continue
 
-                creator_id = _get_attr(node, attr="creator_identifier")
+                node = fn_node.name()
+                node_data = lib.read_user_attributes(node_obj)
+                creator_id = node_data.get("creator_identifier")
                 if creator_id is not None:
                     # creator instance
                     cache.setdefault(creator_id, []).append(node)
+                    node_data_cache[node] = node_data
                 else:
                     # legacy instance
-                    family = _get_attr(node, attr="family")
+                    family = node_data.get("family")
                     if family is None:
                         # must be a broken instance
                         continue
@@ -151,6 +176,7 @@ class MayaCreatorBase:
 
             shared_data["maya_cached_instance_data"] = cache
             shared_data["maya_cached_legacy_instances"] = cache_legacy
+            shared_data["maya_cached_instance_node_data"] = node_data_cache
         return shared_data
 
     def get_publish_families(self):
@@ -209,21 +235,39 @@ class MayaCreatorBase:
         # like multiselection EnumDef)
         data["creator_attributes"] = json.dumps(json_creator_attributes)
 
+        # Flattened creator attributes which are no longer creator attributes
+        # are removed from the node
+        previous_keys = _get_attr(node, "__creator_attributes_keys") or ""
+        stale_keys = set(previous_keys.split(",")) - set(creator_attributes)
+        stale_keys.discard("")
+
         # Since we flattened the data structure for creator attributes we want
         # to correctly detect which flattened attributes should end back in the
         # creator attributes when reading the data from the node, so we store
         # the relevant keys as a string
         data["__creator_attributes_keys"] = ",".join(creator_attributes.keys())
 
-        # Kill any existing attributes just so we can imprint cleanly again
-        for attr in data.keys():
-            if cmds.attributeQuery(attr, node=node, exists=True):
-                cmds.deleteAttr("{}.{}".format(node, attr))
+        # Only change the attributes that differ from the imprinted values
+        return lib.imprint_changes(node, data, remove=stale_keys)
 
-        return imprint(node, data)
+    def _read_node(self, node):
+        """Return the node's attributes, using the collection cache if any.
+
+        The cache filled by `cache_instance_data` is only used once per node
+        so any later reads reflect the changes made since.
+
+        """
+        try:
+            shared_data = self.collection_shared_data
+        except UnavailableSharedData:
+            shared_data = {}
+        node_data_cache = shared_data.get("maya_cached_instance_node_data")
+        if node_data_cache and node in node_data_cache:
+            return node_data_cache.pop(node)
+        return read(node)
 
     def read_instance_node(self, node):
-        node_data = read(node)
+        node_data = self._read_node(node)
 
         # Never care about a cbId attribute on the object set
         # being read as 'data'
@@ -272,11 +316,17 @@ class MayaCreatorBase:
             self._add_instance_to_context(created_instance)
 
     def _default_update_instances(self, update_list):
+        start = time.perf_counter()
+        changed = 0
         for created_inst, _changes in update_list:
             data = created_inst.data_to_store()
             node = data.get("instance_node")
 
-            self.imprint_instance_node(node, data)
+            changed += self.imprint_instance_node(node, data) or 0
+
+        self.log.debug(
+            "Updated {} instances, {} attributes changed in {:.3f}s".format(
+                len(update_list), changed, time.perf_counter() - start))
 
     def _default_remove_instances(self, instances):
         """Remove specified instance from the scene.
@@ -462,6 +512,9 @@ class RenderlayerCreator(Creator, MayaCreatorBase):
             return
 
         host_name = self.create_context.host_name
+        project_name = self.create_context.get_current_project_name()
+        folder_path = self.create_context.get_current_folder_path()
+        task_name = self.create_context.get_current_task_name()
         rs = renderSetup.instance()
         layers = rs.getRenderLayers()
         for layer in layers:
@@ -473,24 +526,16 @@ class RenderlayerCreator(Creator, MayaCreatorBase):
                 # No existing scene instance node for this layer. Note that
                 # this instance will not have the `instance_node` data yet
                 # until it's been saved/persisted at least once.
-                project_name = self.create_context.get_current_project_name()
-                folder_path = self.create_context.get_current_folder_path()
-                task_name = self.create_context.get_current_task_name()
                 instance_data = {
                     "folderPath": folder_path,
                     "task": task_name,
                     "variant": layer.name(),
                 }
-                folder_entity = ayon_api.get_folder_by_path(
-                    project_name, folder_path
-                )
-                task_entity = ayon_api.get_task_by_name(
-                    project_name, folder_entity["id"], task_name
-                )
+                # The create context caches the current context entities
                 product_name = self.get_product_name(
                     project_name,
-                    folder_entity,
-                    task_entity,
+                    self.create_context.get_current_folder_entity(),
+                    self.create_context.get_current_task_entity(),
                     layer.name(),
                     host_name,
                 )
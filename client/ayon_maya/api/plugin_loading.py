@@ -0,0 +1,263 @@
+"""Scheduled loading of Maya plug-ins for explicit plug-in loading.
+
+With explicit plug-in loading Maya starts without auto loading plug-ins and
+AYON loads the plug-ins enabled in the settings instead. Loading heavy
+plug-ins like renderers before the workfile opens delays the artist, so
+only the plug-ins the workfile requires are loaded before it opens. The
+remaining plug-ins are loaded one by one when Maya is idle.
+
+Plug-ins load in order of their priority, lower first, after the plug-ins
+they depend on. The load time of each plug-in is recorded.
+
+"""
+import os
+import time
+import struct
+import heapq
+import logging
+
+from maya import cmds
+
+from ayon_maya.lib import read_maya_scene_header
+from ayon_maya.startup_profiling import phase
+
+log = logging.getLogger(__name__)
+
+DEFAULT_PRIORITY = 50
+
+
+def _normalize_name(name):
+    """Return plug-in name without extension, lowercase for comparison."""
+    return os.path.splitext(os.path.basename(name))[0].lower()
+
+
+def get_workfile_required_plugins(path):
+    """Return the names of the plug-ins a workfile requires.
+
+    Args:
+        path (str): Path to the workfile.
+
+    Returns:
+        Union[set[str], None]: Names of the required plug-ins. None if the
+            requirements can not be determined for the file.
+
+    """
+    if not path or not path.lower().endswith((".ma", ".mb")):
+        return None
+    try:
+        header = read_maya_scene_header(path)
+    except (OSError, ValueError, struct.error) as exc:
+        log.warning("Unable to read requires from {}: {}".format(path, exc))
+        return None
+    return {name for name, _version in header.requires}
+
+
+class PluginLoadScheduler(object):
+    """Load Maya plug-ins by priority and dependencies.
+
+    Args:
+        plugins (list[dict]): The `plugins_to_load` items of the explicit
+            plug-ins loading settings. Disabled items are ignored.
+
+    """
+
+    def __init__(self, plugins):
+        self._plugins = {}
+        for index, plugin in enumerate(plugins):
+            if not plugin.get("enabled"):
+                continue
+            name = plugin["name"]
+            self._plugins[_normalize_name(name)] = {
+                "name": name,
+                "priority": plugin.get("priority", DEFAULT_PRIORITY),
+                "dependencies": list(plugin.get("dependencies") or []),
+                "index": index
+            }
+
+        # Plug-in name -> load time in seconds, None if failed to load
+        self.load_times = {}
+
+    @property
+    def plugin_names(self):
+        """list[str]: Names of all enabled plug-ins."""
+        return [plugin["name"] for plugin in self._plugins.values()]
+
+    def split_required(self, required):
+        """Split the plug-ins in those to load now and those to defer.
+
+        Args:
+            required (Union[Iterable[str], None]): Names of required
+                plug-ins. When None, all plug-ins are required.
+
+        Returns:
+            tuple[list[str], list[str]]: Plug-ins to load first, including
+                their dependencies, and the remaining plug-ins, each in
+                load order.
+
+        """
+        if required is None:
+            return self.resolve_order(), []
+
+        required = {_normalize_name(name) for name in required}
+        preload = self.resolve_order(
+            plugin["name"] for key, plugin in self._plugins.items()
+            if key in required
+        )
+        loaded = {_normalize_name(name) for name in preload}
+        deferred = [
+            name for name in self.resolve_order()
+            if _normalize_name(name) not in loaded
+        ]
+        return preload, deferred
+
+    def resolve_order(self, names=None):
+        """Return plug-ins in load order, including their dependencies.
+
+        Dependencies load before their dependents, otherwise plug-ins load
+        by priority and then by order in the settings. A dependency takes the
+        priority of its dependents when that is lower.
+
+        Args:
+            names (Optional[Iterable[str]]): The plug-ins to order. Defaults
+                to all enabled plug-ins.
+
+        Returns:
+            list[str]: The plug-in names in load order.
+
+        """
+        if names is None:
+            names = self.plugin_names
+
+        # Collect the plug-ins with all their dependencies
+        plugins = dict(self._plugins)
+        dependencies = {}
+        queue = list(names)
+        while queue:
+            name = queue.pop()
+            key = _normalize_name(name)
+            if key in dependencies:
+                continue
+            if key not in plugins:
+                # Dependency which is not enabled in the settings
+                plugins[key] = {
+                    "name": name,
+                    "priority": DEFAULT_PRIORITY,
+                    "dependencies": [],
+                    "index": len(plugins)
+                }
+            plugin = plugins[key]
+            dependencies[key] = {
+                _normalize_name(dependency)
+                for dependency in plugin["dependencies"]
+            }
+            queue.extend(plugin["dependencies"])
+
+        dependents = {key: set() for key in dependencies}
+        for key, keys in dependencies.items():
+            for dependency in keys:
+                dependents[dependency].add(key)
+
+        # A dependency loads with the priority of its most urgent dependent
+        priorities = {}
+        for key in dependencies:
+            priority = plugins[key]["priority"]
+            visited = {key}
+            stack = list(dependents[key])
+            while stack:
+                dependent = stack.pop()
+                if dependent in visited:
+                    continue
+                visited.add(dependent)
+                priority = min(priority, plugins[dependent]["priority"])
+                stack.extend(dependents[dependent])
+            priorities[key] = priority
+
+        def sort_key(key):
+            return priorities[key], plugins[key]["index"], key
+
+        remaining = {key: len(keys) for key, keys in dependencies.items()}
+        ready = [
+            sort_key(key) for key, count in remaining.items() if not count
+        ]
+        heapq.heapify(ready)
+        order = []
+        while ready:
+            key = heapq.heappop(ready)[-1]
+            order.append(key)
+            for dependent in dependents[key]:
+                remaining[dependent] -= 1
+                if not remaining[dependent]:
+                    heapq.heappush(ready, sort_key(dependent))
+
+        if len(order) < len(dependencies):
+            cyclic = sorted(set(dependencies) - set(order))
+            log.warning(
+                "Cyclic plug-in dependencies: {}".format(", ".join(cyclic)))
+            order.extend(sorted(cyclic, key=sort_key))
+
+        return [plugins[key]["name"] for key in order]
+
+    def load_plugin(self, name):
+        """Load a single plug-in and record its load time.
+
+        Returns:
+            bool: Whether the plug-in is loaded.
+
+        """
+        if cmds.pluginInfo(name, query=True, loaded=True):
+            return True
+
+        print("Loading plug-in: " + name)
+        start = time.perf_counter()
+        try:
+            with phase("load plug-in {}".format(name)):
+                cmds.loadPlugin(name, quiet=True)
+        except RuntimeError as exc:
+            print(exc)
+            self.load_times[name] = None
+            return False
+
+        self.load_times[name] = time.perf_counter() - start
+        return True
+
+    def load(self, names):
+        """Load the plug-ins directly, in order."""
+        for name in names:
+            self.load_plugin(name)
+
+    def load_deferred(self, names, on_finished=None):
+        """Load the plug-ins one by one when Maya is idle.
+
+        Each plug-in is loaded in its own deferred callback, so Maya can
+        process events between loading plug-ins.
+
+        Args:
+            names (list[str]): The plug-ins to load, in order.
+            on_finished (Optional[callable]): Called when all are loaded.
+
+        """
+        names = list(names)
+
+        def _load_next():
+            if not names:
+                if on_finished is not None:
+                    on_finished()
+                return
+            self.load_plugin(names.pop(0))
+            cmds.evalDeferred(_load_next, lowestPriority=True)
+
+        cmds.evalDeferred(_load_next, lowestPriority=True)
+
+    def log_load_times(self):
+        """Log the load time per plug-in, slowest first."""
+        lines = ["Plug-in load times:"]
+        for name, duration in sorted(
+            self.load_times.items(),
+            key=lambda item: -1 if item[1] is None else item[1],
+            reverse=True
+        ):
+            if duration is None:
+                lines.append("  {:<32} failed".format(name))
+            else:
+                lines.append("  {:<32} {:>8.3f}s".format(name, duration))
+        log.info("\n".join(lines))
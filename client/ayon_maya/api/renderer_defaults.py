@@ -0,0 +1,179 @@
+"""Default values of renderer attributes per node type.
+
+Renderer plug-ins add their attributes, like Arnold's `ai*` attributes, to
+Maya's node types. Their defaults are read from the node class through the
+API, so no temporary nodes have to be created in the scene. The tables are
+cached for the Maya session and persisted to a local cache file per
+renderer plug-in version so they are only computed once per version.
+
+"""
+import os
+import json
+import logging
+
+from maya import cmds
+from maya.api import OpenMaya
+
+log = logging.getLogger(__name__)
+
+# Renderer name -> (plug-in name, attribute prefix)
+RENDERER_PLUGINS = {
+    "arnold": ("mtoa", "ai"),
+    "vray": ("vrayformaya", "vray"),
+    "redshift": ("redshift4maya", "rs"),
+}
+
+CACHE_FILENAME = "ayon_renderer_attribute_defaults.json"
+
+_NUMERIC_BOOL = {OpenMaya.MFnNumericData.kBoolean}
+_NUMERIC_INT = {
+    OpenMaya.MFnNumericData.kByte,
+    OpenMaya.MFnNumericData.kChar,
+    OpenMaya.MFnNumericData.kShort,
+    OpenMaya.MFnNumericData.kInt,
+    OpenMaya.MFnNumericData.kInt64,
+}
+_NUMERIC_FLOAT = {
+    OpenMaya.MFnNumericData.kFloat,
+    OpenMaya.MFnNumericData.kDouble,
+}
+
+# Cache for this session: cache key -> {attribute: default}
+_session_cache = {}
+
+
+def get_cache_path():
+    """Return the path to the local defaults cache file."""
+    user_app_dir = cmds.internalVar(userAppDir=True)
+    return os.path.join(user_app_dir, "ayon", CACHE_FILENAME)
+
+
+def _get_cache_key(renderer, node_type):
+    plugin_name, _prefix = RENDERER_PLUGINS[renderer]
+    version = cmds.pluginInfo(plugin_name, query=True, version=True)
+    return "{}|{}|{}".format(renderer, version, node_type)
+
+
+def _get_attribute_default(attr):
+    """Return the default of an attribute like `getAttr` would return it.
+
+    Returns:
+        tuple[bool, object]: Whether the attribute type is supported and
+            the default value.
+
+    """
+    if attr.hasFn(OpenMaya.MFn.kNumericAttribute):
+        fn = OpenMaya.MFnNumericAttribute(attr)
+        numeric_type = fn.numericType()
+        if numeric_type in _NUMERIC_BOOL:
+            return True, bool(fn.default)
+        elif numeric_type in _NUMERIC_INT:
+            return True, int(fn.default)
+        elif numeric_type in _NUMERIC_FLOAT:
+            return True, float(fn.default)
+        elif isinstance(fn.default, (list, tuple)):
+            # Numeric compounds like float3 colors, returned by `getAttr`
+            # as a list with a single tuple
+            return True, [tuple(fn.default)]
+
+    elif attr.hasFn(OpenMaya.MFn.kEnumAttribute):
+        return True, OpenMaya.MFnEnumAttribute(attr).default
+
+    elif attr.hasFn(OpenMaya.MFn.kUnitAttribute):
+        default = OpenMaya.MFnUnitAttribute(attr).default
+        return True, default.asUnits(type(default).uiUnit())
+
+    elif attr.hasFn(OpenMaya.MFn.kTypedAttribute):
+        fn = OpenMaya.MFnTypedAttribute(attr)
+        if fn.attrType() == OpenMaya.MFnData.kString:
+            default = fn.default
+            if default.isNull():
+                return True, ""
+            return True, OpenMaya.MFnStringData(default).string()
+
+    return False, None
+
+
+def compute_attribute_defaults(node_type, prefix):
+    """Return the defaults of all attributes with a prefix on a node type.
+
+    Args:
+        node_type (str): The node type, e.g. "mesh".
+        prefix (str): The attribute name prefix, e.g. "ai".
+
+    Returns:
+        dict[str, object]: The default value per attribute name.
+
+    """
+    node_class = OpenMaya.MNodeClass(node_type)
+    defaults = {}
+    for attr in node_class.getAttributes():
+        name = OpenMaya.MFnAttribute(attr).name
+        if not name.startswith(prefix):
+            continue
+        supported, default = _get_attribute_default(attr)
+        if not supported:
+            log.debug("Ignoring attribute: {}.{}".format(node_type, name))
+            continue
+        defaults[name] = default
+    return defaults
+
+
+def _read_cache_file(path):
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError) as exc:
+        log.warning("Unable to read defaults cache {}: {}".format(path, exc))
+        return {}
+
+
+def _write_cache_file(path, data):
+    try:
+        if not os.path.isdir(os.path.dirname(path)):
+            os.makedirs(os.path.dirname(path))
+        with open(path, "w") as f:
+            json.dump(data, f, indent=4, sort_keys=True)
+    except OSError as exc:
+        log.warning("Unable to write defaults cache {}: {}".format(path, exc))
+
+
+def get_renderer_attribute_defaults(renderer, node_type="mesh"):
+    """Return the default values of a renderer's attributes on a node type.
+
+    The renderer plug-in must be loaded.
+
+    Args:
+        renderer (str): The renderer name, e.g. "arnold", "vray", "redshift".
+        node_type (str): The node type, e.g. "mesh".
+
+    Returns:
+        dict[str, object]: The default value per attribute name.
+
+    """
+    key = _get_cache_key(renderer, node_type)
+    if key in _session_cache:
+        return _session_cache[key]
+
+    path = get_cache_path()
+    cached = _read_cache_file(path)
+    defaults = cached.get(key)
+    if defaults is None:
+        _plugin_name, prefix = RENDERER_PLUGINS[renderer]
+        defaults = compute_attribute_defaults(node_type, prefix)
+        cached[key] = defaults
+        _write_cache_file(path, cached)
+    else:
+        # JSON does not preserve the tuples of compound values
+        defaults = {
+            attr: (
+                [tuple(item) for item in value]
+                if isinstance(value, list) else value
+            )
+            for attr, value in defaults.items()
+        }
+
+    _session_cache[key] = defaults
+    return defaults
@@ -0,0 +1,114 @@
+"""Scene-wide index of nodes by name and id, shared within a publish.
+
+Validators that match instance members against similar nodes in the whole
+scene, like `ValidateRigOutputIds`, would otherwise list the scene and match
+names per instance. The index lists the scene once per publish and groups
+the nodes by their short name without namespace, so lookups are constant
+time. The `cbId` of looked up nodes is read in bulk and cached, so the
+animation and rig id validators of a publish read each id only once.
+
+Example:
+    >>> index = get_scene_node_index(instance.context)
+    >>> index.get_nodes_by_basename("body_GEO")
+    ['|char_01:rig|char_01:body_GEO', '|char_02:rig|char_02:body_GEO']
+
+"""
+from collections import defaultdict
+
+from maya import cmds
+
+from . import lib
+
+CONTEXT_KEY = "mayaSceneNodeIndex"
+
+# Node types indexed by default
+NODE_TYPES = ("transform", "mesh")
+
+
+def get_basename(node):
+    """Return node short name without namespace"""
+    return node.rsplit("|", 1)[-1].rsplit(":", 1)[-1]
+
+
+def get_scene_node_index(context):
+    """Return the scene node index shared by the plug-ins of a publish."""
+    index = context.data.get(CONTEXT_KEY)
+    if index is None:
+        index = SceneNodeIndex()
+        context.data[CONTEXT_KEY] = index
+    return index
+
+
+class SceneNodeIndex(object):
+    """Index the scene's nodes by short name and cache their `cbId`.
+
+    The scene is listed on first access. Ids are only read for the nodes
+    that are looked up, in bulk, and cached. Call `invalidate` after
+    changing node names or ids.
+
+    Args:
+        node_types (Iterable[str]): The node types to index.
+
+    """
+
+    def __init__(self, node_types=NODE_TYPES):
+        self._node_types = list(node_types)
+        self._nodes_by_basename = None
+        self._ids = {}
+
+    def invalidate(self, nodes=None):
+        """Clear the index so it is rebuilt on next access.
+
+        Args:
+            nodes (Optional[Iterable[str]]): Only clear the cached ids of
+                these long node names, e.g. after setting their ids.
+
+        """
+        if nodes is not None:
+            for node in nodes:
+                self._ids.pop(node, None)
+            return
+        self._nodes_by_basename = None
+        self._ids = {}
+
+    @property
+    def nodes_by_basename(self):
+        """dict[str, list[str]]: Long node names per short name."""
+        if self._nodes_by_basename is None:
+            nodes_by_basename = defaultdict(list)
+            for node in cmds.ls(type=self._node_types, long=True):
+                nodes_by_basename[get_basename(node)].append(node)
+            self._nodes_by_basename = dict(nodes_by_basename)
+        return self._nodes_by_basename
+
+    def get_nodes_by_basename(self, basename):
+        """Return the long names of the nodes with the short name."""
+        return self.nodes_by_basename.get(basename, [])
+
+    def get_ids(self, nodes):
+        """Return the `cbId` of the nodes, reading uncached ids in bulk.
+
+        Args:
+            nodes (Iterable[str]): The long names of the nodes.
+
+        Returns:
+            dict[str, Union[str, None]]: The id per node.
+
+        """
+        nodes = list(nodes)
+        missing = [node for node in nodes if node not in self._ids]
+        if missing:
+            self._ids.update(lib.get_ids(missing))
+        return {node: self._ids[node] for node in nodes}
+
+    def get_id(self, node):
+        """Return the `cbId` of a node.
+
+        Args:
+            node (str): The long name of the node.
+
+        Returns:
+            Union[str, None]: The id of the node.
+
+        """
+        return self.get_ids([node])[node]
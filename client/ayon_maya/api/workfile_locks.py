@@ -0,0 +1,177 @@
+"""Workfile lock handling without blocking Maya on slow file systems.
+
+The workfile lock files are small files next to the workfiles. On a
+congested network file system even checking them can hang Maya for
+seconds. The `WorkfileLockManager` runs all lock file operations on a
+worker thread, in the order they are requested, and only waits for a
+result up to a timeout. The lock state of files is cached for a short time.
+
+When a lock check does not finish within the timeout the workfile is
+assumed to be unlocked. If it then turns out to be locked, no lock is
+created and the `on_locked_late` callback is called in the main thread so
+the artist can be notified without blocking.
+
+Example:
+    >>> manager = get_lock_manager()
+    >>> if manager.check_and_lock(filepath, on_locked_late=notify):
+    ...     # Locked by another user
+    >>> manager.remove_lock(filepath)
+
+"""
+import time
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+
+from maya import utils
+
+from ayon_core.pipeline.workfile.lock_workfile import (
+    create_workfile_lock,
+    remove_workfile_lock,
+    is_workfile_locked,
+)
+
+log = logging.getLogger(__name__)
+
+_manager = None
+
+
+class WorkfileLockManager(object):
+    """Run workfile lock operations on a worker thread.
+
+    Args:
+        timeout (float): Seconds to wait for a lock check before assuming
+            the workfile is not locked.
+        ttl (float): Seconds the lock state of a workfile is cached.
+
+    """
+
+    def __init__(self, timeout=2.0, ttl=10.0):
+        self.timeout = timeout
+        self.ttl = ttl
+        # A single worker so lock operations run in the requested order
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="ayon_maya_locks")
+        # Workfile path -> (locked by another user, time of check)
+        self._cache = {}
+        self._cache_lock = threading.Lock()
+        self._pending = []
+
+    def _set_cached(self, path, locked):
+        with self._cache_lock:
+            self._cache[path] = (locked, time.monotonic())
+
+    def get_cached(self, path):
+        """Return cached lock state, None if unknown or expired."""
+        with self._cache_lock:
+            cached = self._cache.get(path)
+        if cached is None:
+            return None
+        locked, checked = cached
+        if time.monotonic() - checked > self.ttl:
+            return None
+        return locked
+
+    def _submit(self, func, *args):
+        future = self._executor.submit(func, *args)
+        self._pending.append(future)
+        future.add_done_callback(self._pending.remove)
+        return future
+
+    def _check_and_lock(self, path):
+        if is_workfile_locked(path):
+            self._set_cached(path, True)
+            return True
+        create_workfile_lock(path)
+        self._set_cached(path, False)
+        return False
+
+    def _lock(self, path):
+        create_workfile_lock(path)
+        self._set_cached(path, False)
+
+    def _unlock(self, path):
+        remove_workfile_lock(path)
+        with self._cache_lock:
+            self._cache.pop(path, None)
+
+    def check_and_lock(self, path, on_locked_late=None, timeout=None):
+        """Lock the workfile unless it is locked by another user.
+
+        Args:
+            path (str): The workfile path.
+            on_locked_late (Optional[callable]): Called in the main thread
+                with the path when the workfile turns out to be locked after
+                the timeout.
+            timeout (Optional[float]): Seconds to wait for the check,
+                defaults to the manager's timeout.
+
+        Returns:
+            bool: Whether the workfile is locked by another user. False when
+                the check did not finish within the timeout.
+
+        """
+        cached = self.get_cached(path)
+        if cached:
+            return True
+        if cached is False:
+            # Known to be unlocked, only create the lock
+            self._submit(self._lock, path)
+            return False
+
+        future = self._submit(self._check_and_lock, path)
+        if timeout is None:
+            timeout = self.timeout
+        try:
+            return future.result(timeout=timeout)
+        except TimeoutError:
+            if timeout:
+                log.warning(
+                    "Checking workfile lock of {} timed out after {:.1f}s, "
+                    "continuing in the background.".format(path, timeout))
+
+        def _on_done(done_future):
+            if done_future.exception() is not None:
+                log.warning("Failed to check workfile lock: {}".format(
+                    done_future.exception()))
+            elif done_future.result() and on_locked_late is not None:
+                utils.executeDeferred(on_locked_late, path)
+
+        future.add_done_callback(_on_done)
+        return False
+
+    def create_lock(self, path):
+        """Create the lock for the workfile without waiting."""
+        self._submit(self._lock, path)
+
+    def remove_lock(self, path):
+        """Remove the lock of the workfile without waiting."""
+        self._submit(self._unlock, path)
+
+    def wait(self, timeout=None):
+        """Wait for the pending lock operations.
+
+        Returns:
+            bool: Whether all operations finished within the timeout.
+
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for future in list(self._pending):
+            remaining = None
+            if deadline is not None:
+                remaining = max(0.0, deadline - time.monotonic())
+            try:
+                future.result(timeout=remaining)
+            except TimeoutError:
+                return False
+            except Exception as exc:
+                log.warning("Workfile lock operation failed: {}".format(exc))
+        return True
+
+
+def get_lock_manager():
+    """Return the workfile lock manager of the session."""
+    global _manager
+    if _manager is None:
+        _manager = WorkfileLockManager()
+    return _manager
@@ -0,0 +1,316 @@
+"""Save workfiles to a local scratch disk and upload them in the background.
+
+Saving heavy scenes directly to network storage blocks Maya until the
+whole file is written. With snapshot saving enabled, by setting the
+`AYON_MAYA_SNAPSHOT_SAVE` environment variable to `1`, the scene is saved
+to a local scratch directory instead and then copied to the work directory
+by a worker thread. The artist regains control as soon as the local write
+completes.
+
+The scratch directory is the `AYON_MAYA_SNAPSHOT_DIR` environment variable
+or a folder in the temp directory. The upload is written to a temporary
+file next to the workfile which then replaces it, so the workfile is never
+partially written. Uploads run one at a time in the order of saving. When
+an upload fails the local snapshot is kept, the scene is marked as modified
+again and the artist gets an error. Uploads still pending when opening a
+file or closing Maya are waited for up to `UPLOAD_TIMEOUT` seconds, after
+which the artist is told where the local snapshot is kept.
+
+A direct save of the workfile, e.g. by publishing, supersedes the pending
+uploads to the same path so an older snapshot never replaces the newer
+workfile. Scenes with XGen palettes are saved directly, since XGen writes
+its sidecar files next to the scene.
+
+Example:
+    >>> if is_snapshot_save_enabled():
+    ...     save_snapshot(filepath, "mayaBinary")
+    >>> get_snapshot_metrics()[-1]
+    {'path': ..., 'local_write': 1.2, 'upload': 8.5, 'size': ...}
+
+"""
+import os
+import time
+import shutil
+import logging
+import tempfile
+import threading
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
+
+from maya import cmds, utils
+
+log = logging.getLogger(__name__)
+
+SNAPSHOT_ENV = "AYON_MAYA_SNAPSHOT_SAVE"
+SNAPSHOT_DIR_ENV = "AYON_MAYA_SNAPSHOT_DIR"
+MAX_METRICS = 50
+# Seconds to wait for pending uploads before saving, opening or closing
+UPLOAD_TIMEOUT = 30.0
+
+_executor = None
+# Future -> (workfile path, local snapshot path) of pending uploads
+_pending_uploads = {}
+# Workfile path -> generation, bumped by each save to supersede uploads
+_generations = {}
+# (workfile path, local snapshot path, error) of failed uploads
+_failed_uploads = []
+_metrics = []
+_metrics_lock = threading.Lock()
+_writing_snapshot = False
+
+
+def is_snapshot_save_enabled():
+    """Return whether snapshot saving is enabled by environment."""
+    return os.getenv(SNAPSHOT_ENV, "").lower() in {"1", "true", "yes"}
+
+
+def is_writing_snapshot():
+    """Return whether the scene is currently being written to scratch disk.
+
+    During the local write the scene name is the scratch path, so lock
+    handling should skip the save callbacks.
+
+    """
+    return _writing_snapshot
+
+
+def can_save_snapshot():
+    """Return whether the current scene can be saved as a snapshot.
+
+    XGen writes `.xgen` sidecar files next to the scene name on save and
+    updates the palettes to match, so those scenes must be saved directly.
+
+    """
+    if not cmds.pluginInfo("xgenToolkit", query=True, loaded=True):
+        return True
+    return not cmds.ls(type="xgmPalette")
+
+
+def get_snapshot_dir():
+    """Return the local scratch directory for snapshots."""
+    return (
+        os.getenv(SNAPSHOT_DIR_ENV)
+        or os.path.join(tempfile.gettempdir(), "ayon_maya_snapshots")
+    )
+
+
+def get_snapshot_metrics():
+    """Return the metrics of the most recent snapshot saves.
+
+    Returns:
+        list[dict]: Per save the "path", "size" in bytes, "local_write"
+            and "upload" time in seconds and the "error", if any. The
+            "upload" is None while the upload is still running.
+
+    """
+    with _metrics_lock:
+        return [dict(metrics) for metrics in _metrics]
+
+
+def _get_executor():
+    global _executor
+    if _executor is None:
+        # A single worker so uploads of the same file never overlap
+        _executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="ayon_maya_snapshot")
+    return _executor
+
+
+@contextlib.contextmanager
+def _writing_snapshot_context():
+    global _writing_snapshot
+    _writing_snapshot = True
+    try:
+        yield
+    finally:
+        _writing_snapshot = False
+
+
+def _bump_generation(filepath):
+    with _metrics_lock:
+        generation = _generations.get(filepath, 0) + 1
+        _generations[filepath] = generation
+    return generation
+
+
+def _upload(local_path, filepath, metrics, generation):
+    """Copy the local snapshot to the workfile path."""
+    start = time.perf_counter()
+    temp_path = "{}.uploading".format(filepath)
+    try:
+        shutil.copyfile(local_path, temp_path)
+        with _metrics_lock:
+            superseded = _generations.get(filepath) != generation
+            if not superseded:
+                os.replace(temp_path, filepath)
+    except OSError as exc:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        with _metrics_lock:
+            metrics["error"] = str(exc)
+            _failed_uploads.append((filepath, local_path, str(exc)))
+        utils.executeDeferred(_on_upload_failed)
+        return
+
+    if superseded:
+        os.remove(temp_path)
+        shutil.rmtree(os.path.dirname(local_path), ignore_errors=True)
+        log.info("Skipped upload of workfile snapshot to {}, the workfile "
+                 "was saved again.".format(filepath))
+        return
+
+    shutil.rmtree(os.path.dirname(local_path), ignore_errors=True)
+    with _metrics_lock:
+        metrics["upload"] = time.perf_counter() - start
+    log.info("Uploaded workfile snapshot to {} in {:.2f}s".format(
+        filepath, metrics["upload"]))
+
+
+def save_snapshot(filepath, file_type):
+    """Save the scene to scratch disk and upload it in the background.
+
+    The scene is renamed to a path in a new folder in the scratch
+    directory, keeping the workfile name, saved and then renamed back to
+    `filepath`. The save callbacks, like the node id generation, run as for
+    a regular save.
+
+    Args:
+        filepath (str): The workfile path to save to.
+        file_type (str): The Maya file type, e.g. "mayaBinary".
+
+    """
+    snapshot_dir = get_snapshot_dir()
+    if not os.path.isdir(snapshot_dir):
+        os.makedirs(snapshot_dir)
+
+    # A folder per save so the scene keeps the workfile name
+    local_dir = tempfile.mkdtemp(prefix="snapshot_", dir=snapshot_dir)
+    local_path = os.path.join(
+        local_dir, os.path.basename(filepath)).replace("\\", "/")
+
+    start = time.perf_counter()
+    with _writing_snapshot_context():
+        cmds.file(rename=local_path)
+        try:
+            cmds.file(save=True, type=file_type)
+        finally:
+            cmds.file(rename=filepath)
+    # Renaming back marks the scene as modified. The scene matches the
+    # snapshot, when the upload fails it is marked as modified again.
+    cmds.file(modified=False)
+
+    metrics = {
+        "path": filepath,
+        "size": os.path.getsize(local_path),
+        "local_write": time.perf_counter() - start,
+        "upload": None,
+        "error": None
+    }
+    with _metrics_lock:
+        _metrics.append(metrics)
+        del _metrics[:-MAX_METRICS]
+    log.info("Saved workfile snapshot to {} in {:.2f}s".format(
+        local_path, metrics["local_write"]))
+
+    generation = _bump_generation(filepath)
+    future = _get_executor().submit(
+        _upload, local_path, filepath, metrics, generation)
+    _pending_uploads[future] = (filepath, local_path)
+    future.add_done_callback(
+        lambda done_future: _pending_uploads.pop(done_future, None))
+
+
+def supersede_uploads(filepath, timeout=UPLOAD_TIMEOUT):
+    """Prevent pending uploads from overwriting a direct save of `filepath`.
+
+    Queued uploads to the path are cancelled and a running upload is
+    waited for, up to the timeout. Should the running upload not finish in
+    time it skips replacing the workfile.
+
+    Args:
+        filepath (str): The workfile path about to be saved directly.
+        timeout (float): Seconds to wait for a running upload.
+
+    """
+    _bump_generation(filepath)
+    for future, (path, local_path) in list(_pending_uploads.items()):
+        if path != filepath or future.cancel():
+            continue
+        try:
+            future.result(timeout=timeout)
+        except Exception:
+            log.warning("Upload of the snapshot {} to {} did not finish in "
+                        "time.".format(local_path, filepath))
+
+
+def wait_for_uploads(timeout=UPLOAD_TIMEOUT):
+    """Block until all pending uploads are finished.
+
+    Args:
+        timeout (Optional[float]): Seconds to wait, None waits without
+            a limit.
+
+    Returns:
+        bool: Whether all uploads finished within the timeout.
+
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    for future in list(_pending_uploads):
+        remaining = None
+        if deadline is not None:
+            remaining = max(0.0, deadline - time.monotonic())
+        try:
+            future.result(timeout=remaining)
+        except Exception:
+            return False
+    return True
+
+
+def get_failed_uploads():
+    """Return the workfile path, snapshot path and error of failed uploads."""
+    with _metrics_lock:
+        return list(_failed_uploads)
+
+
+def _on_upload_failed():
+    # The workfile does not match the scene
+    cmds.file(modified=True)
+    report_failed_uploads()
+
+
+def report_failed_uploads(include_pending=False):
+    """Show a blocking error for uploads that failed since the last report.
+
+    Args:
+        include_pending (bool): Also report the uploads that are still
+            running, e.g. after waiting for them timed out.
+
+    Returns:
+        bool: Whether any failed uploads were reported.
+
+    """
+    with _metrics_lock:
+        failed = list(_failed_uploads)
+        del _failed_uploads[:]
+    if include_pending:
+        failed.extend(
+            (filepath, local_path, "The upload is still running.")
+            for filepath, local_path in list(_pending_uploads.values())
+        )
+    if not failed:
+        return False
+
+    message = "Failed to upload workfile snapshots:\n\n{}".format(
+        "\n\n".join(
+            "{}\nThe snapshot is kept at: {}\n{}".format(
+                filepath, local_path, error)
+            for filepath, local_path, error in failed
+        )
+    )
+    log.error(message)
+    if not cmds.about(batch=True):
+        cmds.confirmDialog(title="Workfile upload failed",
+                           message=message,
+                           button=["OK"],
+                           icon="critical")
+    return True
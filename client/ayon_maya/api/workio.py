@@ -2,6 +2,8 @@
 import os
 from maya import cmds
 
+from . import workfile_snapshot
+
 
 def file_extensions():
     return [".ma", ".mb"]
@@ -18,6 +20,12 @@ def save_file(filepath):
         file_type = "mayaBinary"
     else:
         file_type = "mayaAscii"
+    if (
+        workfile_snapshot.is_snapshot_save_enabled()
+        and workfile_snapshot.can_save_snapshot()
+    ):
+        workfile_snapshot.save_snapshot(filepath, file_type)
+        return
     cmds.file(save=True, type=file_type)
 
 
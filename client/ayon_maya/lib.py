@@ -1,4 +1,6 @@
 import os
+import re
+import struct
 from ayon_core.settings import get_project_settings
 from ayon_core.lib import Logger
 
@@ -23,3 +25,282 @@ def create_workspace_mel(workdir, project_name, project_settings=None):
 
     with open(dst_filepath, "w") as mel_file:
         mel_file.write(mel_script)
+
+
+class MayaSceneHeader(object):
+    """Information from the header of a Maya scene file.
+
+    Attributes:
+        requires (list[tuple[str, str]]): Name and version of required
+            plug-ins, excluding Maya itself.
+        references (list[dict]): Top level references with their "path",
+            "namespace", "reference_node", "type" and "deferred" state.
+        units (dict[str, str]): The "linear", "angle" and "time" units.
+        file_info (dict[str, str]): The `fileInfo` entries.
+
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.requires = []
+        self.references = []
+        self.units = {}
+        self.file_info = {}
+
+    def __repr__(self):
+        return "<{} {}>".format(self.__class__.__name__, self.path)
+
+
+# MEL statements that can appear in the header of a Maya ASCII file
+_MAYA_ASCII_HEADER_COMMANDS = {"file", "requires", "currentUnit", "fileInfo"}
+# Flags of `file` that take no argument, all other flags take one argument
+_MAYA_ASCII_FILE_BOOL_FLAGS = {"-r", "-reference"}
+_MAYA_ASCII_UNIT_FLAGS = {
+    "-l": "linear", "-linear": "linear",
+    "-a": "angle", "-angle": "angle",
+    "-t": "time", "-time": "time",
+}
+
+
+def _tokenize_mel(statement):
+    """Split a MEL statement into tokens, unquoting string tokens."""
+    tokens = []
+    for token in re.findall(r'"(?:[^"\\]|\\.)*"|[^\s;]+', statement):
+        if token.startswith('"'):
+            token = token[1:-1].replace('\\"', '"').replace("\\\\", "\\")
+        tokens.append(token)
+    return tokens
+
+
+def _is_complete_statement(statement):
+    """Return whether the statement ends with a `;` outside a string."""
+    if not statement.endswith(";"):
+        return False
+    quotes = len(re.findall(r'(?<!\\)"', statement))
+    return quotes % 2 == 0
+
+
+def _iter_maya_ascii_header_statements(f):
+    """Yield the tokens of the header statements of a Maya ASCII file.
+
+    Reading stops at the first statement that is not a header statement.
+
+    """
+    statement = ""
+    for line in f:
+        stripped = line.strip()
+        if not statement:
+            if not stripped or stripped.startswith("//"):
+                continue
+            if stripped.split(None, 1)[0] not in _MAYA_ASCII_HEADER_COMMANDS:
+                # End of the header
+                return
+            statement = stripped
+        else:
+            statement += " " + stripped
+
+        if _is_complete_statement(statement):
+            yield _tokenize_mel(statement)
+            statement = ""
+
+
+def _split_flags(tokens, bool_flags=frozenset()):
+    """Return flags with their argument and the positional arguments."""
+    flags = {}
+    positional = []
+    tokens = iter(tokens)
+    for token in tokens:
+        if token.startswith("-") and not token[1:].replace(".", "").isdigit():
+            if token in bool_flags:
+                flags[token] = True
+            else:
+                flags[token] = next(tokens, None)
+            continue
+        positional.append(token)
+    return flags, positional
+
+
+def read_maya_ascii_header(path):
+    """Read the header of a Maya ASCII scene.
+
+    The file is streamed and reading stops at the end of the header, so
+    this takes the same time regardless of the size of the scene.
+
+    Args:
+        path (str): Path to the `.ma` file.
+
+    Returns:
+        MayaSceneHeader: The header information.
+
+    """
+    header = MayaSceneHeader(path)
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        for tokens in _iter_maya_ascii_header_statements(f):
+            command = tokens[0]
+            if command == "requires":
+                _flags, positional = _split_flags(tokens[1:])
+                if len(positional) >= 2 and positional[0] != "maya":
+                    header.requires.append((positional[0], positional[1]))
+
+            elif command == "file":
+                flags, positional = _split_flags(
+                    tokens[1:], _MAYA_ASCII_FILE_BOOL_FLAGS
+                )
+                # Only the top level references, `-rdi` statements describe
+                # the reference depth of all references
+                if not (flags.get("-r") or flags.get("-reference")):
+                    continue
+                if not positional:
+                    continue
+                header.references.append({
+                    "path": positional[-1],
+                    "namespace": flags.get("-ns", flags.get("-namespace")),
+                    "reference_node": flags.get(
+                        "-rfn", flags.get("-referenceNode")),
+                    "type": flags.get("-typ", flags.get("-type")),
+                    "deferred": flags.get(
+                        "-dr", flags.get("-deferReference")) == "1"
+                })
+
+            elif command == "currentUnit":
+                flags, _positional = _split_flags(tokens[1:])
+                for flag, value in flags.items():
+                    if flag in _MAYA_ASCII_UNIT_FLAGS:
+                        header.units[_MAYA_ASCII_UNIT_FLAGS[flag]] = value
+
+            elif command == "fileInfo":
+                _flags, positional = _split_flags(tokens[1:])
+                if len(positional) >= 2:
+                    header.file_info[positional[0]] = positional[1]
+
+    return header
+
+
+# Chunks of the header of a Maya Binary file
+_MAYA_BINARY_GROUP_TAGS = {
+    b"FOR4", b"FOR8", b"LIST", b"LIS4", b"LIS8", b"CAT4", b"CAT8"
+}
+_MAYA_BINARY_UNIT_TAGS = {b"LUNI": "linear", b"AUNI": "angle", b"TUNI": "time"}
+
+
+def _split_null_strings(data):
+    return [
+        value.decode("utf-8", errors="replace")
+        for value in data.rstrip(b"\0").split(b"\0")
+    ]
+
+
+def read_maya_binary_header(path):
+    """Read the header of a Maya Binary scene.
+
+    Maya Binary files are IFF files with 32-bit (`FOR4`) or 64-bit (`FOR8`)
+    chunks. Only the chunks of the `HEAD` group and the file reference
+    (`FREF`) chunks before the first node are read, so this takes the same
+    time regardless of the size of the scene.
+
+    Args:
+        path (str): Path to the `.mb` file.
+
+    Returns:
+        MayaSceneHeader: The header information.
+
+    Raises:
+        ValueError: When the file is not a Maya Binary file.
+
+    """
+    header = MayaSceneHeader(path)
+    with open(path, "rb") as f:
+        tag = f.read(4)
+        if tag == b"FOR4":
+            size_format, alignment = ">I", 4
+        elif tag == b"FOR8":
+            size_format, alignment = ">Q", 8
+            f.read(4)  # padding
+        else:
+            raise ValueError("Not a Maya Binary file: {}".format(path))
+        size_length = struct.calcsize(size_format)
+        f.read(size_length)  # size of the file
+        if f.read(4) != b"Maya":
+            raise ValueError("Not a Maya Binary file: {}".format(path))
+
+        in_head = False
+        head_end = None
+        while True:
+            if head_end is not None and f.tell() >= head_end:
+                in_head = False
+                head_end = None
+
+            tag = f.read(4)
+            if len(tag) < 4:
+                break
+            if alignment == 8:
+                f.read(4)  # padding
+            size = struct.unpack(size_format, f.read(size_length))[0]
+
+            if tag in _MAYA_BINARY_GROUP_TAGS:
+                form_type = f.read(4)
+                if form_type == b"HEAD":
+                    # Step into the header group
+                    in_head = True
+                    head_end = f.tell() + size - 4
+                    continue
+                if form_type == b"FREF":
+                    # Step into the file reference group
+                    continue
+                # The first node ends the header
+                break
+
+            data = f.read(size)
+            # Skip padding to the chunk alignment
+            f.seek((alignment - size % alignment) % alignment, os.SEEK_CUR)
+
+            if tag == b"PLUG":
+                values = _split_null_strings(data)
+                if len(values) >= 2:
+                    header.requires.append((values[0], values[1]))
+            elif tag == b"FINF":
+                values = _split_null_strings(data)
+                if len(values) >= 2:
+                    header.file_info[values[0]] = values[1]
+            elif tag in _MAYA_BINARY_UNIT_TAGS:
+                header.units[_MAYA_BINARY_UNIT_TAGS[tag]] = (
+                    _split_null_strings(data)[0]
+                )
+            elif tag == b"FREF":
+                values = _split_null_strings(data)
+                if values and values[0]:
+                    header.references.append({
+                        "path": values[0],
+                        "namespace": None,
+                        "reference_node": None,
+                        "type": None,
+                        "deferred": False
+                    })
+            elif not in_head:
+                break
+
+    return header
+
+
+def read_maya_scene_header(path):
+    """Read the header of a Maya ASCII or Maya Binary scene.
+
+    This allows inspecting the required plug-ins, references, units and
+    file info of a scene without opening it.
+
+    Args:
+        path (str): Path to the `.ma` or `.mb` file.
+
+    Returns:
+        MayaSceneHeader: The header information.
+
+    Raises:
+        ValueError: When the file is not a Maya scene.
+
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".ma":
+        return read_maya_ascii_header(path)
+    elif ext == ".mb":
+        return read_maya_binary_header(path)
+    raise ValueError("Not a Maya scene file: {}".format(path))
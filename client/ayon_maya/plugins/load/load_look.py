@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
 """Look loader."""
 import json
-from collections import defaultdict
 
 import ayon_maya.api.plugin
 from ayon_api import get_representation_by_name
@@ -110,9 +109,7 @@ class LookLoader(ayon_maya.api.plugin.ReferenceLoader):
         attributes = json_data.get("attributes", [])
 
         # region compute lookup
-        nodes_by_id = defaultdict(list)
-        for node in nodes:
-            nodes_by_id[lib.get_id(node)].append(node)
+        nodes_by_id = lib.get_nodes_by_id(nodes)
         lib.apply_attributes(attributes, nodes_by_id)
 
     def _get_nodes_with_shader(self, shader_nodes):
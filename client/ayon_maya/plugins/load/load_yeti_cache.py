@@ -52,6 +52,9 @@ class YetiCacheLoader(plugin.Loader):
     icon = "code-fork"
     color = "orange"
 
+    # Cache file names per node, e.g. `node.0001.fur` or a `node.fur` snapshot
+    R_CACHE_FILE = re.compile(r"^(?P<name>[^.]+)(\.[0-9]+)?(\.fur)$")
+
     def load(self, context, name=None, namespace=None, data=None):
         """Loads a .fursettings file defining how to load .fur sequences
 
@@ -267,7 +270,28 @@ class YetiCacheLoader(plugin.Loader):
 
         return namespace
 
-    def get_cache_node_filepath(self, root, node_name):
+    def get_cache_files_by_name(self, root):
+        """Return the cache files in a folder grouped by node name.
+
+        The folder is listed once, so looking up the files for many yeti
+        nodes does not require scanning the folder per node.
+
+        Args:
+            root(str): Folder containing cache files.
+
+        Returns:
+            dict: Cache file names per node name, e.g.
+                {"yeti_node": ["yeti_node.0001.fur", "yeti_node.0002.fur"]}
+
+        """
+        files_by_name = defaultdict(list)
+        for fname in os.listdir(root):
+            match = self.R_CACHE_FILE.match(fname)
+            if match:
+                files_by_name[match.group("name")].append(fname)
+        return files_by_name
+
+    def get_cache_node_filepath(self, root, node_name, files_by_name=None):
         """Get the cache file path for one of the yeti nodes.
 
         All caches with more than 1 frame need cache file name set with `%04d`
@@ -280,20 +304,23 @@ class YetiCacheLoader(plugin.Loader):
         Args:
             root(str): Folder containing cache files to search in.
             node_name(str): Node name to search cache files for
+            files_by_name(dict, optional): Cache files in `root` per node
+                name as returned by `get_cache_files_by_name`. When not
+                provided the folder is listed.
 
         Returns:
             str: Cache file path value needed for cacheFileName attribute
 
         """
+        if files_by_name is None:
+            files_by_name = self.get_cache_files_by_name(root)
 
         name = node_name.replace(":", "_")
-        pattern = r"^({name})(\.[0-9]+)?(\.fur)$".format(name=re.escape(name))
-
-        files = [fname for fname in os.listdir(root) if re.match(pattern,
-                                                                 fname)]
+        files = files_by_name.get(name)
         if not files:
             self.log.error("Could not find cache files for '{}' "
-                           "with pattern {}".format(node_name, pattern))
+                           "with pattern {}".format(
+                               node_name, self.R_CACHE_FILE.pattern))
             return
 
         if len(files) == 1:
@@ -338,8 +365,10 @@ class YetiCacheLoader(plugin.Loader):
                                     name=shape_name,
                                     parent=transform_node)
 
-        lib.set_id(transform_node, node_settings["transform"]["cbId"])
-        lib.set_id(yeti_node, node_settings["cbId"])
+        lib.set_ids({
+            transform_node: node_settings["transform"]["cbId"],
+            yeti_node: node_settings["cbId"]
+        })
 
         nodes.extend([transform_node, yeti_node])
 
@@ -386,9 +415,13 @@ class YetiCacheLoader(plugin.Loader):
 
         # Compute the cache file name values we want to set for the nodes
         root = os.path.dirname(path)
+        files_by_name = self.get_cache_files_by_name(root)
         for node in fur_settings["nodes"]:
             cache_filename = self.get_cache_node_filepath(
-                root=root, node_name=node["name"])
+                root=root,
+                node_name=node["name"],
+                files_by_name=files_by_name
+            )
 
             attrs = node.get("attrs", {})       # allow 'attrs' to not exist
             attrs["cacheFileName"] = cache_filename
@@ -0,0 +1,22 @@
+import pyblish.api
+from ayon_maya.api import cmds_tracing, plugin
+
+
+class CollectCmdsTrace(plugin.MayaContextPlugin):
+    """Start tracing `maya.cmds` calls for this publish.
+
+    Only enabled when the `AYON_MAYA_TRACE_CMDS` environment variable is set.
+    The trace is written out by `WriteCmdsTrace` at the end of the publish.
+
+    """
+
+    label = "Start maya.cmds Trace"
+    order = pyblish.api.CollectorOrder - 0.5
+
+    @classmethod
+    def apply_settings(cls, project_settings):
+        cls.enabled = cmds_tracing.is_tracing_enabled()
+
+    def process(self, context):
+        cmds_tracing.start_tracing()
+        self.log.info("Tracing maya.cmds calls..")
@@ -1,15 +1,34 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 from maya import cmds
-from ayon_maya.api import plugin
+from ayon_maya.api import lib, plugin
 import pyblish.api
 
 
 class CollectFileDependencies(plugin.MayaContextPlugin):
-    """Gather all files referenced in this scene."""
+    """Gather all files referenced in this scene.
+
+    The referenced paths are expanded to the files on disk, e.g. the tiles
+    of file nodes with a UV tiling mode and image sequences, and the size
+    and modification time of each file is stored in `fileDependenciesInfo`
+    so the total transfer volume and any missing files are known before
+    submission.
+    """
 
     label = "Collect File Dependencies"
     order = pyblish.api.CollectorOrder - 0.49
     families = ["renderlayer"]
 
+    # Amount of threads used to search and stat the files on disk
+    max_workers = 16
+
+    # Attribute holding the file path per node type, `file` nodes are
+    # handled separately to include their tile and frame tokens
+    path_attributes = {
+        "AlembicNode": "abc_File",
+    }
+
     @classmethod
     def apply_settings(cls, project_settings):
         # Disable plug-in if not used for deadline submission anyway
@@ -26,14 +45,82 @@ class CollectFileDependencies(plugin.MayaContextPlugin):
 
     def process(self, context):
         dependencies = set()
-        for node in cmds.ls(type="file"):
-            path = cmds.getAttr("{}.{}".format(node, "fileTextureName"))
-            if path not in dependencies:
-                dependencies.add(path)
+        file_nodes = cmds.ls(type="file")
+        if file_nodes:
+            paths = lib.get_file_texture_patterns(file_nodes)
+            dependencies.update(path for path in paths.values() if path)
+
+        for node_type, attribute in self.path_attributes.items():
+            nodes = cmds.ls(type=node_type)
+            if not nodes:
+                continue
+            values = lib.get_string_attribute_values(nodes, attribute)
+            dependencies.update(path for path in values.values() if path)
+
+        dependencies = sorted(dependencies)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            files_per_dependency = list(
+                executor.map(self._search_files, dependencies)
+            )
+            all_files = sorted({
+                filepath
+                for files in files_per_dependency
+                for filepath in files
+            })
+            stats_by_file = dict(
+                zip(all_files, executor.map(self._stat, all_files))
+            )
+
+        dependencies_info = []
+        missing = []
+        total_size = 0
+        for path, files in zip(dependencies, files_per_dependency):
+            files_info = []
+            for filepath in files:
+                stat = stats_by_file[filepath]
+                if stat is None:
+                    continue
+                files_info.append({
+                    "path": filepath,
+                    "size": stat.st_size,
+                    "mtime": stat.st_mtime
+                })
+
+            size = sum(file_info["size"] for file_info in files_info)
+            total_size += size
+            if not files_info:
+                missing.append(path)
+
+            dependencies_info.append({
+                "path": path,
+                "files": files_info,
+                "size": size,
+                "exists": bool(files_info)
+            })
+
+        if missing:
+            self.log.warning(
+                "Missing file dependencies:\n{}".format("\n".join(missing))
+            )
+        self.log.debug(
+            "Found {} file dependencies, {} files on disk, {:.2f} MB".format(
+                len(dependencies), len(all_files), total_size / 1024 ** 2
+            )
+        )
+
+        context.data["fileDependencies"] = dependencies
+        context.data["fileDependenciesInfo"] = dependencies_info
+        context.data["fileDependenciesSize"] = total_size
+        context.data["fileDependenciesMissing"] = missing
 
-        for node in cmds.ls(type="AlembicNode"):
-            path = cmds.getAttr("{}.{}".format(node, "abc_File"))
-            if path not in dependencies:
-                dependencies.add(path)
+    def _search_files(self, path):
+        """Return the files on disk for a path with dynamic patterns."""
+        path = os.path.expandvars(path)
+        return lib.get_texture_files(path)
 
-        context.data["fileDependencies"] = list(dependencies)
+    @staticmethod
+    def _stat(path):
+        try:
+            return os.stat(path)
+        except OSError:
+            return None
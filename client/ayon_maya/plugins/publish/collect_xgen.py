@@ -2,7 +2,7 @@ import os
 
 import pyblish.api
 from ayon_maya.api.lib import get_attribute_input
-from ayon_maya.api import plugin
+from ayon_maya.api import plugin, file_transfer
 from maya import cmds
 
 
@@ -54,16 +54,15 @@ class CollectXgen(plugin.MayaInstancePlugin):
         predicted_palette_name = data["xgmPalette"].split(":")[-1]
         predicted_palette_name = predicted_palette_name.replace("|", "")
 
-        for root, _, files in os.walk(data_path):
-            for file in files:
-                source = os.path.join(root, file).replace("\\", "/")
-                destination = os.path.join(
-                    instance.data["resourcesDir"],
-                    "collections",
-                    predicted_palette_name,
-                    source.replace(data_path, "")[1:]
-                )
-                transfers.append((source, destination.replace("\\", "/")))
+        for source, _stat in file_transfer.iter_files(data_path):
+            source = source.replace("\\", "/")
+            destination = os.path.join(
+                instance.data["resourcesDir"],
+                "collections",
+                predicted_palette_name,
+                source.replace(data_path, "")[1:]
+            )
+            transfers.append((source, destination.replace("\\", "/")))
 
         data["transfers"] = transfers
 
@@ -3,7 +3,14 @@ import os
 from collections import defaultdict
 
 import arnold
+from ayon_core.pipeline import KnownPublishError
 from ayon_maya.api import lib, plugin
+from ayon_maya.api.mayapy_workers import (
+    WorkerJob,
+    run_command_in_workers,
+    scene_snapshot,
+    split_frame_range,
+)
 from maya import cmds
 
 
@@ -14,6 +21,12 @@ class ExtractArnoldSceneSource(plugin.MayaExtractorPlugin):
     families = ["ass"]
     asciiAss = False
 
+    # Export frame chunks in parallel in background `mayapy` processes
+    parallel_export = False
+    parallel_workers = 4
+    # Sequences with less frames per worker are exported in the session
+    min_frames_per_worker = 10
+
     def _pre_process(self, instance, staging_dir):
         file_path = os.path.join(staging_dir, "{}.ass".format(instance.name))
 
@@ -138,6 +151,10 @@ class ExtractArnoldSceneSource(plugin.MayaExtractorPlugin):
     def _extract(self, nodes, attribute_data, kwargs):
         filenames = []
         with lib.attribute_values(attribute_data):
+            chunks = self._get_frame_chunks(kwargs)
+            if len(chunks) > 1:
+                return self._extract_parallel(nodes, kwargs, chunks)
+
             with lib.maintained_selection():
                 self.log.debug(
                     "Writing: {}".format(nodes)
@@ -157,6 +174,68 @@ class ExtractArnoldSceneSource(plugin.MayaExtractorPlugin):
 
         return filenames
 
+    def _get_frame_chunks(self, kwargs):
+        """Return the frame ranges to export in parallel workers."""
+        if not self.parallel_export:
+            return []
+        return split_frame_range(
+            kwargs["startFrame"],
+            kwargs["endFrame"],
+            kwargs["frameStep"],
+            chunk_count=self.parallel_workers,
+            min_frames=self.min_frames_per_worker
+        )
+
+    def _extract_parallel(self, nodes, kwargs, chunks):
+        """Export frame chunks in parallel from a snapshot of the scene.
+
+        The snapshot is saved with the current attribute values, so any
+        attribute overrides for the export are included.
+
+        """
+        jobs = []
+        for start, end in chunks:
+            chunk_kwargs = dict(kwargs)
+            chunk_kwargs["startFrame"] = start
+            chunk_kwargs["endFrame"] = end
+            jobs.append(WorkerJob(
+                label="{}-{}".format(start, end),
+                kwargs=chunk_kwargs,
+                selection=cmds.ls(nodes, long=True)
+            ))
+
+        self.log.debug(
+            "Extracting ass sequence in {} workers with: {}".format(
+                len(jobs), kwargs)
+        )
+        with scene_snapshot() as scene:
+            results = run_command_in_workers(
+                scene,
+                "arnoldExportAss",
+                jobs,
+                plugins=["mtoa"],
+                max_workers=self.parallel_workers,
+                logger=self.log
+            )
+
+        failed = [result for result in results if result.error]
+        if failed:
+            for result in failed:
+                self.log.error("Frames {} failed:\n{}".format(
+                    result.job.label, result.error))
+            raise KnownPublishError(
+                "Failed to export frames: {}".format(
+                    ", ".join(result.job.label for result in failed))
+            )
+
+        filenames = []
+        for result in results:
+            for file in result.result:
+                filenames.append(os.path.split(file)[1])
+
+        self.log.debug("Exported: {}".format(filenames))
+        return filenames
+
 
 class ExtractArnoldSceneSourceProxy(ExtractArnoldSceneSource):
     """Extract the content of the instance to an Arnold Scene Source file."""
@@ -6,7 +6,7 @@ import os
 
 from ayon_core.lib import BoolDef
 from ayon_core.pipeline import publish
-from ayon_maya.api import lib
+from ayon_maya.api import ascii_filters, lib
 from ayon_maya.api import plugin
 from maya import cmds
 
@@ -19,22 +19,7 @@ def massage_ma_file(path):
     of Fusion (6.4)
 
     """
-    # Get open file's lines
-    f = open(path, "r+")
-    lines = f.readlines()
-    f.seek(0)  # reset to start of file
-
-    # Rewrite the file
-    for line in lines:
-        # Skip all 'rename -uid' lines
-        stripped = line.strip()
-        if stripped.startswith("rename -uid "):
-            continue
-
-        f.write(line)
-
-    f.truncate()  # remove remainder
-    f.close()
+    ascii_filters.filter_ascii_file(path, [ascii_filters.strip_rename_uid])
 
 
 def grouper(iterable, n, fillvalue=None):
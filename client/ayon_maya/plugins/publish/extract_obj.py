@@ -44,7 +44,7 @@ def get_textures_from_mtl(mtl_filepath: str) -> "set[str]":
     folder = os.path.dirname(mtl_filepath)
     filepaths = set()
     with open(mtl_filepath, "r", encoding='utf-8') as f:
-        for line in f.readlines():
+        for line in f:
             if line.startswith(map_prefixes):
                 line = line.strip()  # strip of end of line
                 filename = line.rsplit(" ", 1)[-1]
@@ -4,7 +4,7 @@ import shutil
 
 import pyblish.api
 from ayon_maya.api.alembic import extract_alembic
-from ayon_maya.api import plugin
+from ayon_maya.api import plugin, file_transfer
 from maya import cmds
 
 
@@ -208,15 +208,13 @@ class ExtractWorkfileXgen(plugin.MayaExtractorPlugin):
             data_path = xgenm.getAttr("xgDataPath", palette)
             data_path = data_path.replace("${PROJECT}", project_path)
             for path in data_path.split(";"):
-                for root, _, files in os.walk(path):
-                    for f in files:
-                        source = os.path.join(root, f)
-                        destination = "{}/{}{}".format(
-                            destination_dir,
-                            palette.replace(":", "__ns__"),
-                            source.replace(path, "")
-                        )
-                        transfers.append((source, destination))
+                for source, _stat in file_transfer.iter_files(path):
+                    destination = "{}/{}{}".format(
+                        destination_dir,
+                        palette.replace(":", "__ns__"),
+                        source.replace(path, "")
+                    )
+                    transfers.append((source, destination))
 
         for source, destination in transfers:
             self.log.debug("Transfer: {} > {}".format(source, destination))
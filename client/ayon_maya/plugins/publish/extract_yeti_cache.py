@@ -1,7 +1,17 @@
 import json
 import os
+import re
+import shutil
+from collections import defaultdict
 
+from ayon_core.pipeline import KnownPublishError
 from ayon_maya.api import plugin
+from ayon_maya.api.mayapy_workers import (
+    WorkerJob,
+    run_command_in_workers,
+    scene_snapshot,
+    split_frame_range,
+)
 from maya import cmds
 
 
@@ -14,6 +24,18 @@ class ExtractYetiCache(plugin.MayaExtractorPlugin):
     label = "Extract Yeti Cache"
     families = ["yetiRig", "yeticache"]
 
+    # Write frame chunks in parallel in background `mayapy` processes
+    parallel_export = False
+    parallel_workers = 4
+    # Sequences with less frames per worker are written in the session
+    min_frames_per_worker = 10
+    # Frames simulated before each chunk after the first so the dynamics
+    # settle, the instance's preroll is used when it is longer
+    chunk_warmup_frames = 10
+
+    # Cache file names written for `<NAME>.%04d.fur`
+    R_CACHE_FILE = re.compile(r"^(?P<name>.+)\.(?P<frame>-?\d+)\.fur$")
+
     def process(self, instance):
 
         yeti_nodes = cmds.ls(instance, type="pgYetiMaya")
@@ -42,14 +64,20 @@ class ExtractYetiCache(plugin.MayaExtractorPlugin):
         # Start writing the files for snap shot
         # <NAME> will be replace by the Yeti node name
         path = os.path.join(dirname, "<NAME>.%04d.fur")
-        cmds.pgYetiCommand(yeti_nodes,
-                           writeCache=path,
-                           range=(start_frame, end_frame),
-                           updateViewport=False,
-                           generatePreview=False,
-                           **kwargs)
+        chunks = self.get_frame_chunks(start_frame, end_frame)
+        if len(chunks) > 1:
+            self.write_cache_parallel(
+                yeti_nodes, dirname, chunks, preroll, kwargs)
+        else:
+            cmds.pgYetiCommand(yeti_nodes,
+                               writeCache=path,
+                               range=(start_frame, end_frame),
+                               updateViewport=False,
+                               generatePreview=False,
+                               **kwargs)
 
-        cache_files = [x for x in os.listdir(dirname) if x.endswith(".fur")]
+        cache_files = self.get_cache_files(
+            dirname, len(yeti_nodes), start_frame, end_frame)
 
         self.log.debug("Writing metadata file")
         settings = instance.data["fursettings"]
@@ -86,3 +114,126 @@ class ExtractYetiCache(plugin.MayaExtractorPlugin):
         )
 
         self.log.debug("Extracted {} to {}".format(instance, dirname))
+
+    def get_frame_chunks(self, start_frame, end_frame):
+        """Return the frame ranges to write in parallel workers."""
+        if not self.parallel_export:
+            return []
+        if self.chunk_warmup_frames < 1:
+            self.log.warning(
+                "Chunk warm-up frames must be at least 1 for parallel "
+                "export, writing the cache in the session.")
+            return []
+        return split_frame_range(
+            int(start_frame),
+            int(end_frame),
+            chunk_count=self.parallel_workers,
+            min_frames=self.min_frames_per_worker
+        )
+
+    def write_cache_parallel(self, yeti_nodes, dirname, chunks, preroll,
+                             kwargs):
+        """Write the cache frame chunks in parallel workers.
+
+        Each chunk is written to its own folder starting warm-up frames
+        before the chunk, `chunk_warmup_frames` or the instance's `preroll`
+        when longer, so simulations have settled at its first frame. Only
+        the chunk's own frames are moved to `dirname`. The first chunk
+        already starts with the instance's preroll, so it is kept whole.
+
+        """
+        warmup = max(self.chunk_warmup_frames, preroll)
+        jobs = []
+        for index, (start, end) in enumerate(chunks):
+            chunk_dir = os.path.join(dirname, "chunk_{}".format(index))
+            os.makedirs(chunk_dir)
+            chunk_start = start - warmup if index > 0 else start
+            chunk_kwargs = dict(kwargs)
+            chunk_kwargs.update({
+                "writeCache": os.path.join(
+                    chunk_dir, "<NAME>.%04d.fur").replace("\\", "/"),
+                "range": (chunk_start, end),
+                "updateViewport": False,
+                "generatePreview": False
+            })
+            jobs.append(WorkerJob(
+                label="{}-{}".format(start, end),
+                args=cmds.ls(yeti_nodes, long=True),
+                kwargs=chunk_kwargs
+            ))
+
+        self.log.debug(
+            "Writing cache in {} workers".format(len(jobs)))
+        try:
+            with scene_snapshot() as scene:
+                results = run_command_in_workers(
+                    scene,
+                    "pgYetiCommand",
+                    jobs,
+                    plugins=["pgYetiMaya"],
+                    max_workers=self.parallel_workers,
+                    logger=self.log
+                )
+
+            failed = [result for result in results if result.error]
+            if failed:
+                for result in failed:
+                    self.log.error("Frames {} failed:\n{}".format(
+                        result.job.label, result.error))
+                raise KnownPublishError(
+                    "Failed to write Yeti cache frames: {}".format(
+                        ", ".join(result.job.label for result in failed))
+                )
+
+            for index, (start, end) in enumerate(chunks):
+                chunk_dir = os.path.join(dirname, "chunk_{}".format(index))
+                for filename in os.listdir(chunk_dir):
+                    match = self.R_CACHE_FILE.match(filename)
+                    if not match:
+                        continue
+                    # Skip the preroll frames of the chunk
+                    if index > 0 and int(match.group("frame")) < start:
+                        continue
+                    os.replace(os.path.join(chunk_dir, filename),
+                               os.path.join(dirname, filename))
+        finally:
+            for index in range(len(chunks)):
+                shutil.rmtree(os.path.join(dirname, "chunk_{}".format(index)),
+                              ignore_errors=True)
+
+    def get_cache_files(self, dirname, node_count, start_frame, end_frame):
+        """Return the written cache files, validating all frames exist.
+
+        Raises:
+            KnownPublishError: When cache files are missing for any of the
+                Yeti nodes or frames.
+
+        """
+        frames_by_name = defaultdict(set)
+        cache_files = []
+        for filename in os.listdir(dirname):
+            match = self.R_CACHE_FILE.match(filename)
+            if not match:
+                continue
+            frames_by_name[match.group("name")].add(int(match.group("frame")))
+            cache_files.append(filename)
+
+        if len(frames_by_name) < node_count:
+            raise KnownPublishError(
+                "Yeti cache files were written for {} of {} Yeti nodes "
+                "in: {}".format(len(frames_by_name), node_count, dirname)
+            )
+
+        expected = set(range(int(start_frame), int(end_frame) + 1))
+        errors = []
+        for name, frames in sorted(frames_by_name.items()):
+            missing = sorted(expected - frames)
+            if missing:
+                errors.append("{}: {}".format(
+                    name, ", ".join(str(frame) for frame in missing)))
+        if errors:
+            raise KnownPublishError(
+                "Missing Yeti cache frames:\n{}".format("\n".join(errors))
+            )
+
+        return sorted(cache_files)
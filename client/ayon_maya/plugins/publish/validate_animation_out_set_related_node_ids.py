@@ -10,6 +10,7 @@ from ayon_core.pipeline.publish import (
 )
 from ayon_maya.api import lib
 from ayon_maya.api import plugin
+from ayon_maya.api.scene_index import get_scene_node_index
 
 
 class ValidateOutRelatedNodeIds(plugin.MayaInstancePlugin,
@@ -80,17 +81,17 @@ class ValidateOutRelatedNodeIds(plugin.MayaInstancePlugin,
 
         # get asset id
         nodes = instance.data.get("out_hierarchy", instance[:])
-        for node in cmds.ls(nodes, type=types, long=True):
-
-            # We only check when the node is *not* referenced
-            if cmds.referenceQuery(node, isNodeReferenced=True):
-                continue
-
-            # Get the current id of the node
-            node_id = lib.get_id(node)
-
+        # We only check when the node is *not* referenced
+        nodes = [
+            node for node in cmds.ls(nodes, type=types, long=True)
+            if not cmds.referenceQuery(node, isNodeReferenced=True)
+        ]
+
+        # Get the current ids of the nodes, cached for the publish
+        ids_by_node = get_scene_node_index(instance.context).get_ids(nodes)
+        for node in nodes:
             history_id = lib.get_id_from_sibling(node)
-            if history_id is not None and node_id != history_id:
+            if history_id is not None and ids_by_node[node] != history_id:
                 invalid.append(node)
 
         return invalid
@@ -98,6 +99,7 @@ class ValidateOutRelatedNodeIds(plugin.MayaInstancePlugin,
     @classmethod
     def repair(cls, instance):
 
+        node_ids = {}
         for node in cls.get_invalid(instance):
             # Get the original id from history
             history_id = lib.get_id_from_sibling(node)
@@ -105,4 +107,7 @@ class ValidateOutRelatedNodeIds(plugin.MayaInstancePlugin,
                 cls.log.error("Could not find ID in history for '%s'", node)
                 continue
 
-            lib.set_id(node, history_id, overwrite=True)
+            node_ids[node] = history_id
+
+        lib.set_ids(node_ids, overwrite=True)
+        get_scene_node_index(instance.context).invalidate(node_ids)
@@ -79,5 +79,11 @@ class ValidateArnoldSceneSourceCbid(plugin.MayaInstancePlugin,
 
     @classmethod
     def repair(cls, instance):
-        for content_node, proxy_node in cls.get_invalid_couples(instance):
-            lib.set_id(proxy_node, lib.get_id(content_node), overwrite=True)
+        lib.set_ids(
+            {
+                proxy_node: lib.get_id(content_node)
+                for content_node, proxy_node
+                in cls.get_invalid_couples(instance)
+            },
+            overwrite=True
+        )
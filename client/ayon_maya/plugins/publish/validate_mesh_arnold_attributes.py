@@ -6,13 +6,13 @@ from ayon_core.pipeline.publish import (
     ValidateMeshOrder,
 )
 from ayon_maya.api.lib import (
-    delete_after,
-    get_attribute,
     maintained_selection,
     set_attribute,
     undo_chunk,
 )
 from ayon_maya.api import plugin
+from ayon_maya.api.attribute_snapshot import get_attribute_snapshot
+from ayon_maya.api.renderer_defaults import get_renderer_attribute_defaults
 from maya import cmds
 
 
@@ -35,35 +35,12 @@ class ValidateMeshArnoldAttributes(plugin.MayaInstancePlugin,
 
     optional = True
 
-    # cache (will be `dict` when cached)
-    arnold_mesh_defaults = None
-
     @classmethod
     def get_default_attributes(cls):
-
-        if cls.arnold_mesh_defaults is not None:
-            # Use from cache
-            return cls.arnold_mesh_defaults
-
-        # Get default arnold attribute values for mesh type.
-        defaults = {}
-        with delete_after() as tmp:
-            transform = cmds.createNode("transform", skipSelect=True)
-            tmp.append(transform)
-
-            mesh = cmds.createNode("mesh", parent=transform, skipSelect=True)
-            arnold_attributes = cmds.listAttr(mesh,
-                                              string="ai*",
-                                              fromPlugin=True) or []
-            for attr in arnold_attributes:
-                plug = "{}.{}".format(mesh, attr)
-                try:
-                    defaults[attr] = get_attribute(plug)
-                except PublishValidationError:
-                    cls.log.debug("Ignoring arnold attribute: {}".format(attr))
-
-        cls.arnold_mesh_defaults = defaults  # assign cache
-        return defaults
+        # Get default arnold attribute values for mesh type. These are read
+        # from the node class and cached per MtoA version, so no mesh needs
+        # to be created in the scene.
+        return get_renderer_attribute_defaults("arnold", node_type="mesh")
 
     @classmethod
     def get_invalid_attributes(cls, instance, compute=False):
@@ -77,11 +54,11 @@ class ValidateMeshArnoldAttributes(plugin.MayaInstancePlugin,
 
             # Compare the values against the defaults
             defaults = cls.get_default_attributes()
-            for mesh in meshes:
-                for attr_name, default_value in defaults.items():
-                    plug = "{}.{}".format(mesh, attr_name)
-                    if get_attribute(plug) != default_value:
-                        invalid.append(plug)
+            snapshot = get_attribute_snapshot(instance.context)
+            for mesh, states in snapshot.read(meshes, defaults).items():
+                for attr_name, state in states.items():
+                    if state.value != defaults[attr_name]:
+                        invalid.append("{}.{}".format(mesh, attr_name))
 
             instance.data["nondefault_arnold_attributes"] = invalid
 
@@ -101,14 +78,24 @@ class ValidateMeshArnoldAttributes(plugin.MayaInstancePlugin,
                 attributes = cls.get_invalid_attributes(
                     instance, compute=False
                 )
+                values = {}
                 for attr in attributes:
                     node, attr_name = attr.split(".", 1)
-                    value = defaults[attr_name]
-                    set_attribute(
-                        node=node,
-                        attribute=attr_name,
-                        value=value
-                    )
+                    values[(node, attr_name)] = defaults[attr_name]
+
+                snapshot = get_attribute_snapshot(instance.context)
+                try:
+                    snapshot.set_values(values)
+                except TypeError:
+                    # Fall back to setting the values one by one when any
+                    # attribute is not supported by the modifier
+                    for (node, attr_name), value in values.items():
+                        set_attribute(
+                            node=node,
+                            attribute=attr_name,
+                            value=value
+                        )
+                    snapshot.invalidate(node for node, _ in values)
 
     def process(self, instance):
         if not self.is_active(instance.data):
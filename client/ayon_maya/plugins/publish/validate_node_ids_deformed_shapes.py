@@ -69,6 +69,7 @@ class ValidateNodeIdsDeformedShape(plugin.MayaInstancePlugin):
     @classmethod
     def repair(cls, instance):
 
+        node_ids = {}
         for node in cls.get_invalid(instance):
             # Get the original id from history
             history_id = lib.get_id_from_sibling(node)
@@ -76,4 +77,6 @@ class ValidateNodeIdsDeformedShape(plugin.MayaInstancePlugin):
                 cls.log.error("Could not find ID in history for '%s'", node)
                 continue
 
-            lib.set_id(node, history_id, overwrite=True)
+            node_ids[node] = history_id
+
+        lib.set_ids(node_ids, overwrite=True)
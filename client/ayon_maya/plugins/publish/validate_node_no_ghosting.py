@@ -5,6 +5,7 @@ from ayon_core.pipeline.publish import (
     ValidateContentsOrder,
 )
 from ayon_maya.api import plugin
+from ayon_maya.api.attribute_snapshot import get_attribute_snapshot
 from maya import cmds
 
 
@@ -34,17 +35,12 @@ class ValidateNodeNoGhosting(plugin.MayaInstancePlugin,
 
         # Transforms and shapes seem to have ghosting
         nodes = cmds.ls(instance, long=True, type=['transform', 'shape'])
+        snapshot = get_attribute_snapshot(instance.context)
         invalid = []
-        for node in nodes:
-            _iteritems = getattr(
-                cls._attributes, "iteritems", cls._attributes.items
-            )
-            for attr, required_value in _iteritems():
-                if cmds.attributeQuery(attr, node=node, exists=True):
-
-                    value = cmds.getAttr('{0}.{1}'.format(node, attr))
-                    if value != required_value:
-                        invalid.append(node)
+        for node, states in snapshot.read(nodes, cls._attributes).items():
+            for attr, state in states.items():
+                if state.value != cls._attributes[attr]:
+                    invalid.append(node)
 
         return invalid
 
@@ -0,0 +1,202 @@
+import inspect
+import math
+import platform
+import re
+from collections import defaultdict
+
+import pyblish.api
+from ayon_core.pipeline.publish import (
+    OptionalPyblishPluginMixin,
+    PublishValidationError,
+    context_plugin_should_run,
+)
+from ayon_maya.api import plugin
+
+
+class ValidateRenderExpectedFiles(plugin.MayaContextPlugin,
+                                  OptionalPyblishPluginMixin):
+    """Validate expected render files do not collide across all layers.
+
+    Two render products, cameras or render layers writing to the same file
+    path for the same frame would overwrite each other on the farm. Output
+    paths must also not contain unresolved tokens or illegal characters.
+
+    Only actual collisions are caught. Whether the image file prefix holds
+    the `<RenderLayer>`, `<RenderPass>` or `<Camera>` tokens is not checked
+    here, that is done by `ValidateRenderSettings`. A prefix without them
+    passes as long as the resolved paths do not collide.
+
+    Instead of comparing all expanded frame paths this reduces each render
+    product to its file path template, e.g. `beauty/shot.####.exr`, and its
+    frame range. The check then scales with the amount of render products
+    instead of the amount of frames.
+
+    """
+
+    label = "Render Expected Files"
+    order = pyblish.api.ValidatorOrder
+    families = ["renderlayer"]
+    optional = True
+
+    # Tokens that were not substituted when generating the expected files
+    R_UNRESOLVED_TOKEN = re.compile(r"<[^<>/\\]*>|%\d*[a-zA-Z]")
+    # Characters invalid in file paths on any of the farm's platforms
+    R_ILLEGAL_CHARACTERS = re.compile(r'[<>"|?*\x00-\x1f]')
+    # Colons are only invalid on Windows, apart from the drive letter
+    R_ILLEGAL_WINDOWS_CHARACTERS = re.compile(r"(?<!^[a-zA-Z]):")
+
+    def process(self, context):
+        if not self.is_active(context.data):
+            return
+        # Workaround bug pyblish-base#250
+        if not context_plugin_should_run(self, context):
+            return
+
+        products_by_template = defaultdict(list)
+        errors = []
+        for instance in context:
+            if not self.is_active_render_instance(instance):
+                continue
+
+            frame_range = (
+                int(instance.data["frameStartHandle"]),
+                int(instance.data["frameEndHandle"]),
+                int(instance.data.get("byFrameStep") or 1)
+            )
+            for product_name, files in self.iter_product_files(instance):
+                if not files:
+                    continue
+
+                template = self.get_file_template(files[0], frame_range[0])
+                label = "{} > {}".format(
+                    instance.data["renderlayer"], product_name or "<main>"
+                )
+                errors.extend(self.get_template_errors(label, template))
+
+                # Paths are compared case-insensitive since the farm may
+                # render to a case-insensitive file system
+                key = template.replace("\\", "/").lower()
+                products_by_template[key].append(
+                    (label, template, frame_range)
+                )
+
+        for products in products_by_template.values():
+            for index, (label, template, frame_range) in enumerate(products):
+                for other_label, _, other_range in products[index + 1:]:
+                    if self.frames_overlap(frame_range, other_range):
+                        errors.append(
+                            "{} and {} both write to: {}".format(
+                                label, other_label, template)
+                        )
+
+        if errors:
+            for error in errors:
+                self.log.error(error)
+            raise PublishValidationError(
+                "Invalid expected render files found:\n{}".format(
+                    "\n".join(errors)
+                ),
+                description=self.get_description()
+            )
+
+    @staticmethod
+    def is_active_render_instance(instance) -> bool:
+        """Return whether instance is an active renderlayer instance."""
+        if not instance.data.get("active", True):
+            return False
+        if not instance.data.get("publish", True):
+            return False
+
+        families = set()
+        families.add(instance.data.get("family"))
+        families.update(instance.data.get("families", []))
+        return "renderlayer" in families
+
+    @staticmethod
+    def iter_product_files(instance):
+        """Yield product name and expected files of the instance."""
+        for expected_files in instance.data.get("expectedFiles", []):
+            if isinstance(expected_files, dict):
+                for product_name, files in expected_files.items():
+                    yield product_name, files
+            else:
+                yield "", [expected_files]
+
+    @staticmethod
+    def get_file_template(path, frame_start):
+        """Return the file path with the frame number replaced by `#`.
+
+        Expected files are generated as `{prefix}.{frame}.{ext}` so only the
+        first file of the sequence is required to get the template.
+
+        """
+        parts = path.rsplit(".", 2)
+        if len(parts) == 3:
+            prefix, frame, ext = parts
+            if frame.isdigit() and int(frame) == frame_start:
+                return "{}.{}.{}".format(prefix, "#" * len(frame), ext)
+        return path
+
+    @classmethod
+    def get_template_errors(cls, label, template):
+        errors = []
+        for token in sorted(set(cls.R_UNRESOLVED_TOKEN.findall(template))):
+            errors.append("{} has unresolved token '{}' in: {}".format(
+                label, token, template))
+
+        # Ignore the tokens already reported and the drive letter
+        stripped = cls.R_UNRESOLVED_TOKEN.sub("", template)
+        illegal = set(cls.R_ILLEGAL_CHARACTERS.findall(stripped))
+        if platform.system().lower() == "windows":
+            illegal.update(
+                cls.R_ILLEGAL_WINDOWS_CHARACTERS.findall(stripped))
+        illegal = sorted(illegal)
+        if illegal:
+            errors.append("{} has illegal characters {} in: {}".format(
+                label, " ".join(repr(char) for char in illegal), template))
+        return errors
+
+    @staticmethod
+    def frames_overlap(range_a, range_b) -> bool:
+        """Return whether two (start, end, step) frame ranges share a frame.
+
+        This does not iterate the frames but at most the least common
+        multiple of the steps, which is tiny for the usual steps.
+
+        """
+        start_a, end_a, step_a = range_a
+        start_b, end_b, step_b = range_b
+        low = max(start_a, start_b)
+        high = min(end_a, end_b)
+        if low > high:
+            return False
+
+        # First frame of range A inside the overlapping interval
+        frame = start_a + -(-(low - start_a) // step_a) * step_a
+        period = step_a * step_b // math.gcd(step_a, step_b)
+        last = min(high, frame + period - 1)
+        while frame <= last:
+            if (frame - start_b) % step_b == 0:
+                return True
+            frame += step_a
+        return False
+
+    def get_description(self):
+        return inspect.cleandoc(
+            """### Expected render files invalid
+
+            Some of the expected render output files are invalid.
+
+            - **Collisions**: Multiple render layers, cameras or AOVs write
+              to the same file. Make sure the image file prefix contains
+              the `<RenderLayer>`, `<Camera>` and `<RenderPass>` tokens
+              where needed.
+            - **Unresolved tokens**: The image file prefix contains tokens
+              that are not supported for the expected files.
+            - **Illegal characters**: The output path contains characters
+              that are not allowed in file paths.
+
+            See the logs for the offending render products.
+
+            """
+        )
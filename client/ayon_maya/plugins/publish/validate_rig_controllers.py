@@ -7,6 +7,10 @@ from ayon_core.pipeline.publish import (
 )
 from ayon_maya.api.lib import undo_chunk
 from ayon_maya.api import plugin
+from ayon_maya.api.attribute_snapshot import (
+    AttributeSnapshot,
+    get_attribute_snapshot,
+)
 from maya import cmds
 
 
@@ -81,20 +85,21 @@ class ValidateRigControllers(plugin.MayaInstancePlugin,
             return [controls_set]
 
         # Validate all controls
+        snapshot = get_attribute_snapshot(instance.context)
+        visibility_states = snapshot.read(controls, ["visibility"])
         has_connections = list()
         has_unlocked_visibility = list()
         has_non_default_values = list()
         for control in controls:
-            if cls.get_connected_attributes(control):
+            if cls.get_connected_attributes(control, snapshot):
                 has_connections.append(control)
 
             # check if visibility is locked
-            attribute = "{}.visibility".format(control)
-            locked = cmds.getAttr(attribute, lock=True)
-            if not locked:
+            visibility = visibility_states[control].get("visibility")
+            if visibility is not None and not visibility.locked:
                 has_unlocked_visibility.append(control)
 
-            if cls.get_non_default_attributes(control):
+            if cls.get_non_default_attributes(control, snapshot):
                 has_non_default_values.append(control)
 
         if has_connections:
@@ -123,69 +128,64 @@ class ValidateRigControllers(plugin.MayaInstancePlugin,
         return invalid
 
     @classmethod
-    def get_non_default_attributes(cls, control):
+    def get_non_default_attributes(cls, control, snapshot=None):
         """Return attribute plugs with non-default values
 
         Args:
             control (str): Name of control node.
+            snapshot (Optional[AttributeSnapshot]): The snapshot to read
+                the attributes from. A new snapshot is used if not provided.
 
         Returns:
             list: The invalid plugs
 
         """
+        if snapshot is None:
+            snapshot = AttributeSnapshot()
 
         invalid = []
-        for attr, default in cls.CONTROLLER_DEFAULTS.items():
-            if cmds.attributeQuery(attr, node=control, exists=True):
-                plug = "{}.{}".format(control, attr)
-
-                # Ignore locked attributes
-                locked = cmds.getAttr(plug, lock=True)
-                if locked:
-                    continue
+        states = snapshot.read([control], cls.CONTROLLER_DEFAULTS)[control]
+        for attr, state in states.items():
+            # Ignore locked attributes
+            if state.locked:
+                continue
 
-                value = cmds.getAttr(plug)
-                if value != default:
-                    cls.log.warning("Control non-default value: "
-                                    "%s = %s" % (plug, value))
-                    invalid.append(plug)
+            if state.value != cls.CONTROLLER_DEFAULTS[attr]:
+                plug = "{}.{}".format(control, attr)
+                cls.log.warning("Control non-default value: "
+                                "%s = %s" % (plug, state.value))
+                invalid.append(plug)
 
         return invalid
 
     @staticmethod
-    def get_connected_attributes(control):
+    def get_connected_attributes(control, snapshot=None):
         """Return attribute plugs with incoming connections.
 
         This will also ensure no (driven) keys on unlocked keyable attributes.
 
         Args:
             control (str): Name of control node.
+            snapshot (Optional[AttributeSnapshot]): The snapshot to read
+                the attributes from. A new snapshot is used if not provided.
 
         Returns:
             list: The invalid plugs
 
         """
-        import maya.cmds as mc
+        if snapshot is None:
+            snapshot = AttributeSnapshot()
 
-        # Support controls without any attributes returning None
-        attributes = mc.listAttr(control, keyable=True, scalar=True) or []
         invalid = []
-        for attr in attributes:
-            plug = "{}.{}".format(control, attr)
-
-            # Ignore locked attributes
-            locked = cmds.getAttr(plug, lock=True)
-            if locked:
-                continue
-
-            # Ignore proxy connections.
-            if (cmds.addAttr(plug, query=True, exists=True) and
-                    cmds.addAttr(plug, query=True, usedAsProxy=True)):
+        states = snapshot.read_keyable([control])[control]
+        for attr, state in states.items():
+            # Ignore locked attributes and proxy connections.
+            if state.locked or state.proxy:
                 continue
 
             # Check for incoming connections
-            if cmds.listConnections(plug, source=True, destination=False):
-                invalid.append(plug)
+            if state.connected:
+                invalid.append("{}.{}".format(control, attr))
 
         return invalid
 
@@ -203,6 +203,8 @@ class ValidateRigControllers(plugin.MayaInstancePlugin,
         # Use a single undo chunk
         with undo_chunk():
             controls = cmds.sets(controls_set, query=True)
+            snapshot = get_attribute_snapshot(instance.context)
+            snapshot.invalidate()
             for control in controls:
 
                 # Lock visibility
@@ -213,7 +215,7 @@ class ValidateRigControllers(plugin.MayaInstancePlugin,
                     cmds.setAttr(attr, lock=True)
 
                 # Remove incoming connections
-                invalid_plugs = cls.get_connected_attributes(control)
+                invalid_plugs = cls.get_connected_attributes(control, snapshot)
                 if invalid_plugs:
                     for plug in invalid_plugs:
                         cls.log.info("Breaking input connection to %s" % plug)
@@ -223,14 +225,18 @@ class ValidateRigControllers(plugin.MayaInstancePlugin,
                                                       plugs=True)[0]
                         cmds.disconnectAttr(source, plug)
 
-                # Reset non-default values
-                invalid_plugs = cls.get_non_default_attributes(control)
-                if invalid_plugs:
-                    for plug in invalid_plugs:
-                        attr = plug.split(".")[-1]
-                        default = cls.CONTROLLER_DEFAULTS[attr]
-                        cls.log.info("Setting %s to %s" % (plug, default))
-                        cmds.setAttr(plug, default)
+            # Reset non-default values after breaking the connections
+            snapshot.invalidate()
+            values = {}
+            for control in controls:
+                invalid_plugs = cls.get_non_default_attributes(
+                    control, snapshot)
+                for plug in invalid_plugs:
+                    attr = plug.split(".")[-1]
+                    default = cls.CONTROLLER_DEFAULTS[attr]
+                    cls.log.info("Setting %s to %s" % (plug, default))
+                    values[(control, attr)] = default
+            snapshot.set_values(values)
 
     @classmethod
     def get_node(cls, instance):
@@ -10,6 +10,7 @@ from ayon_core.pipeline.publish import (
 )
 from ayon_maya.api import lib
 from ayon_maya.api import plugin
+from ayon_maya.api.scene_index import get_scene_node_index
 
 
 class ValidateRigOutSetNodeIds(plugin.MayaInstancePlugin,
@@ -88,21 +89,22 @@ class ValidateRigOutSetNodeIds(plugin.MayaInstancePlugin,
                          long=True,
                          noIntermediate=True)
 
+        # Ids are cached for the publish, shared with the other validators
+        ids_by_shape = get_scene_node_index(instance.context).get_ids(shapes)
         for shape in shapes:
             sibling_id = lib.get_id_from_sibling(
                 shape,
                 history_only=cls.allow_history_only
             )
-            if sibling_id:
-                current_id = lib.get_id(shape)
-                if current_id != sibling_id:
-                    invalid.append(shape)
+            if sibling_id and ids_by_shape[shape] != sibling_id:
+                invalid.append(shape)
 
         return invalid
 
     @classmethod
     def repair(cls, instance):
 
+        node_ids = {}
         for node in cls.get_invalid(instance):
             # Get the original id from sibling
             sibling_id = lib.get_id_from_sibling(
@@ -113,7 +115,10 @@ class ValidateRigOutSetNodeIds(plugin.MayaInstancePlugin,
                 cls.log.error("Could not find ID in siblings for '%s'", node)
                 continue
 
-            lib.set_id(node, sibling_id, overwrite=True)
+            node_ids[node] = sibling_id
+
+        lib.set_ids(node_ids, overwrite=True)
+        get_scene_node_index(instance.context).invalidate(node_ids)
 
     @classmethod
     def get_node(cls, instance):
@@ -1,21 +1,15 @@
-from collections import defaultdict
-
 import ayon_maya.api.action
 from ayon_core.pipeline.publish import (
     PublishValidationError,
     RepairAction,
     ValidateContentsOrder,
 )
-from ayon_maya.api.lib import get_id, set_id
+from ayon_maya.api.lib import get_id, set_ids
 from ayon_maya.api import plugin
+from ayon_maya.api.scene_index import get_basename, get_scene_node_index
 from maya import cmds
 
 
-def get_basename(node):
-    """Return node short name without namespace"""
-    return node.rsplit("|", 1)[-1].rsplit(":", 1)[-1]
-
-
 class ValidateRigOutputIds(plugin.MayaInstancePlugin):
     """Validate rig output ids.
 
@@ -63,24 +57,29 @@ class ValidateRigOutputIds(plugin.MayaInstancePlugin):
                 if shapes:
                     instance_nodes.extend(shapes)
 
-            scene_nodes = cmds.ls(type="transform", long=True)
-            scene_nodes += cmds.ls(type="mesh", long=True)
-            scene_nodes = set(scene_nodes) - set(instance_nodes)
-
-            scene_nodes_by_basename = defaultdict(list)
-            for node in scene_nodes:
-                basename = get_basename(node)
-                scene_nodes_by_basename[basename].append(node)
-
+            # Match against the scene index shared by all instances of
+            # the publish instead of listing the scene per instance
+            index = get_scene_node_index(instance.context)
+            excluded = set(instance_nodes)
+            matches_by_node = {}
             for instance_node in instance_nodes:
                 basename = get_basename(instance_node)
-                if basename not in scene_nodes_by_basename:
-                    continue
-
-                matches = scene_nodes_by_basename[basename]
-
-                ids = set(get_id(node) for node in matches)
-                ids.add(get_id(instance_node))
+                matches = [
+                    node for node in index.get_nodes_by_basename(basename)
+                    if node not in excluded
+                ]
+                if matches:
+                    matches_by_node[instance_node] = matches
+
+            # Read the ids of only the matched nodes in bulk
+            ids_by_node = index.get_ids(
+                node
+                for instance_node, matches in matches_by_node.items()
+                for node in [instance_node] + matches
+            )
+            for instance_node, matches in matches_by_node.items():
+                ids = set(ids_by_node[node] for node in matches)
+                ids.add(ids_by_node[instance_node])
 
                 if len(ids) > 1:
                     cls.log.error(
@@ -101,6 +100,7 @@ class ValidateRigOutputIds(plugin.MayaInstancePlugin):
         invalid_matches = cls.get_invalid_matches(instance)
 
         multiple_ids_match = []
+        node_ids = {}
         for instance_node, matches in invalid_matches.items():
             ids = set(get_id(node) for node in matches)
 
@@ -111,8 +111,12 @@ class ValidateRigOutputIds(plugin.MayaInstancePlugin):
                                            "matches": matches})
                 continue
 
-            id_to_set = next(iter(ids))
-            set_id(instance_node, id_to_set, overwrite=True)
+            node_ids[instance_node] = next(iter(ids))
+
+        set_ids(node_ids, overwrite=True)
+
+        # Ids have changed, so their cached ids must be read again
+        get_scene_node_index(instance.context).invalidate(node_ids)
 
         if multiple_ids_match:
             raise PublishValidationError(
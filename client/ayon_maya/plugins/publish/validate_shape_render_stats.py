@@ -6,6 +6,7 @@ from ayon_core.pipeline.publish import (
     ValidateMeshOrder,
 )
 from ayon_maya.api import plugin
+from ayon_maya.api.attribute_snapshot import get_attribute_snapshot
 from maya import cmds
 
 
@@ -34,13 +35,13 @@ class ValidateShapeRenderStats(plugin.MayaInstancePlugin,
         # It seems the "surfaceShape" and those derived from it have
         # `renderStat` attributes.
         shapes = cmds.ls(instance, long=True, type='surfaceShape')
+        snapshot = get_attribute_snapshot(instance.context)
         invalid = set()
-        for shape in shapes:
-            for attr, default_value in cls.defaults.items():
-                if cmds.attributeQuery(attr, node=shape, exists=True):
-                    value = cmds.getAttr('{}.{}'.format(shape, attr))
-                    if value != default_value:
-                        invalid.add(shape)
+        for shape, states in snapshot.read(shapes, cls.defaults).items():
+            for attr, state in states.items():
+                if state.value != cls.defaults[attr]:
+                    invalid.add(shape)
+                    break
 
         return invalid
 
@@ -76,10 +77,14 @@ class ValidateShapeRenderStats(plugin.MayaInstancePlugin,
 
     @classmethod
     def repair(cls, instance):
-        for shape in cls.get_invalid(instance):
-            for attr, default_value in cls.defaults.items():
-                if cmds.attributeQuery(attr, node=shape, exists=True):
-                    plug = '{0}.{1}'.format(shape, attr)
-                    value = cmds.getAttr(plug)
-                    if value != default_value:
-                        cmds.setAttr(plug, default_value)
+        snapshot = get_attribute_snapshot(instance.context)
+        snapshot.invalidate()
+
+        shapes = cls.get_invalid(instance)
+        values = {}
+        for shape, states in snapshot.read(shapes, cls.defaults).items():
+            for attr, state in states.items():
+                default_value = cls.defaults[attr]
+                if state.value != default_value:
+                    values[(shape, attr)] = default_value
+        snapshot.set_values(values)
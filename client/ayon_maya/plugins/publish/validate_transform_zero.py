@@ -7,6 +7,7 @@ from ayon_core.pipeline.publish import (
     ValidateContentsOrder,
 )
 from ayon_maya.api import plugin
+from ayon_maya.api.attribute_snapshot import get_attribute_snapshot
 from maya import cmds
 
 
@@ -49,13 +50,18 @@ class ValidateTransformZero(plugin.MayaInstancePlugin,
 
         """
 
-        transforms = cmds.ls(instance, type="transform")
+        transforms = [
+            transform for transform in cmds.ls(instance, type="transform")
+            if not ('_LOC' in transform or '_loc' in transform)
+        ]
+
+        # The local `matrix` attribute is the object space matrix
+        snapshot = get_attribute_snapshot(instance.context)
+        states = snapshot.read(transforms, ["matrix"])
 
         invalid = []
         for transform in transforms:
-            if ('_LOC' in transform) or ('_loc' in transform):
-                continue
-            mat = cmds.xform(transform, q=1, matrix=True, objectSpace=True)
+            mat = states[transform]["matrix"].value
             if not all(abs(x - y) < cls._tolerance
                        for x, y in zip(cls._identity, mat)):
                 invalid.append(transform)
@@ -0,0 +1,24 @@
+import pyblish.api
+from ayon_maya.api import cmds_tracing, plugin
+
+
+class WriteCmdsTrace(plugin.MayaContextPlugin):
+    """Stop tracing `maya.cmds` calls and write the folded stacks file.
+
+    Only enabled when the `AYON_MAYA_TRACE_CMDS` environment variable is set.
+    When the publish fails before this plug-in, the tracer is stopped by the
+    pyblish callbacks of `cmds_tracing.register_callbacks`.
+
+    """
+
+    label = "Write maya.cmds Trace"
+    order = pyblish.api.IntegratorOrder + 10
+
+    @classmethod
+    def apply_settings(cls, project_settings):
+        cls.enabled = cmds_tracing.is_tracing_enabled()
+
+    def process(self, context):
+        path = cmds_tracing.stop_tracing()
+        if path:
+            context.data["mayaCmdsTracePath"] = path
@@ -1,31 +1,58 @@
 import os
 
-from ayon_core.settings import get_project_settings
-from ayon_core.pipeline import install_host, get_current_project_name
-from ayon_maya.api import MayaHost
+from ayon_maya import startup_profiling
+
+if startup_profiling.is_profiling_enabled():
+    startup_profiling.start_profiling()
+
+with startup_profiling.phase("import ayon_maya.api"):
+    from ayon_core.pipeline import install_host
+    from ayon_maya.api import MayaHost
 
 from maya import cmds
 
 
 host = MayaHost()
-install_host(host)
+with startup_profiling.phase("install host"):
+    install_host(host)
 
 print("Starting AYON usersetup...")
 
-project_name = get_current_project_name()
-settings = get_project_settings(project_name)
+# Share the project settings fetched on install
+settings = host.project_settings
+
+# Open Workfile Post Initialization.
+key = "AYON_OPEN_WORKFILE_POST_INITIALIZATION"
+open_workfile = bool(int(os.environ.get(key, "0")))
 
 # Loading plugins explicitly.
 explicit_plugins_loading = settings["maya"]["explicit_plugins_loading"]
 if explicit_plugins_loading["enabled"]:
+    from ayon_maya.api.plugin_loading import (
+        PluginLoadScheduler,
+        get_workfile_required_plugins,
+    )
+
+    scheduler = PluginLoadScheduler(
+        explicit_plugins_loading["plugins_to_load"]
+    )
+    required = None
+    if explicit_plugins_loading.get("defer_unrequired"):
+        required = set()
+        if open_workfile:
+            required = get_workfile_required_plugins(
+                os.environ["AYON_LAST_WORKFILE"]
+            )
+    preload, deferred = scheduler.split_required(required)
+
     def _explicit_load_plugins():
-        for plugin in explicit_plugins_loading["plugins_to_load"]:
-            if plugin["enabled"]:
-                print("Loading plug-in: " + plugin["name"])
-                try:
-                    cmds.loadPlugin(plugin["name"], quiet=True)
-                except RuntimeError as e:
-                    print(e)
+        scheduler.load(preload)
+        if deferred:
+            scheduler.load_deferred(
+                deferred, on_finished=scheduler.log_load_times
+            )
+        else:
+            scheduler.log_load_times()
 
     # We need to load plugins deferred as loading them directly does not work
     # correctly due to Maya's initialization.
@@ -34,9 +61,7 @@ if explicit_plugins_loading["enabled"]:
         lowestPriority=True
     )
 
-# Open Workfile Post Initialization.
-key = "AYON_OPEN_WORKFILE_POST_INITIALIZATION"
-if bool(int(os.environ.get(key, "0"))):
+if open_workfile:
     def _log_and_open():
         path = os.environ["AYON_LAST_WORKFILE"]
         print("Opening \"{}\"".format(path))
@@ -48,3 +73,8 @@ if bool(int(os.environ.get(key, "0"))):
 
 
 print("Finished AYON usersetup.")
+
+if startup_profiling.is_profiling_enabled():
+    # Stop once Maya is idle after startup, so deferred startup work and
+    # the initialization of the UI are included in the total time
+    cmds.evalDeferred(startup_profiling.stop_profiling, lowestPriority=True)
@@ -0,0 +1,218 @@
+"""Opt-in profiling of the AYON Maya startup.
+
+Profiling is enabled by setting the `AYON_MAYA_PROFILE_STARTUP` environment
+variable to `1`. When enabled, `userSetup.py` records the time spent per
+imported module and per install phase. The report is logged and written to
+a text file in the `AYON_MAYA_PROFILE_STARTUP_DIR` environment variable
+directory, or the temp directory, when startup finished.
+
+This module must stay free of `maya` and `ayon_core` imports so it can be
+imported first, before the imports it measures.
+
+Example:
+    >>> profiler = start_profiling()
+    >>> with phase("install host"):
+    ...     install_host(host)
+    >>> stop_profiling()
+
+"""
+import os
+import sys
+import time
+import logging
+import builtins
+import tempfile
+import contextlib
+import importlib.util
+
+log = logging.getLogger(__name__)
+
+PROFILE_ENV = "AYON_MAYA_PROFILE_STARTUP"
+PROFILE_DIR_ENV = "AYON_MAYA_PROFILE_STARTUP_DIR"
+
+_active_profiler = None
+
+
+def is_profiling_enabled():
+    """Return whether startup profiling is enabled by environment."""
+    return os.getenv(PROFILE_ENV, "").lower() in {"1", "true", "yes"}
+
+
+class StartupProfiler(object):
+    """Record import time per module and duration per startup phase.
+
+    Imports are timed by wrapping `builtins.__import__`. Only imports that
+    load new modules are recorded. The inclusive time contains the time of
+    nested imports, the self time excludes it.
+
+    """
+
+    def __init__(self):
+        self._original_import = None
+        self._start = None
+        self._end = None
+        # Stack of time spent in nested imports per active import
+        self._nested = []
+        # module -> [inclusive time, self time]
+        self._imports = {}
+        # list of (phase name, duration)
+        self._phases = []
+
+    def start(self):
+        if self._original_import is not None:
+            return
+        self._start = time.perf_counter()
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._import
+
+    def stop(self):
+        if self._original_import is None:
+            return
+        builtins.__import__ = self._original_import
+        self._original_import = None
+        self._end = time.perf_counter()
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        original_import = self._original_import
+        if level == 0 and name in sys.modules:
+            return original_import(name, globals, locals, fromlist, level)
+
+        module_count = len(sys.modules)
+        self._nested.append(0.0)
+        start = time.perf_counter()
+        try:
+            return original_import(name, globals, locals, fromlist, level)
+        finally:
+            duration = time.perf_counter() - start
+            nested = self._nested.pop()
+            if self._nested:
+                self._nested[-1] += duration
+            if len(sys.modules) != module_count:
+                module_name = self._resolve_name(name, globals, level)
+                times = self._imports.setdefault(module_name, [0.0, 0.0])
+                times[0] += duration
+                times[1] += duration - nested
+
+    @staticmethod
+    def _resolve_name(name, globals, level):
+        if not level:
+            return name
+        package = (globals or {}).get("__package__") or ""
+        try:
+            return importlib.util.resolve_name("." * level + name, package)
+        except (ImportError, ValueError):
+            return "." * level + name
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        """Record the duration of a startup phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._phases.append((name, time.perf_counter() - start))
+
+    def get_import_times(self):
+        """Return the import times sorted from slowest to fastest.
+
+        Returns:
+            list[tuple[str, float, float]]: Module name, inclusive and self
+                time in seconds.
+
+        """
+        return sorted(
+            ((name, total, own)
+             for name, (total, own) in self._imports.items()),
+            key=lambda item: item[1],
+            reverse=True
+        )
+
+    def get_phase_times(self):
+        """Return the startup phases and their duration in seconds."""
+        return list(self._phases)
+
+    def get_total_time(self):
+        """Return the time from start until stop, or until now."""
+        if self._start is None:
+            return 0.0
+        end = self._end if self._end is not None else time.perf_counter()
+        return end - self._start
+
+    def format_report(self, limit=30):
+        lines = ["AYON Maya startup: {:.3f}s".format(self.get_total_time())]
+        lines.append("Phases:")
+        for name, duration in self.get_phase_times():
+            lines.append("  {:<40} {:>8.3f}s".format(name, duration))
+        lines.append("Slowest imports (inclusive / self):")
+        for name, total, own in self.get_import_times()[:limit]:
+            lines.append(
+                "  {:<56} {:>8.3f}s {:>8.3f}s".format(name, total, own))
+        return "\n".join(lines)
+
+    def write(self, path):
+        """Write the report with all imports to `path`."""
+        with open(path, "w") as f:
+            f.write(self.format_report(limit=None) + "\n")
+
+
+def start_profiling():
+    """Start profiling the startup, replacing any active profiler.
+
+    Returns:
+        StartupProfiler: The active profiler.
+
+    """
+    global _active_profiler
+    if _active_profiler is not None:
+        _active_profiler.stop()
+
+    _active_profiler = StartupProfiler()
+    _active_profiler.start()
+    return _active_profiler
+
+
+@contextlib.contextmanager
+def phase(name):
+    """Record a startup phase if profiling is active, else do nothing."""
+    if _active_profiler is None:
+        yield
+        return
+
+    with _active_profiler.phase(name):
+        yield
+
+
+def stop_profiling(output_dir=None):
+    """Stop the active profiler, log and write its report.
+
+    Args:
+        output_dir (str, optional): Directory to write to. Defaults to the
+            `AYON_MAYA_PROFILE_STARTUP_DIR` environment variable or the temp
+            directory.
+
+    Returns:
+        Union[str, None]: Path of the written file, if a profiler was active.
+
+    """
+    global _active_profiler
+    profiler = _active_profiler
+    if profiler is None:
+        return None
+    _active_profiler = None
+    profiler.stop()
+
+    output_dir = (
+        output_dir
+        or os.getenv(PROFILE_DIR_ENV)
+        or tempfile.gettempdir()
+    )
+    if not os.path.isdir(output_dir):
+        os.makedirs(output_dir)
+    path = os.path.join(
+        output_dir,
+        "maya_startup_profile_{}.txt".format(time.strftime("%Y%m%d_%H%M%S"))
+    )
+    profiler.write(path)
+    log.info(profiler.format_report())
+    log.info("Written startup profile to: %s", path)
+    return path
@@ -1,6 +1,7 @@
 import sys
 import time
 import logging
+from collections import defaultdict
 
 import ayon_api
 from qtpy import QtWidgets, QtCore
@@ -9,7 +10,7 @@ from ayon_core import style
 from ayon_core.pipeline import get_current_project_name
 from ayon_core.tools.utils.lib import qt_app_context
 from ayon_maya.api.lib import (
-    assign_look_by_version,
+    assign_looks_by_version,
     get_main_window
 )
 
@@ -218,6 +219,7 @@ class MayaLookAssignerWindow(QtWidgets.QWidget):
 
         project_name = get_current_project_name()
         start = time.time()
+        nodes_by_version_id = defaultdict(list)
         for i, (asset, item) in enumerate(asset_nodes.items()):
 
             # Label prefix
@@ -287,11 +289,14 @@ class MayaLookAssignerWindow(QtWidgets.QWidget):
                     "loaded."
                 )
 
-            # Assign look
+            # Collect look assignment to assign all looks in bulk
             if nodes:
-                assign_look_by_version(
-                    nodes, version_id=version_entity["id"]
-                )
+                nodes_by_version_id[version_entity["id"]].extend(nodes)
+
+        # Assign looks
+        if nodes_by_version_id:
+            self.echo("Assigning looks ...")
+            assign_looks_by_version(nodes_by_version_id)
 
         end = time.time()
 
@@ -5,12 +5,27 @@ class PluginsModel(BaseSettingsModel):
     _layout = "expanded"
     enabled: bool = SettingsField(title="Enabled")
     name: str = SettingsField("", title="Name")
+    priority: int = SettingsField(
+        50, title="Priority",
+        description="Plug-ins with a lower priority are loaded first."
+    )
+    dependencies: list[str] = SettingsField(
+        default_factory=list, title="Dependencies",
+        description="Plug-ins to load before this plug-in."
+    )
 
 
 class ExplicitPluginsLoadingModel(BaseSettingsModel):
     """Maya Explicit Plugins Loading."""
     _isGroup: bool = True
     enabled: bool = SettingsField(title="enabled")
+    defer_unrequired: bool = SettingsField(
+        False, title="Defer Plug-ins Not Required By Workfile",
+        description=(
+            "Load only the plug-ins required by the opened workfile before "
+            "it opens. The other plug-ins are loaded when Maya is idle."
+        )
+    )
     plugins_to_load: list[PluginsModel] = SettingsField(
         default_factory=list, title="Plugins To Load"
     )
@@ -18,6 +33,7 @@ class ExplicitPluginsLoadingModel(BaseSettingsModel):
 
 DEFAULT_EXPLITCIT_PLUGINS_LOADING_SETTINGS = {
     "enabled": False,
+    "defer_unrequired": False,
     "plugins_to_load": [
         {
             "enabled": False,
@@ -616,6 +616,41 @@ class ExtractGPUCacheModel(BaseSettingsModel):
     useBaseTessellation: bool = SettingsField(title="User Based Tessellation")
 
 
+class ParallelExtractModel(BaseSettingsModel):
+    """Export frame ranges in parallel background mayapy processes.
+
+    The scene is saved to a temporary snapshot and the frame range is split
+    into chunks that are each exported by a separate mayapy process. This
+    frees up the session quicker for long sequences at the cost of memory.
+    """
+    parallel_export: bool = SettingsField(
+        title="Parallel Export",
+        description="Export frame chunks in background mayapy processes."
+    )
+    parallel_workers: int = SettingsField(
+        4, ge=1, title="Parallel Workers",
+        description="Maximum amount of concurrent mayapy processes."
+    )
+    min_frames_per_worker: int = SettingsField(
+        10, ge=1, title="Minimum Frames Per Worker",
+        description=(
+            "Sequences with less frames per worker use less workers. "
+            "Sequences shorter than this are exported in the session."
+        )
+    )
+
+
+class ExtractYetiCacheModel(ParallelExtractModel):
+    chunk_warmup_frames: int = SettingsField(
+        10, ge=1, title="Chunk Warm-up Frames",
+        description=(
+            "Frames simulated before each parallel chunk so the fur "
+            "dynamics settle before its first frame. The instance's preroll "
+            "is used when it is longer."
+        )
+    )
+
+
 class PublishersModel(BaseSettingsModel):
     CollectMayaRender: CollectMayaRenderModel = SettingsField(
         default_factory=CollectMayaRenderModel,
@@ -735,6 +770,10 @@ class PublishersModel(BaseSettingsModel):
         default_factory=BasicValidateModel,
         title="Validate Render Single Camera "
     )
+    ValidateRenderExpectedFiles: BasicValidateModel = SettingsField(
+        default_factory=BasicValidateModel,
+        title="Validate Render Expected Files"
+    )
     ValidateRenderLayerAOVs: BasicValidateModel = SettingsField(
         default_factory=BasicValidateModel,
         title="Validate Render Passes/AOVs Are Registered"
@@ -1050,6 +1089,14 @@ class PublishersModel(BaseSettingsModel):
         default_factory=ExtractGPUCacheModel,
         title="Extract GPU Cache",
     )
+    ExtractArnoldSceneSource: ParallelExtractModel = SettingsField(
+        default_factory=ParallelExtractModel,
+        title="Extract Arnold Scene Source",
+    )
+    ExtractYetiCache: ExtractYetiCacheModel = SettingsField(
+        default_factory=ExtractYetiCacheModel,
+        title="Extract Yeti Cache",
+    )
     ExtractModel: ExtractModelModel = SettingsField(
         default_factory=ExtractModelModel,
         title="Extract Model (Maya Scene)"
@@ -1267,6 +1314,11 @@ DEFAULT_PUBLISH_SETTINGS = {
         "optional": False,
         "active": True
     },
+    "ValidateRenderExpectedFiles": {
+        "enabled": True,
+        "optional": True,
+        "active": True
+    },
     "ValidateRenderLayerAOVs": {
         "enabled": True,
         "optional": False,
@@ -1652,6 +1704,17 @@ DEFAULT_PUBLISH_SETTINGS = {
         "writeMaterials": True,
         "useBaseTessellation": True
     },
+    "ExtractArnoldSceneSource": {
+        "parallel_export": False,
+        "parallel_workers": 4,
+        "min_frames_per_worker": 10
+    },
+    "ExtractYetiCache": {
+        "parallel_export": False,
+        "parallel_workers": 4,
+        "min_frames_per_worker": 10,
+        "chunk_warmup_frames": 10
+    },
     "ExtractModel": {
         "enabled": True,
         "optional": True,
@@ -0,0 +1,13 @@
+import os
+import sys
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+CLIENT_DIR = os.path.join(os.path.dirname(TESTS_DIR), "client")
+
+for path in (TESTS_DIR, CLIENT_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+import stubs  # noqa: E402
+
+stubs.install()
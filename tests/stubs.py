@@ -0,0 +1,123 @@
+"""Stub modules to import the addon without Maya and its dependencies.
+
+Only top level modules that can not be imported are stubbed, so installed
+dependencies are used as is. Any attribute of a stubbed module is a stub
+class, calling it returns a stub instance whose attributes and calls are
+stubs again. This is enough to import the addon's modules and to test their
+pure Python parts. Tests replace the Maya functions they rely on with fakes.
+
+"""
+import sys
+import importlib.abc
+import importlib.util
+import importlib.machinery
+
+# Modules the addon imports which are only available inside Maya or in an
+# AYON launcher environment
+STUB_MODULES = (
+    "maya",
+    "ayon_core",
+    "ayon_api",
+    "pyblish",
+    "qtpy",
+    "qargparse",
+    "capture",
+    "clique",
+    "six",
+    "arrow",
+)
+
+
+class _StubMeta(type):
+    def __getattr__(cls, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return stub_class(name)
+
+
+class _Stub(object, metaclass=_StubMeta):
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return stub_class(name)
+
+    def __call__(self, *args, **kwargs):
+        return _Stub()
+
+
+def stub_class(name):
+    """Return a new stub class, distinct classes can be combined as bases."""
+    return _StubMeta(name, (_Stub,), {})
+
+
+class _StubModule(type(sys)):
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        value = stub_class(name)
+        setattr(self, name, value)
+        return value
+
+
+class _StubFinder(importlib.abc.MetaPathFinder, importlib.abc.Loader):
+    def __init__(self, names):
+        self.names = set(names)
+
+    def find_spec(self, fullname, path, target=None):
+        if fullname.split(".", 1)[0] in self.names:
+            return importlib.machinery.ModuleSpec(
+                fullname, self, is_package=True)
+        return None
+
+    def create_module(self, spec):
+        module = _StubModule(spec.name)
+        module.__path__ = []
+        return module
+
+    def exec_module(self, module):
+        pass
+
+
+def install(names=STUB_MODULES):
+    """Stub the modules of `names` that can not be imported.
+
+    Returns:
+        list[str]: The stubbed module names.
+
+    """
+    for finder in sys.meta_path:
+        if isinstance(finder, _StubFinder):
+            return sorted(finder.names)
+
+    missing = [
+        name for name in names
+        if name not in sys.modules and importlib.util.find_spec(name) is None
+    ]
+    sys.meta_path.insert(0, _StubFinder(missing))
+    if "pyblish" in missing:
+        _set_plugin_orders()
+    return missing
+
+
+def _set_plugin_orders():
+    """Set the plug-in orders used in class bodies of publish plug-ins."""
+    import pyblish.api
+    from ayon_core.pipeline import publish
+
+    orders = {
+        "CollectorOrder": 0,
+        "ValidatorOrder": 1,
+        "ExtractorOrder": 2,
+        "IntegratorOrder": 3,
+    }
+    for name, order in orders.items():
+        setattr(pyblish.api, name, order)
+
+    if isinstance(publish, _StubModule):
+        publish.ValidatePipelineOrder = orders["ValidatorOrder"] + 0.05
+        publish.ValidateContentsOrder = orders["ValidatorOrder"] + 0.1
+        publish.ValidateSceneOrder = orders["ValidatorOrder"] + 0.2
+        publish.ValidateMeshOrder = orders["ValidatorOrder"] + 0.3
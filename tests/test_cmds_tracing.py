@@ -0,0 +1,210 @@
+"""Tests of `ayon_maya.api.cmds_tracing` with a fake `maya.cmds` module.
+
+The module is loaded from its file since importing the `ayon_maya.api`
+package requires Maya.
+
+"""
+import os
+import sys
+import time
+import types
+import importlib.util
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODULE_PATH = os.path.join(
+    ROOT, "client", "ayon_maya", "api", "cmds_tracing.py"
+)
+
+
+def _load_module():
+    spec = importlib.util.spec_from_file_location(
+        "cmds_tracing", MODULE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _make_fake_cmds():
+    cmds = types.ModuleType("fake_cmds")
+
+    def ls(*args, **kwargs):
+        return list(args)
+
+    def sleep(seconds):
+        time.sleep(seconds)
+
+    def nested():
+        # Commands calling other commands are only timed once
+        return cmds.ls("a")
+
+    class NotACommand(object):
+        pass
+
+    cmds.ls = ls
+    cmds.sleep = sleep
+    cmds.nested = nested
+    cmds.NotACommand = NotACommand
+    cmds._private = ls
+    return cmds
+
+
+@pytest.fixture
+def cmds_tracing():
+    module = _load_module()
+    yield module
+    module.stop_tracing()
+
+
+@pytest.fixture
+def fake_cmds():
+    return _make_fake_cmds()
+
+
+def test_install_and_uninstall(cmds_tracing, fake_cmds):
+    original_ls = fake_cmds.ls
+    tracer = cmds_tracing.CmdsTracer(fake_cmds)
+
+    with tracer:
+        assert tracer.installed
+        assert fake_cmds.ls is not original_ls
+        assert fake_cmds.ls("a", "b") == ["a", "b"]
+        assert fake_cmds._private is original_ls
+        assert fake_cmds.NotACommand.__name__ == "NotACommand"
+
+    assert not tracer.installed
+    assert fake_cmds.ls is original_ls
+
+
+def test_command_totals(cmds_tracing, fake_cmds):
+    tracer = cmds_tracing.CmdsTracer(fake_cmds)
+    with tracer:
+        for _ in range(3):
+            fake_cmds.ls()
+        fake_cmds.nested()
+        fake_cmds.sleep(0.01)
+
+    totals = {
+        command: (count, total)
+        for command, count, total in tracer.get_command_totals()
+    }
+    assert totals["ls"][0] == 3
+    assert totals["nested"][0] == 1
+    assert totals["sleep"][0] == 1
+    assert totals["sleep"][1] >= 0.01
+
+    slowest = tracer.get_slowest_calls()
+    assert slowest[0][1] == "sleep"
+    assert slowest[0][2] == cmds_tracing.NO_PLUGIN
+
+
+def test_slowest_calls_are_limited(cmds_tracing, fake_cmds):
+    tracer = cmds_tracing.CmdsTracer(fake_cmds, slowest_count=2)
+    with tracer:
+        for _ in range(5):
+            fake_cmds.ls()
+        fake_cmds.sleep(0.01)
+
+    slowest = tracer.get_slowest_calls()
+    assert len(slowest) == 2
+    assert slowest[0][1] == "sleep"
+
+
+def test_write_folded_stacks(cmds_tracing, fake_cmds, tmp_path):
+    tracer = cmds_tracing.CmdsTracer(fake_cmds)
+    with tracer:
+        fake_cmds.ls()
+
+    path = str(tmp_path / "trace.folded")
+    tracer.write(path)
+    with open(path) as f:
+        lines = f.read().splitlines()
+
+    assert len(lines) == 1
+    stack, weight = lines[0].rsplit(" ", 1)
+    frames = stack.split(";")
+    assert frames[0] == cmds_tracing.NO_PLUGIN
+    assert frames[-1] == "cmds.ls"
+    assert int(weight) >= 0
+
+
+def test_start_tracing_replaces_active_tracer(
+    cmds_tracing, fake_cmds, tmp_path, monkeypatch
+):
+    monkeypatch.setenv(cmds_tracing.TRACE_DIR_ENV, str(tmp_path))
+    original_ls = fake_cmds.ls
+
+    first = cmds_tracing.start_tracing(fake_cmds)
+    second = cmds_tracing.start_tracing(fake_cmds)
+
+    assert not first.installed
+    assert second.installed
+    assert len(os.listdir(str(tmp_path))) == 1
+
+    assert cmds_tracing.stop_tracing() is not None
+    assert fake_cmds.ls is original_ls
+    assert cmds_tracing.stop_tracing() is None
+
+
+def test_failed_extractor_stops_tracing(
+    cmds_tracing, fake_cmds, tmp_path, monkeypatch
+):
+    import pyblish.api
+
+    monkeypatch.setenv(cmds_tracing.TRACE_DIR_ENV, str(tmp_path))
+    original_ls = fake_cmds.ls
+    collector = types.SimpleNamespace(order=pyblish.api.CollectorOrder)
+    validator = types.SimpleNamespace(order=pyblish.api.ValidatorOrder + 0.1)
+    extractor = types.SimpleNamespace(order=pyblish.api.ExtractorOrder - 0.2)
+    cmds_tracing.start_tracing(fake_cmds)
+
+    cmds_tracing._on_plugin_processed(
+        result={"plugin": extractor, "error": None})
+    assert fake_cmds.ls is not original_ls
+
+    # Publishing continues after failed collectors and validators
+    for plugin in (collector, validator):
+        cmds_tracing._on_plugin_processed(
+            result={"plugin": plugin, "error": RuntimeError()})
+        assert fake_cmds.ls is not original_ls
+
+    cmds_tracing._on_plugin_processed(
+        result={"plugin": extractor, "error": RuntimeError()})
+    assert fake_cmds.ls is original_ls
+
+
+def test_published_stops_tracing(
+    cmds_tracing, fake_cmds, tmp_path, monkeypatch
+):
+    monkeypatch.setenv(cmds_tracing.TRACE_DIR_ENV, str(tmp_path))
+    original_ls = fake_cmds.ls
+    context = types.SimpleNamespace(data={})
+    cmds_tracing.start_tracing(fake_cmds)
+
+    cmds_tracing._on_published(context=context)
+
+    assert fake_cmds.ls is original_ls
+    assert os.path.isfile(context.data["mayaCmdsTracePath"])
+
+
+def test_register_callbacks(cmds_tracing, monkeypatch):
+    callbacks = {}
+    pyblish = types.ModuleType("pyblish")
+    pyblish_api = types.ModuleType("pyblish.api")
+    pyblish_api.register_callback = (
+        lambda signal, callback: callbacks.setdefault(signal, callback))
+    pyblish_api.deregister_callback = (
+        lambda signal, callback: callbacks.pop(signal))
+    pyblish.api = pyblish_api
+    monkeypatch.setitem(sys.modules, "pyblish", pyblish)
+    monkeypatch.setitem(sys.modules, "pyblish.api", pyblish_api)
+
+    cmds_tracing.register_callbacks()
+    assert callbacks == {
+        "published": cmds_tracing._on_published,
+        "pluginProcessed": cmds_tracing._on_plugin_processed,
+    }
+
+    cmds_tracing.deregister_callbacks()
+    assert callbacks == {}
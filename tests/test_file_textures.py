@@ -0,0 +1,135 @@
+"""Tests of expanding file texture paths to the tiles and frames on disk."""
+import types
+
+import pytest
+
+from ayon_maya.api import lib
+
+
+def _touch(directory, *names):
+    for name in names:
+        (directory / name).write_bytes(b"")
+
+
+@pytest.mark.parametrize("pattern, matching, other", [
+    # Mari
+    (
+        "color.<UDIM>.exr",
+        ["color.1001.exr", "color.1012.exr"],
+        ["color.101.exr", "color.1001.tif", "bump.1001.exr"],
+    ),
+    # ZBrush, 0-based, and Mudbox, 1-based
+    (
+        "color_u<U>_v<V>.exr",
+        ["color_u0_v0.exr", "color_u1_v0.exr", "color_u10_v2.exr"],
+        ["color_u1.exr", "color_1001.exr"],
+    ),
+    # Arnold tile tokens
+    (
+        "color<tile>.exr",
+        ["color_u1_v1.exr", "color_u2_v1.exr"],
+        ["color.1001.exr"],
+    ),
+    (
+        "color.<uvtile>.exr",
+        ["color.u1_v1.exr"],
+        ["color.1001.exr"],
+    ),
+    # Image sequences
+    (
+        "mask.<f>.png",
+        ["mask.1.png", "mask.0010.png", "mask.-5.png"],
+        ["mask.png", "mask.a.png"],
+    ),
+    (
+        "mask.<f4>.png",
+        ["mask.0001.png"],
+        ["mask.png"],
+    ),
+    (
+        "mask.%04d.png",
+        ["mask.0001.png", "mask.1001.png"],
+        ["mask.png"],
+    ),
+    # Both tiles and frames
+    (
+        "color.<UDIM>.<f>.exr",
+        ["color.1001.1.exr", "color.1002.10.exr"],
+        ["color.1001.exr"],
+    ),
+])
+def test_get_texture_files(tmp_path, pattern, matching, other):
+    _touch(tmp_path, *matching + other)
+
+    files = lib.get_texture_files(str(tmp_path / pattern))
+
+    assert files == sorted(str(tmp_path / name) for name in matching)
+
+
+def test_get_texture_files_escapes_file_name(tmp_path):
+    _touch(tmp_path, "a+b (1).1001.exr", "aab (1).1001.exr")
+    assert lib.get_texture_files(str(tmp_path / "a+b (1).<UDIM>.exr")) == [
+        str(tmp_path / "a+b (1).1001.exr")
+    ]
+
+
+def test_get_texture_files_without_tokens(tmp_path):
+    _touch(tmp_path, "color.1001.exr")
+    path = str(tmp_path / "color.1001.exr")
+
+    assert lib.get_texture_files(path) == [path]
+    assert lib.get_texture_files(str(tmp_path / "missing.exr")) == []
+    assert lib.get_texture_files(
+        str(tmp_path / "missing" / "color.<UDIM>.exr")) == []
+
+
+def test_get_file_texture_patterns(monkeypatch):
+    nodes = {
+        "single": {
+            "fileTextureName": "/tex/color.1001.exr",
+            "uvTilingMode": 0,
+            "useFrameExtension": False,
+            "computedFileTextureNamePattern": "/tex/color.1001.exr",
+        },
+        "udim": {
+            "fileTextureName": "/tex/color.1001.exr",
+            "uvTilingMode": 3,
+            "useFrameExtension": False,
+            "computedFileTextureNamePattern": "/tex/color.<UDIM>.exr",
+        },
+        "sequence": {
+            "fileTextureName": "/tex/mask.0001.exr",
+            "uvTilingMode": 0,
+            "useFrameExtension": True,
+            "computedFileTextureNamePattern": "/tex/mask.<f>.exr",
+        },
+        "empty": {
+            "fileTextureName": "",
+            "uvTilingMode": 3,
+            "useFrameExtension": False,
+            "computedFileTextureNamePattern": "",
+        },
+    }
+
+    def get_string_attribute_values(node_names, attribute):
+        return {node: nodes[node][attribute] for node in node_names}
+
+    def get_attr(plug):
+        node, attribute = plug.split(".", 1)
+        return nodes[node][attribute]
+
+    monkeypatch.setattr(
+        lib, "get_string_attribute_values", get_string_attribute_values)
+    monkeypatch.setattr(lib, "cmds", types.SimpleNamespace(getAttr=get_attr))
+
+    assert lib.get_file_texture_patterns(list(nodes)) == {
+        "single": "/tex/color.1001.exr",
+        "udim": "/tex/color.<UDIM>.exr",
+        "sequence": "/tex/mask.<f>.exr",
+        "empty": "",
+    }
+
+
+def test_get_file_texture_regex_without_tokens():
+    assert lib.get_file_texture_regex("color.1001.exr") is None
+    assert lib.get_file_texture_regex("<UDIM>").match("1001")
@@ -0,0 +1,137 @@
+"""Tests of reading Maya scene headers with small `.ma` and `.mb` files."""
+import struct
+
+import pytest
+
+from ayon_maya import lib
+
+MAYA_ASCII = r'''//Maya ASCII 2024 scene
+//Name: shot.ma
+//Codeset: UTF-8
+file -rdi 1 -ns "char" -rfn "charRN" -typ "mayaAscii" "/assets/char.ma";
+file -rdi 2 -ns "prop" -rfn "char:propRN" "/assets/prop.ma";
+file -r -ns "char" -dr 1 -rfn "charRN" -typ "mayaAscii" "/assets/char.ma";
+file -r -ns "set" -rfn "setRN" -typ "mayaBinary"
+		"/assets/my set.mb";
+requires maya "2024";
+requires -nodeType "aiOptions" -nodeType "aiAOVDriver" "mtoa" "5.3.0";
+requires "stereoCamera" "10.0";
+currentUnit -l centimeter -a degree -t film;
+fileInfo "application" "maya";
+fileInfo "comment" "say \"hi\"; bye";
+createNode transform -s -n "persp";
+requires "notInHeader" "1.0";
+'''
+
+
+def _pad(data, alignment):
+    return data + b"\0" * ((alignment - len(data) % alignment) % alignment)
+
+
+class MayaBinaryWriter(object):
+    """Write IFF chunks the way Maya Binary files lay them out."""
+
+    def __init__(self, wide):
+        self.wide = wide
+        self.alignment = 8 if wide else 4
+
+    def _header(self, tag, size):
+        if self.wide:
+            return tag + b"\0" * 4 + struct.pack(">Q", size)
+        return tag + struct.pack(">I", size)
+
+    def chunk(self, tag, *values):
+        data = b"".join(value.encode("utf-8") + b"\0" for value in values)
+        return _pad(self._header(tag, len(data)) + data, self.alignment)
+
+    def group(self, form_type, *chunks):
+        tag = b"FOR8" if self.wide else b"FOR4"
+        data = form_type + b"".join(chunks)
+        return self._header(tag, len(data)) + data
+
+
+def _write_maya_binary(path, wide):
+    writer = MayaBinaryWriter(wide)
+    data = writer.group(
+        b"Maya",
+        writer.group(
+            b"HEAD",
+            writer.chunk(b"VERS", "2024"),
+            writer.chunk(b"PLUG", "mtoa", "5.3.0"),
+            writer.chunk(b"PLUG", "stereoCamera", "10.0"),
+            writer.chunk(b"FINF", "application", "maya"),
+            writer.chunk(b"FINF", "comment", "binary"),
+            writer.chunk(b"LUNI", "centimeter"),
+            writer.chunk(b"TUNI", "film"),
+            writer.chunk(b"AUNI", "degree"),
+        ),
+        writer.group(b"FREF", writer.chunk(b"FREF", "/assets/char.mb")),
+        writer.group(b"FREF", writer.chunk(b"FREF", "/assets/set.ma")),
+        writer.group(
+            b"XFRM",
+            writer.chunk(b"CREA", "persp"),
+            # Chunks after the first node are not part of the header
+            writer.chunk(b"PLUG", "notInHeader", "1.0"),
+        ),
+    )
+    path.write_bytes(data)
+
+
+def test_read_maya_ascii_header(tmp_path):
+    path = tmp_path / "shot.ma"
+    path.write_text(MAYA_ASCII)
+
+    header = lib.read_maya_scene_header(str(path))
+
+    assert header.requires == [("mtoa", "5.3.0"), ("stereoCamera", "10.0")]
+    assert header.references == [
+        {
+            "path": "/assets/char.ma",
+            "namespace": "char",
+            "reference_node": "charRN",
+            "type": "mayaAscii",
+            "deferred": True,
+        },
+        {
+            "path": "/assets/my set.mb",
+            "namespace": "set",
+            "reference_node": "setRN",
+            "type": "mayaBinary",
+            "deferred": False,
+        },
+    ]
+    assert header.units == {
+        "linear": "centimeter", "angle": "degree", "time": "film"
+    }
+    assert header.file_info == {
+        "application": "maya", "comment": 'say "hi"; bye'
+    }
+
+
+@pytest.mark.parametrize("wide", [False, True], ids=["FOR4", "FOR8"])
+def test_read_maya_binary_header(tmp_path, wide):
+    path = tmp_path / "shot.mb"
+    _write_maya_binary(path, wide)
+
+    header = lib.read_maya_scene_header(str(path))
+
+    assert header.requires == [("mtoa", "5.3.0"), ("stereoCamera", "10.0")]
+    assert [ref["path"] for ref in header.references] == [
+        "/assets/char.mb", "/assets/set.ma"
+    ]
+    assert header.units == {
+        "linear": "centimeter", "angle": "degree", "time": "film"
+    }
+    assert header.file_info == {"application": "maya", "comment": "binary"}
+
+
+def test_read_maya_binary_header_rejects_other_files(tmp_path):
+    path = tmp_path / "shot.mb"
+    path.write_bytes(b"//Maya ASCII 2024 scene\n")
+    with pytest.raises(ValueError):
+        lib.read_maya_binary_header(str(path))
+
+
+def test_read_maya_scene_header_rejects_other_extensions(tmp_path):
+    with pytest.raises(ValueError):
+        lib.read_maya_scene_header(str(tmp_path / "shot.abc"))
@@ -0,0 +1,119 @@
+"""Tests of the plug-in load order of `PluginLoadScheduler`."""
+import logging
+
+from ayon_maya.api import plugin_loading
+from ayon_maya.api.plugin_loading import PluginLoadScheduler
+
+
+def _plugin(name, priority=50, dependencies=None, enabled=True):
+    return {
+        "enabled": enabled,
+        "name": name,
+        "priority": priority,
+        "dependencies": dependencies or [],
+    }
+
+
+def test_order_by_priority_then_settings_order():
+    scheduler = PluginLoadScheduler([
+        _plugin("b", priority=50),
+        _plugin("a", priority=50),
+        _plugin("c", priority=10),
+        _plugin("d", priority=90),
+    ])
+    assert scheduler.resolve_order() == ["c", "b", "a", "d"]
+
+
+def test_disabled_plugins_are_ignored():
+    scheduler = PluginLoadScheduler([
+        _plugin("a"),
+        _plugin("b", enabled=False),
+    ])
+    assert scheduler.plugin_names == ["a"]
+    assert scheduler.resolve_order() == ["a"]
+
+
+def test_dependencies_load_before_dependents():
+    scheduler = PluginLoadScheduler([
+        _plugin("renderer", priority=0, dependencies=["core"]),
+        _plugin("core", priority=100),
+        _plugin("other", priority=50),
+    ])
+    # The dependency loads first even though its priority is lower
+    assert scheduler.resolve_order() == ["core", "renderer", "other"]
+
+
+def test_nested_dependencies():
+    scheduler = PluginLoadScheduler([
+        _plugin("a", dependencies=["b"]),
+        _plugin("b", dependencies=["c"]),
+        _plugin("c"),
+    ])
+    assert scheduler.resolve_order(["a"]) == ["c", "b", "a"]
+
+
+def test_dependency_names_ignore_extension_and_case():
+    scheduler = PluginLoadScheduler([
+        _plugin("mtoa", dependencies=["LookdevKit.mll"]),
+        _plugin("lookdevKit"),
+    ])
+    assert scheduler.resolve_order(["mtoa"]) == ["lookdevKit", "mtoa"]
+
+
+def test_dependency_not_in_settings_is_included():
+    scheduler = PluginLoadScheduler([
+        _plugin("a", dependencies=["external"]),
+    ])
+    assert scheduler.resolve_order() == ["external", "a"]
+
+
+def test_cyclic_dependencies_are_loaded_with_warning(caplog):
+    scheduler = PluginLoadScheduler([
+        _plugin("a", priority=20, dependencies=["b"]),
+        _plugin("b", priority=10, dependencies=["a"]),
+        _plugin("c", priority=30),
+    ])
+    with caplog.at_level(logging.WARNING, logger=plugin_loading.log.name):
+        order = scheduler.resolve_order()
+
+    # The plug-ins without cycles load first, then the cycle. Its plug-ins
+    # share the lowest priority, so they load in settings order.
+    assert order == ["c", "a", "b"]
+    assert "Cyclic plug-in dependencies: a, b" in caplog.text
+
+
+def test_split_required_without_requirements_loads_all():
+    scheduler = PluginLoadScheduler([_plugin("a"), _plugin("b")])
+    assert scheduler.split_required(None) == (["a", "b"], [])
+
+
+def test_split_required_preloads_required_and_dependencies():
+    scheduler = PluginLoadScheduler([
+        _plugin("heavy", priority=10),
+        _plugin("renderer", priority=20, dependencies=["core"]),
+        _plugin("core", priority=30),
+        _plugin("tool", priority=40),
+    ])
+    preload, deferred = scheduler.split_required(["Renderer.mll"])
+    assert preload == ["core", "renderer"]
+    assert deferred == ["heavy", "tool"]
+
+
+def test_workfile_required_plugins(tmp_path):
+    path = tmp_path / "scene.ma"
+    path.write_text(
+        "//Maya ASCII 2024 scene\n"
+        "requires maya \"2024\";\n"
+        "requires -nodeType \"aiOptions\" \"mtoa\" \"5.3.0\";\n"
+        "requires \"stereoCamera\" \"10.0\";\n"
+        "currentUnit -l centimeter -a degree -t film;\n"
+        "createNode transform -n \"persp\";\n"
+    )
+    assert plugin_loading.get_workfile_required_plugins(str(path)) == {
+        "mtoa", "stereoCamera"
+    }
+    assert plugin_loading.get_workfile_required_plugins(None) is None
+    assert plugin_loading.get_workfile_required_plugins(
+        str(tmp_path / "scene.abc")) is None
+    assert plugin_loading.get_workfile_required_plugins(
+        str(tmp_path / "missing.ma")) is None
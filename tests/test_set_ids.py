@@ -0,0 +1,188 @@
+"""Tests of `ayon_maya.api.lib.set_ids` with a fake Maya API."""
+import time
+import types
+
+import pytest
+
+from ayon_maya.api import lib
+
+
+class FakeScene(object):
+    """Nodes with their attributes and the modifiers applied to them."""
+
+    def __init__(self, nodes):
+        self.nodes = nodes
+        self.applied = []
+        self.undo_chunks = []
+
+
+class FakeNode(object):
+    def __init__(self, name):
+        self.name = name
+
+
+class FakePlug(object):
+    def __init__(self, node, attribute):
+        self.node = node
+        self.attribute = attribute
+
+
+def make_open_maya(scene):
+    class MSelectionList(object):
+        def __init__(self):
+            self._names = []
+
+        def clear(self):
+            self._names = []
+
+        def add(self, name):
+            self._names.append(name)
+
+        def getDependNode(self, index):
+            return FakeNode(self._names[index])
+
+    class MFnDependencyNode(object):
+        def setObject(self, node):
+            self._node = node
+
+        def hasAttribute(self, attribute):
+            return attribute in scene.nodes[self._node.name]
+
+        def findPlug(self, attribute, want_networked):
+            assert self.hasAttribute(attribute)
+            return FakePlug(self._node, attribute)
+
+    class MFnTypedAttribute(object):
+        def create(self, long_name, short_name, data_type):
+            return (long_name, data_type)
+
+    class MDGModifier(object):
+        def __init__(self):
+            self.added = []
+            self.values = []
+
+        def addAttribute(self, node, attribute):
+            self.added.append((node, attribute))
+
+        def newPlugValueString(self, plug, value):
+            self.values.append((plug, value))
+
+        def doIt(self):
+            for node, (name, _data_type) in self.added:
+                scene.nodes[node.name][name] = None
+            for plug, value in self.values:
+                attributes = scene.nodes[plug.node.name]
+                assert plug.attribute in attributes
+                attributes[plug.attribute] = value
+
+    return types.SimpleNamespace(
+        MSelectionList=MSelectionList,
+        MFnDependencyNode=MFnDependencyNode,
+        MFnTypedAttribute=MFnTypedAttribute,
+        MDGModifier=MDGModifier,
+        MFnData=types.SimpleNamespace(kString="string"),
+    )
+
+
+@pytest.fixture
+def scene(monkeypatch):
+    scene = FakeScene({})
+
+    def apply_modifier(modifier):
+        modifier.doIt()
+        scene.applied.append(modifier)
+
+    def undo_info(openChunk=False, closeChunk=False):
+        scene.undo_chunks.append("open" if openChunk else "close")
+
+    monkeypatch.setattr(lib, "OpenMaya", make_open_maya(scene))
+    monkeypatch.setattr(lib, "apply_modifier", apply_modifier)
+    monkeypatch.setattr(lib, "cmds", types.SimpleNamespace(undoInfo=undo_info))
+    return scene
+
+
+def test_adds_attributes_and_sets_values(scene):
+    scene.nodes.update({"a": {}, "b": {}, "c": {"cbId": "old"}})
+
+    count = lib.set_ids({"a": "id_a", "b": "id_b", "c": "id_c"})
+
+    assert count == 2
+    assert scene.nodes == {
+        "a": {"cbId": "id_a"},
+        "b": {"cbId": "id_b"},
+        "c": {"cbId": "old"},
+    }
+    # One modifier adds the attributes, one sets all values
+    attribute_modifier, value_modifier = scene.applied
+    assert [node.name for node, _ in attribute_modifier.added] == ["a", "b"]
+    assert not attribute_modifier.values
+    assert not value_modifier.added
+    assert len(value_modifier.values) == 2
+    assert scene.undo_chunks == ["open", "close"]
+
+
+def test_skips_existing_ids_without_overwrite(scene):
+    scene.nodes.update({"a": {"cbId": "old_a"}, "b": {"cbId": "old_b"}})
+
+    assert lib.set_ids([("a", "id_a"), ("b", "id_b")]) == 0
+    assert scene.nodes == {"a": {"cbId": "old_a"}, "b": {"cbId": "old_b"}}
+    assert scene.applied == []
+    assert scene.undo_chunks == []
+
+
+def test_overwrite_only_sets_values(scene):
+    scene.nodes.update({"a": {"cbId": "old_a"}, "b": {}})
+
+    assert lib.set_ids({"a": "id_a", "b": "id_b"}, overwrite=True) == 2
+    assert scene.nodes == {"a": {"cbId": "id_a"}, "b": {"cbId": "id_b"}}
+    assert len(scene.applied) == 2
+
+    scene.applied.clear()
+    assert lib.set_ids({"a": "new_a"}, overwrite=True) == 1
+    # No attributes to add, so only the value modifier is applied
+    value_modifier, = scene.applied
+    assert not value_modifier.added
+    assert scene.nodes["a"] == {"cbId": "new_a"}
+
+
+def test_duplicate_nodes_are_set_once(scene):
+    scene.nodes.update({"a": {}})
+
+    assert lib.set_ids([("a", "first"), ("a", "second")]) == 1
+    assert scene.nodes["a"] == {"cbId": "second"}
+    attribute_modifier, _value_modifier = scene.applied
+    assert len(attribute_modifier.added) == 1
+
+
+def test_set_id_uses_set_ids(scene):
+    scene.nodes.update({"a": {"cbId": "old"}})
+
+    lib.set_id("a", "id_a")
+    assert scene.nodes["a"] == {"cbId": "old"}
+
+    lib.set_id("a", "id_a", overwrite=True)
+    assert scene.nodes["a"] == {"cbId": "id_a"}
+
+
+def test_benchmark_100k_nodes(scene):
+    node_count = 100000
+    node_ids = {}
+    for index in range(node_count):
+        node = "node{}".format(index)
+        # Every other node already has an id to skip
+        scene.nodes[node] = {"cbId": "old"} if index % 2 else {}
+        node_ids[node] = "id{}".format(index)
+
+    start = time.perf_counter()
+    count = lib.set_ids(node_ids)
+    duration = time.perf_counter() - start
+
+    assert count == node_count // 2
+    # Two modifiers no matter the amount of nodes
+    assert len(scene.applied) == 2
+    assert len(scene.applied[0].added) == node_count // 2
+    assert len(scene.applied[1].values) == node_count // 2
+    # The Python overhead per node must stay small, the fake API calls
+    # included this takes well under a second
+    assert duration < 5.0, "set_ids of {} nodes took {:.2f}s".format(
+        node_count, duration)
@@ -0,0 +1,89 @@
+"""Import time budget of `ayon_maya.api`, measured by the startup profiler.
+
+`ayon_maya.api` is imported in a subprocess, so the measurement starts from
+a clean interpreter. Maya and the dependencies that are not installed are
+stubbed with `stubs`, the budget then covers the addon's own modules.
+
+"""
+import os
+import sys
+import json
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CLIENT_DIR = os.path.join(ROOT, "client")
+TESTS_DIR = os.path.join(ROOT, "tests")
+
+# Seconds `import ayon_maya.api` may take, excluding Maya itself
+IMPORT_TIME_BUDGET = 3.0
+PHASE_NAME = "import ayon_maya.api"
+
+# Modules which are only imported when used, see `ayon_maya.api.menu`
+LAZY_MODULES = [
+    "ayon_maya.tools",
+    "ayon_maya.api.lib_rendersettings",
+    "ayon_maya.api.workfile_template_builder",
+    "ayon_core.tools.workfiles.lock_dialog",
+]
+
+SCRIPT = '''
+import sys
+import json
+
+import stubs
+
+stubs.install()
+phase_name, lazy_modules = sys.argv[1], json.loads(sys.argv[2])
+
+from ayon_maya import startup_profiling
+
+startup_profiling.start_profiling()
+with startup_profiling.phase(phase_name):
+    import ayon_maya.api  # noqa: F401
+path = startup_profiling.stop_profiling()
+
+print(json.dumps({
+    "report": path,
+    "lazy_imported": [name for name in lazy_modules if name in sys.modules]
+}))
+'''
+
+
+def _read_phase_time(report_path, name):
+    with open(report_path) as f:
+        for line in f:
+            line = line.strip()
+            if line.startswith(name + " "):
+                return float(line[len(name):].strip().rstrip("s"))
+    raise AssertionError(
+        "Phase '{}' not found in {}".format(name, report_path))
+
+
+def test_import_time_budget(tmp_path):
+    env = os.environ.copy()
+    env["PYTHONPATH"] = os.pathsep.join(
+        path for path in (CLIENT_DIR, TESTS_DIR, env.get("PYTHONPATH"))
+        if path
+    )
+    env["AYON_MAYA_PROFILE_STARTUP_DIR"] = str(tmp_path)
+    process = subprocess.run(
+        [
+            sys.executable, "-c", SCRIPT,
+            PHASE_NAME, json.dumps(LAZY_MODULES)
+        ],
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert process.returncode == 0, process.stderr
+
+    result = json.loads(process.stdout.strip().splitlines()[-1])
+    assert result["lazy_imported"] == []
+
+    import_time = _read_phase_time(result["report"], PHASE_NAME)
+    assert import_time < IMPORT_TIME_BUDGET, (
+        "Importing ayon_maya.api took {:.3f}s, the budget is {:.3f}s. "
+        "See the report: {}".format(
+            import_time, IMPORT_TIME_BUDGET, result["report"])
+    )
@@ -0,0 +1,82 @@
+"""Tests of the helpers of `ValidateRenderExpectedFiles`."""
+import itertools
+
+import pytest
+
+from ayon_maya.plugins.publish.validate_render_expected_files import (
+    ValidateRenderExpectedFiles,
+)
+
+
+def _frames(frame_range):
+    start, end, step = frame_range
+    return set(range(start, end + 1, step))
+
+
+@pytest.mark.parametrize("range_a, range_b, expected", [
+    ((1, 10, 1), (5, 6, 1), True),
+    ((1, 10, 1), (11, 20, 1), False),
+    ((1, 10, 1), (10, 20, 1), True),
+    # Disjoint frames of interleaved ranges
+    ((1, 10, 2), (2, 10, 2), False),
+    ((1, 10, 2), (3, 3, 1), True),
+    ((1, 20, 3), (2, 20, 5), True),
+    ((1, 5, 4), (2, 5, 3), True),
+    ((1, 4, 4), (2, 4, 3), False),
+    # Negative frames
+    ((-10, -1, 3), (-8, 0, 2), True),
+    ((-10, -1, 2), (-9, 0, 2), False),
+])
+def test_frames_overlap(range_a, range_b, expected):
+    assert ValidateRenderExpectedFiles.frames_overlap(
+        range_a, range_b) is expected
+    assert ValidateRenderExpectedFiles.frames_overlap(
+        range_b, range_a) is expected
+
+
+def test_frames_overlap_matches_frame_sets():
+    ranges = [
+        (start, start + length, step)
+        for start, length, step in itertools.product(
+            range(-3, 4), range(0, 13, 4), range(1, 7)
+        )
+    ]
+    for range_a, range_b in itertools.product(ranges, repeat=2):
+        expected = bool(_frames(range_a) & _frames(range_b))
+        assert ValidateRenderExpectedFiles.frames_overlap(
+            range_a, range_b) is expected, (range_a, range_b)
+
+
+@pytest.mark.parametrize("path, frame_start, expected", [
+    ("/out/beauty/shot.1001.exr", 1001, "/out/beauty/shot.####.exr"),
+    ("/out/beauty/shot.0001.exr", 1, "/out/beauty/shot.####.exr"),
+    # Single frames or files not starting at the first frame stay as is
+    ("/out/beauty/shot.1002.exr", 1001, "/out/beauty/shot.1002.exr"),
+    ("/out/beauty/shot.exr", 1001, "/out/beauty/shot.exr"),
+])
+def test_get_file_template(path, frame_start, expected):
+    assert ValidateRenderExpectedFiles.get_file_template(
+        path, frame_start) == expected
+
+
+def test_get_template_errors(monkeypatch):
+    monkeypatch.setattr("platform.system", lambda: "Linux")
+    get_errors = ValidateRenderExpectedFiles.get_template_errors
+
+    assert get_errors("layer", "C:/out/beauty/shot.####.exr") == []
+    assert get_errors("layer", "/out/<RenderPass>/shot.%04d.exr") == [
+        "layer has unresolved token '%04d' in: "
+        "/out/<RenderPass>/shot.%04d.exr",
+        "layer has unresolved token '<RenderPass>' in: "
+        "/out/<RenderPass>/shot.%04d.exr",
+    ]
+    assert get_errors("layer", "/out/shot|1.exr") == [
+        "layer has illegal characters '|' in: /out/shot|1.exr"
+    ]
+    assert get_errors("layer", "/out/shot:1.exr") == []
+
+    monkeypatch.setattr("platform.system", lambda: "Windows")
+    assert get_errors("layer", "C:/out/shot.exr") == []
+    assert get_errors("layer", "C:/out/shot:1.exr") == [
+        "layer has illegal characters ':' in: C:/out/shot:1.exr"
+    ]